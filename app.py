@@ -27,7 +27,7 @@ from typing import Any
 
 from flask import Flask, render_template, jsonify, send_file, Response, request,redirect, url_for, flash, session
 from werkzeug.security import check_password_hash
-from config import VERSION, CHANGELOG, SHARED_OBSERVER_LOCATION_ENABLED
+from config import VERSION, CHANGELOG, SHARED_OBSERVER_LOCATION_ENABLED, DISABLED_MODULES
 from utils.dependencies import check_tool, check_all_dependencies, TOOL_DEPENDENCIES
 from utils.process import cleanup_stale_processes
 from utils.sdr import SDRFactory
@@ -864,7 +864,9 @@ def main() -> None:
     cleanup_manager.start()
 
     # Register blueprints
-    from routes import register_blueprints
+    from routes import is_module_enabled, register_blueprints
+    for module_name in DISABLED_MODULES:
+        app.config[f'ENABLE_{module_name.upper()}'] = False
     register_blueprints(app)
 
     # Update TLE data in background thread (non-blocking)
@@ -880,8 +882,9 @@ def main() -> None:
         except Exception as e:
             print(f"TLE update failed (will use cached data): {e}")
 
-    tle_thread = threading.Thread(target=update_tle_background, daemon=True)
-    tle_thread.start()
+    if is_module_enabled(app, 'satellite'):
+        tle_thread = threading.Thread(target=update_tle_background, daemon=True)
+        tle_thread.start()
 
     # Initialize WebSocket for audio streaming
     try:
@@ -892,12 +895,13 @@ def main() -> None:
         print(f"WebSocket audio disabled (install flask-sock): {e}")
 
     # Initialize KiwiSDR WebSocket audio proxy
-    try:
-        from routes.websdr import init_websdr_audio
-        init_websdr_audio(app)
-        print("KiwiSDR audio proxy enabled")
-    except ImportError as e:
-        print(f"KiwiSDR audio proxy disabled: {e}")
+    if is_module_enabled(app, 'websdr'):
+        try:
+            from routes.websdr import init_websdr_audio
+            init_websdr_audio(app)
+            print("KiwiSDR audio proxy enabled")
+        except ImportError as e:
+            print(f"KiwiSDR audio proxy disabled: {e}")
 
     # Initialize WebSocket for waterfall streaming
     try:
@@ -175,6 +175,9 @@ PORT = _get_env_int('PORT', 5050)
 DEBUG = _get_env_bool('DEBUG', False)
 THREADED = _get_env_bool('THREADED', True)
 
+# Route modules to skip at startup, comma-separated (e.g. "satellite,sstv,dmr")
+DISABLED_MODULES = [name.strip() for name in _get_env('DISABLED_MODULES', '').split(',') if name.strip()]
+
 # Default RTL-SDR settings
 DEFAULT_GAIN = _get_env('DEFAULT_GAIN', '40')
 DEFAULT_DEVICE = _get_env('DEFAULT_DEVICE', '0')
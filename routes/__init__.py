@@ -1,68 +1,59 @@
 # Routes package - registers all blueprints with the Flask app
 
-def register_blueprints(app):
-    """Register all route blueprints with the Flask app."""
-    from .pager import pager_bp
-    from .sensor import sensor_bp
-    from .rtlamr import rtlamr_bp
-    from .wifi import wifi_bp
-    from .wifi_v2 import wifi_v2_bp
-    from .bluetooth import bluetooth_bp
-    from .bluetooth_v2 import bluetooth_v2_bp
-    from .adsb import adsb_bp
-    from .ais import ais_bp
-    from .dsc import dsc_bp
-    from .acars import acars_bp
-    from .aprs import aprs_bp
-    from .satellite import satellite_bp
-    from .gps import gps_bp
-    from .settings import settings_bp
-    from .correlation import correlation_bp
-    from .listening_post import listening_post_bp
-    from .meshtastic import meshtastic_bp
-    from .tscm import tscm_bp, init_tscm_state
-    from .spy_stations import spy_stations_bp
-    from .controller import controller_bp
-    from .offline import offline_bp
-    from .updater import updater_bp
-    from .sstv import sstv_bp
-    from .sstv_general import sstv_general_bp
-    from .dmr import dmr_bp
-    from .websdr import websdr_bp
-    from .alerts import alerts_bp
-    from .recordings import recordings_bp
+import importlib
+
+# (module, blueprint attribute) in registration order. Modules are
+# imported only when enabled, so a disabled mode never loads its dependencies.
+# Disable one with app.config['ENABLE_<MODULE>'] = False before registering.
+_BLUEPRINTS = (
+    ('pager', 'pager_bp'),
+    ('sensor', 'sensor_bp'),
+    ('rtlamr', 'rtlamr_bp'),
+    ('wifi', 'wifi_bp'),
+    ('wifi_v2', 'wifi_v2_bp'),  # New unified WiFi API
+    ('bluetooth', 'bluetooth_bp'),
+    ('bluetooth_v2', 'bluetooth_v2_bp'),  # New unified Bluetooth API
+    ('adsb', 'adsb_bp'),
+    ('ais', 'ais_bp'),
+    ('dsc', 'dsc_bp'),  # VHF DSC maritime distress
+    ('acars', 'acars_bp'),
+    ('aprs', 'aprs_bp'),
+    ('satellite', 'satellite_bp'),
+    ('gps', 'gps_bp'),
+    ('settings', 'settings_bp'),
+    ('correlation', 'correlation_bp'),
+    ('listening_post', 'listening_post_bp'),
+    ('meshtastic', 'meshtastic_bp'),
+    ('tscm', 'tscm_bp'),
+    ('spy_stations', 'spy_stations_bp'),
+    ('controller', 'controller_bp'),  # Remote agent controller
+    ('offline', 'offline_bp'),  # Offline mode settings
+    ('updater', 'updater_bp'),  # GitHub update checking
+    ('sstv', 'sstv_bp'),  # ISS SSTV decoder
+    ('sstv_general', 'sstv_general_bp'),  # General terrestrial SSTV
+    ('dmr', 'dmr_bp'),  # DMR / P25 / Digital Voice
+    ('websdr', 'websdr_bp'),  # HF/Shortwave WebSDR
+    ('alerts', 'alerts_bp'),  # Cross-mode alerts
+    ('recordings', 'recordings_bp'),  # Session recordings
+)
+
 
-    app.register_blueprint(pager_bp)
-    app.register_blueprint(sensor_bp)
-    app.register_blueprint(rtlamr_bp)
-    app.register_blueprint(wifi_bp)
-    app.register_blueprint(wifi_v2_bp)  # New unified WiFi API
-    app.register_blueprint(bluetooth_bp)
-    app.register_blueprint(bluetooth_v2_bp)  # New unified Bluetooth API
-    app.register_blueprint(adsb_bp)
-    app.register_blueprint(ais_bp)
-    app.register_blueprint(dsc_bp)  # VHF DSC maritime distress
-    app.register_blueprint(acars_bp)
-    app.register_blueprint(aprs_bp)
-    app.register_blueprint(satellite_bp)
-    app.register_blueprint(gps_bp)
-    app.register_blueprint(settings_bp)
-    app.register_blueprint(correlation_bp)
-    app.register_blueprint(listening_post_bp)
-    app.register_blueprint(meshtastic_bp)
-    app.register_blueprint(tscm_bp)
-    app.register_blueprint(spy_stations_bp)
-    app.register_blueprint(controller_bp)  # Remote agent controller
-    app.register_blueprint(offline_bp)  # Offline mode settings
-    app.register_blueprint(updater_bp)  # GitHub update checking
-    app.register_blueprint(sstv_bp)  # ISS SSTV decoder
-    app.register_blueprint(sstv_general_bp)  # General terrestrial SSTV
-    app.register_blueprint(dmr_bp)  # DMR / P25 / Digital Voice
-    app.register_blueprint(websdr_bp)  # HF/Shortwave WebSDR
-    app.register_blueprint(alerts_bp)  # Cross-mode alerts
-    app.register_blueprint(recordings_bp)  # Session recordings
+def is_module_enabled(app, module_name):
+    """Check whether a route module is enabled in the app config."""
+    return app.config.get(f'ENABLE_{module_name.upper()}', True)
+
+
+def register_blueprints(app):
+    """Register all enabled route blueprints with the Flask app."""
+    for module_name, blueprint_name in _BLUEPRINTS:
+        if not is_module_enabled(app, module_name):
+            continue
+        module = importlib.import_module(f'.{module_name}', __name__)
+        app.register_blueprint(getattr(module, blueprint_name))
 
     # Initialize TSCM state with queue and lock from app
-    import app as app_module
-    if hasattr(app_module, 'tscm_queue') and hasattr(app_module, 'tscm_lock'):
-        init_tscm_state(app_module.tscm_queue, app_module.tscm_lock)
+    if is_module_enabled(app, 'tscm'):
+        from .tscm import init_tscm_state
+        import app as app_module
+        if hasattr(app_module, 'tscm_queue') and hasattr(app_module, 'tscm_lock'):
+            init_tscm_state(app_module.tscm_queue, app_module.tscm_lock)
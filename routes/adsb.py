@@ -59,7 +59,7 @@ from utils.constants import (
     DUMP1090_START_WAIT,
 )
 from utils import aircraft_db
-from utils.adsb_history import adsb_history_writer, adsb_snapshot_writer, _ensure_adsb_schema
+from utils.adsb_history import adsb_writer, _ensure_adsb_schema
 
 adsb_bp = Blueprint('adsb', __name__, url_prefix='/adsb')
 
@@ -144,7 +144,6 @@ def _build_history_record(
     raw_line: str,
 ) -> dict[str, Any]:
     return {
-        'received_at': datetime.now(timezone.utc),
         'msg_time': msg_time,
         'logged_time': logged_time,
         'icao': icao,
@@ -322,8 +321,7 @@ def parse_sbs_stream(service_addr):
     """Parse SBS format data from dump1090 SBS port."""
     global adsb_using_service, adsb_connected, adsb_messages_received, adsb_last_message_time, adsb_bytes_received, adsb_lines_received, _sbs_error_logged
 
-    adsb_history_writer.start()
-    adsb_snapshot_writer.start()
+    adsb_writer.start()
 
     host, port = service_addr.split(':')
     port = int(port)
@@ -390,7 +388,7 @@ def parse_sbs_stream(service_addr):
                             service_addr=service_addr,
                             raw_line=line,
                         )
-                        adsb_history_writer.enqueue(history_record)
+                        adsb_writer.enqueue_message(history_record)
 
                         aircraft = app_module.adsb_aircraft.get(icao) or {'icao': icao}
 
@@ -470,8 +468,7 @@ def parse_sbs_stream(service_addr):
                                         'type': 'aircraft',
                                         **snapshot
                                     })
-                                    adsb_snapshot_writer.enqueue({
-                                        'captured_at': datetime.now(timezone.utc),
+                                    adsb_writer.enqueue_snapshot({
                                         'icao': update_icao,
                                         'callsign': snapshot.get('callsign'),
                                         'registration': snapshot.get('registration'),
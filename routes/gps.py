@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import queue
+import threading
 import time
-from typing import Generator
+from typing import Generator, Optional
 
 from flask import Blueprint, jsonify, request, Response
 
 from utils.logging import get_logger
-from utils.sse import format_sse
+from utils.sse import clear_queue, drain_queue, format_sse
 from utils.gps import (
     get_gps_reader,
     start_gpsd,
@@ -18,27 +20,91 @@ from utils.gps import (
     GPSPosition,
 )
 
+# orjson is optional - faster encoding of SSE position frames
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = get_logger('intercept.gps')
 
 gps_bp = Blueprint('gps', __name__, url_prefix='/gps')
 
-# Queue for SSE position updates
+# Queue for SSE position updates; each item is a list of position dicts
 _gps_queue: queue.Queue = queue.Queue(maxsize=100)
 
+# Positions reported within this window are queued together as one batch;
+# a timer flushes whatever is still pending once the window closes
+_BATCH_WINDOW = 0.05
+_pending_positions: list[dict] = []
+_pending_lock = threading.Lock()
+_last_batch_time = 0.0
+_flush_timer: Optional[threading.Timer] = None
 
-def _position_callback(position: GPSPosition) -> None:
-    """Callback to queue position updates for SSE stream."""
+# Pre-encoded SSE framing; position fields are spliced in after "type"
+_POSITION_PREFIX = b'data: {"type":"position",'
+_FRAME_SUFFIX = b'}\n\n'
+_KEEPALIVE_FRAME = format_sse({'type': 'keepalive'}).encode('utf-8')
+
+
+def _encode_position(position: dict) -> bytes:
+    """Encode a position dict as a complete SSE frame."""
+    if orjson is not None:
+        body = orjson.dumps(position)
+    else:
+        body = json.dumps(position, separators=(',', ':')).encode('utf-8')
+    return _POSITION_PREFIX + body[1:-1] + _FRAME_SUFFIX
+
+
+def _queue_batch(batch: list[dict]) -> None:
+    """Put a batch of positions on the SSE queue, dropping the oldest if full."""
     try:
-        _gps_queue.put_nowait(position.to_dict())
+        _gps_queue.put_nowait(batch)
     except queue.Full:
         # Discard oldest if queue is full
         try:
             _gps_queue.get_nowait()
-            _gps_queue.put_nowait(position.to_dict())
+            _gps_queue.put_nowait(batch)
         except queue.Empty:
             pass
 
 
+def _flush_pending() -> None:
+    """Queue positions held back by the batch window."""
+    global _pending_positions, _last_batch_time, _flush_timer
+
+    with _pending_lock:
+        _flush_timer = None
+        if not _pending_positions:
+            return
+        batch, _pending_positions = _pending_positions, []
+        _last_batch_time = time.monotonic()
+
+    _queue_batch(batch)
+
+
+def _position_callback(position: GPSPosition) -> None:
+    """Callback to queue position updates for SSE stream."""
+    global _pending_positions, _last_batch_time, _flush_timer
+
+    now = time.monotonic()
+    with _pending_lock:
+        _pending_positions.append(position.to_dict())
+        elapsed = now - _last_batch_time
+        if elapsed < _BATCH_WINDOW:
+            # Make sure the held position goes out when the window closes,
+            # even if gpsd reports nothing further
+            if _flush_timer is None:
+                _flush_timer = threading.Timer(_BATCH_WINDOW - elapsed, _flush_pending)
+                _flush_timer.daemon = True
+                _flush_timer.start()
+            return
+        batch, _pending_positions = _pending_positions, []
+        _last_batch_time = now
+
+    _queue_batch(batch)
+
+
 @gps_bp.route('/auto-connect', methods=['POST'])
 def auto_connect_gps():
     """
@@ -77,11 +143,9 @@ def auto_connect_gps():
         })
 
     # Clear the queue
-    while not _gps_queue.empty():
-        try:
-            _gps_queue.get_nowait()
-        except queue.Empty:
-            break
+    clear_queue(_gps_queue)
+    with _pending_lock:
+        _pending_positions.clear()
 
     # Start the gpsd client
     success = start_gpsd(host, port, callback=_position_callback)
@@ -164,20 +228,28 @@ def get_position():
 @gps_bp.route('/stream')
 def stream_gps():
     """SSE stream of GPS position updates."""
-    def generate() -> Generator[str, None, None]:
-        last_keepalive = time.time()
+    def generate() -> Generator[bytes, None, None]:
+        # Keepalive is a pure idle timer, so the clock is only read when
+        # the queue wait times out
+        last_keepalive = time.monotonic()
         keepalive_interval = 30.0
 
         while True:
             try:
-                position = _gps_queue.get(timeout=1)
-                last_keepalive = time.time()
-                yield format_sse({'type': 'position', **position})
+                batch = _gps_queue.get(timeout=keepalive_interval)
             except queue.Empty:
-                now = time.time()
+                now = time.monotonic()
                 if now - last_keepalive >= keepalive_interval:
-                    yield format_sse({'type': 'keepalive'})
+                    yield _KEEPALIVE_FRAME
                     last_keepalive = now
+                continue
+
+            # Drain any burst that queued up behind the first fix so it
+            # goes out as a single write instead of one yield per position
+            frames = [_encode_position(position) for position in batch]
+            for batch in drain_queue(_gps_queue):
+                frames.extend(_encode_position(position) for position in batch)
+            yield b''.join(frames)
 
     response = Response(generate(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache'
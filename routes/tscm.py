@@ -2045,7 +2045,7 @@ def _run_sweep(
 
             # Finalize identity engine and get MAC-randomization resistant clusters
             identity_engine.finalize_all_sessions()
-            identity_summary = identity_engine.get_summary()
+            identity_summary = identity_engine.get_summary(include_clusters=False)
             identity_clusters = [c.to_dict() for c in identity_engine.get_clusters()]
 
             if verbose_results:
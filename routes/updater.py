@@ -91,7 +91,7 @@ def do_update() -> Response:
             error = result.get('error', '')
             if error == 'local_changes':
                 return jsonify(result), 409  # Conflict
-            elif error == 'merge_conflict':
+            elif error == 'non_fast_forward':
                 return jsonify(result), 409
             elif result.get('manual_update'):
                 return jsonify(result), 400
@@ -150,30 +150,22 @@ def restart_app() -> Response:
     2. Cleans up global state
     3. Replaces the current process with a fresh instance
 
-    The response may not be received by the client since the process
-    is replaced immediately. Clients should poll /health until the
-    server responds again.
+    The restart runs once the response has been sent. Clients should
+    poll /health until the server responds again.
 
     Returns:
-        JSON with restart status (may not be delivered)
+        JSON with restart status
     """
-    import threading
-
     logger.info("Restart requested via API")
 
-    # Send response before restarting
-    # Use a short delay to allow the response to be sent
-    def delayed_restart():
-        import time
-        time.sleep(0.5)  # Allow response to be sent
-        restart_application()
-
-    # Start restart in a background thread so we can return a response
-    restart_thread = threading.Thread(target=delayed_restart, daemon=False)
-    restart_thread.start()
-
-    return jsonify({
+    response = jsonify({
         'success': True,
         'message': 'Application is restarting. Please wait...',
         'action': 'restart'
     })
+
+    # The WSGI server closes the response once its body has been written,
+    # so the restart starts as soon as the client has the reply
+    response.call_on_close(restart_application)
+
+    return response
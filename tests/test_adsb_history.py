@@ -4,13 +4,13 @@ import queue
 import threading
 import time
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 
-class TestAdsbHistoryWriterUnit:
-    """Unit tests for AdsbHistoryWriter (no database)."""
+class TestAdsbWriterUnit:
+    """Unit tests for AdsbWriter message records (no database)."""
 
     @pytest.fixture
     def mock_config(self):
@@ -48,9 +48,9 @@ class TestAdsbHistoryWriterUnit:
 
     def test_writer_disabled_by_default(self, mock_config):
         """Test writer does nothing when disabled."""
-        from utils.adsb_history import AdsbHistoryWriter
+        from utils.adsb_history import AdsbWriter
 
-        writer = AdsbHistoryWriter()
+        writer = AdsbWriter()
         writer.enabled = False
 
         # Should not start thread
@@ -58,57 +58,73 @@ class TestAdsbHistoryWriterUnit:
         assert writer._thread is None
 
         # Should not queue records
-        writer.enqueue({'icao': 'ABC123'})
+        writer.enqueue_message({'icao': 'ABC123'})
         assert writer._queue.empty()
 
     def test_enqueue_adds_received_at(self, mock_config_enabled):
         """Test enqueue adds received_at timestamp if missing."""
-        from utils.adsb_history import AdsbHistoryWriter
+        from utils.adsb_history import AdsbWriter
 
-        writer = AdsbHistoryWriter()
+        writer = AdsbWriter()
         writer.enabled = True
 
         record = {'icao': 'ABC123'}
-        writer.enqueue(record)
+        writer.enqueue_message(record)
 
-        # Record should have received_at added
+        # Record should have received_at added as an epoch timestamp
         assert 'received_at' in record
-        assert isinstance(record['received_at'], datetime)
+        assert isinstance(record['received_at'], float)
+        assert abs(record['received_at'] - time.time()) < 5
 
     def test_enqueue_preserves_existing_received_at(self, mock_config_enabled):
         """Test enqueue preserves existing received_at."""
-        from utils.adsb_history import AdsbHistoryWriter
+        from utils.adsb_history import AdsbWriter
 
-        writer = AdsbHistoryWriter()
+        writer = AdsbWriter()
         writer.enabled = True
 
         original_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
         record = {'icao': 'ABC123', 'received_at': original_time}
-        writer.enqueue(record)
+        writer.enqueue_message(record)
 
         assert record['received_at'] == original_time
 
     def test_enqueue_drops_when_queue_full(self, mock_config_enabled):
         """Test enqueue drops records when queue is full."""
-        from utils.adsb_history import AdsbHistoryWriter
+        from utils.adsb_history import AdsbWriter
 
-        writer = AdsbHistoryWriter()
+        writer = AdsbWriter()
         writer.enabled = True
         writer._queue = queue.Queue(maxsize=2)
 
         # Fill the queue
-        writer.enqueue({'icao': 'A'})
-        writer.enqueue({'icao': 'B'})
+        writer.enqueue_message({'icao': 'A'})
+        writer.enqueue_message({'icao': 'B'})
 
         # This should be dropped
-        writer.enqueue({'icao': 'C'})
+        writer.enqueue_message({'icao': 'C'})
 
         assert writer._dropped == 1
         assert writer._queue.qsize() == 2
 
+    def test_enqueue_queues_column_ordered_row(self, mock_config_enabled):
+        """Test records are queued as tuples in _MESSAGE_FIELDS order."""
+        from utils.adsb_history import _MESSAGE_FIELDS, AdsbWriter
+
+        writer = AdsbWriter()
+        writer.enabled = True
+        writer.enqueue_message({'icao': 'ABC123', 'altitude': 1000})
+
+        kind, row = writer._queue.get_nowait()
+        assert kind == 'message'
+        assert len(row) == len(_MESSAGE_FIELDS)
+        assert row[_MESSAGE_FIELDS.index('icao')] == 'ABC123'
+        assert row[_MESSAGE_FIELDS.index('altitude')] == 1000
+        assert isinstance(row[_MESSAGE_FIELDS.index('received_at')], float)
 
-class TestAdsbSnapshotWriterUnit:
-    """Unit tests for AdsbSnapshotWriter (no database)."""
+
+class TestAdsbWriterSnapshotUnit:
+    """Unit tests for AdsbWriter snapshot records (no database)."""
 
     @pytest.fixture
     def mock_config_enabled(self):
@@ -129,16 +145,16 @@ class TestAdsbSnapshotWriterUnit:
 
     def test_snapshot_enqueue_adds_captured_at(self, mock_config_enabled):
         """Test enqueue adds captured_at timestamp if missing."""
-        from utils.adsb_history import AdsbSnapshotWriter
+        from utils.adsb_history import AdsbWriter
 
-        writer = AdsbSnapshotWriter()
+        writer = AdsbWriter()
         writer.enabled = True
 
         record = {'icao': 'ABC123'}
-        writer.enqueue(record)
+        writer.enqueue_snapshot(record)
 
         assert 'captured_at' in record
-        assert isinstance(record['captured_at'], datetime)
+        assert isinstance(record['captured_at'], float)
 
 
 class TestMakeDsn:
@@ -179,8 +195,11 @@ class TestEnsureAdsbSchema:
 
         _ensure_adsb_schema(mock_conn)
 
-        # Should execute CREATE TABLE statements
-        assert mock_cursor.execute.call_count >= 3  # 3 tables + indexes
+        # All DDL goes out in a single round-trip
+        mock_cursor.execute.assert_called_once()
+        sql = mock_cursor.execute.call_args[0][0]
+        for table in ('adsb_messages', 'adsb_snapshots', 'adsb_sessions'):
+            assert f'CREATE TABLE IF NOT EXISTS {table}' in sql
 
         # Should commit
         mock_conn.commit.assert_called_once()
@@ -232,6 +251,180 @@ class TestMessageFields:
             assert field in _SNAPSHOT_FIELDS
 
 
+class TestProjectRow:
+    """Tests for projecting records onto column tuples."""
+
+    def test_complete_and_partial_records(self):
+        """Test full records and records with missing keys project in field order."""
+        from utils.adsb_history import _MESSAGE_FIELDS, _MESSAGE_GETTER, _project_row
+
+        full = {field: field for field in _MESSAGE_FIELDS}
+        partial = {'icao': 'ABC123', 'altitude': 1000}
+
+        rows = [_project_row(record, _MESSAGE_GETTER, _MESSAGE_FIELDS) for record in (full, partial)]
+
+        assert rows[0] == tuple(_MESSAGE_FIELDS)
+        assert rows[1][_MESSAGE_FIELDS.index('icao')] == 'ABC123'
+        assert rows[1][_MESSAGE_FIELDS.index('altitude')] == 1000
+        assert rows[1][_MESSAGE_FIELDS.index('callsign')] is None
+
+
+class TestBinaryCopy:
+    """Tests for binary COPY encoding."""
+
+    def test_pack_binary_framing(self):
+        """Test stream has COPY header, field count and trailer."""
+        from utils.adsb_history import _pack_binary
+
+        data = _pack_binary([(1, None)], ('integer', 'text')).getvalue()
+
+        assert data.startswith(b'PGCOPY\n\xff\r\n\x00')
+        assert data.endswith(b'\xff\xff')
+        body = data[19:-2]
+        assert body == b'\x00\x02' + b'\x00\x00\x00\x04\x00\x00\x00\x01' + b'\xff\xff\xff\xff'
+
+    def test_pack_binary_timestamptz(self):
+        """Test timestamps are microseconds since the PostgreSQL epoch."""
+        from utils.adsb_history import _pack_binary
+
+        ts = datetime(2000, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+        data = _pack_binary([(ts,)], ('timestamptz',)).getvalue()
+
+        assert data[19:-2] == b'\x00\x01' + b'\x00\x00\x00\x08' + (1_000_000).to_bytes(8, 'big')
+
+    def test_pack_binary_epoch_float_matches_datetime(self):
+        """Test epoch floats from enqueue encode like the equivalent datetime."""
+        from utils.adsb_history import _pack_binary
+
+        ts = datetime(2025, 6, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+        as_float = _pack_binary([(ts.timestamp(),)], ('timestamptz',)).getvalue()
+        as_datetime = _pack_binary([(ts,)], ('timestamptz',)).getvalue()
+
+        assert as_float == as_datetime
+
+    def test_copy_failure_falls_back_to_insert(self):
+        """Test rows go through the prepared INSERT when COPY is rejected."""
+        from utils import adsb_history
+
+        mock_conn = MagicMock()
+        mock_conn.closed = 0
+        mock_cursor = MagicMock()
+        mock_cursor.copy_expert.side_effect = Exception('COPY not permitted')
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        message_row = (0.0,) + tuple(None for _ in adsb_history._MESSAGE_FIELDS[1:])
+        prepared = set()
+        with patch.object(adsb_history, 'execute_batch') as mock_execute_batch:
+            for _ in range(2):
+                adsb_history._copy_or_insert(
+                    mock_conn,
+                    adsb_history._MESSAGE_COPY_SQL,
+                    adsb_history._MESSAGE_TYPES,
+                    adsb_history._MESSAGE_PREPARE_SQL,
+                    adsb_history._MESSAGE_EXECUTE_SQL,
+                    [message_row],
+                    adsb_history._adapt_timestamp,
+                    prepared,
+                )
+
+        # PREPARE is sent once per connection, EXECUTE on every flush
+        mock_cursor.execute.assert_called_once_with(adsb_history._MESSAGE_PREPARE_SQL)
+        assert mock_execute_batch.call_count == 2
+        assert mock_execute_batch.call_args[0][1] == adsb_history._MESSAGE_EXECUTE_SQL
+        inserted = mock_execute_batch.call_args[0][2]
+        assert inserted[0][0] == datetime(1970, 1, 1, tzinfo=timezone.utc)
+        assert inserted[0][1:] == message_row[1:]
+
+
+class TestAdsbWriterFlush:
+    """Tests for flushing batches (mocked database)."""
+
+    def test_failed_snapshot_write_keeps_only_snapshots(self):
+        """Test messages already written are not resent after a snapshot failure."""
+        from utils import adsb_history
+
+        writer = adsb_history.AdsbWriter()
+        writer._conn = MagicMock()
+        messages = [('message-row',)]
+        snapshots = [('snapshot-row',)]
+
+        def fake_write(conn, copy_sql, *args):
+            if copy_sql == adsb_history._SNAPSHOT_COPY_SQL:
+                raise Exception('connection lost')
+
+        with patch.object(adsb_history, '_copy_or_insert', side_effect=fake_write), \
+                patch.object(adsb_history.time, 'sleep'):
+            assert writer._flush(messages, snapshots) is False
+
+        assert messages == []
+        assert snapshots == [('snapshot-row',)]
+        assert writer._conn is None
+
+
+class TestAdsbWriterConnection:
+    """Tests for connection setup (mocked database)."""
+
+    def test_schema_created_once_across_reconnects(self):
+        """Test schema DDL only runs on the first connection."""
+        from utils import adsb_history
+
+        writer = adsb_history.AdsbWriter()
+        with patch.object(adsb_history.AdsbWriter, '_schema_ready', False), \
+                patch.object(adsb_history, 'psycopg2') as mock_psycopg2, \
+                patch.object(adsb_history, '_ensure_adsb_schema') as mock_schema:
+            mock_psycopg2.connect.return_value = MagicMock()
+            assert writer._ensure_connection() is not None
+            writer._conn = None  # simulate a dropped connection
+            assert writer._ensure_connection() is not None
+
+        assert mock_psycopg2.connect.call_count == 2
+        mock_schema.assert_called_once()
+
+
+class TestAdsbWriterBatchTarget:
+    """Tests for queue-depth driven batch sizing."""
+
+    @pytest.fixture
+    def writer(self):
+        with patch.multiple(
+            'utils.adsb_history',
+            ADSB_HISTORY_ENABLED=True,
+            ADSB_HISTORY_BATCH_SIZE=10,
+            ADSB_HISTORY_QUEUE_SIZE=100,
+        ):
+            from utils.adsb_history import AdsbWriter
+
+            writer = AdsbWriter()
+            writer.enabled = True
+            yield writer
+
+    def _fill(self, writer, n):
+        for i in range(n):
+            writer.enqueue_message({'icao': f'T{i}'})
+
+    def test_grows_when_queue_backs_up(self, writer):
+        """Test target doubles while the queue is over 70% full, capped at its size."""
+        self._fill(writer, 80)
+        for _ in range(5):
+            writer._adjust_batch_target()
+        assert writer._target_batch == 100
+
+    def test_shrinks_back_to_configured_size(self, writer):
+        """Test target halves once the queue drains, but not below the configured size."""
+        writer._target_batch = 80
+        for _ in range(5):
+            writer._adjust_batch_target()
+        assert writer._target_batch == 10
+
+    def test_holds_steady_at_moderate_depth(self, writer):
+        """Test target is unchanged between the low and high watermarks."""
+        writer._target_batch = 40
+        self._fill(writer, 50)
+        writer._adjust_batch_target()
+        assert writer._target_batch == 40
+
+
 class TestWriterThreadSafety:
     """Tests for thread safety of writers."""
 
@@ -249,16 +442,16 @@ class TestWriterThreadSafety:
             ADSB_DB_USER='test',
             ADSB_DB_PASSWORD='test',
         ):
-            from utils.adsb_history import AdsbHistoryWriter
+            from utils.adsb_history import AdsbWriter
 
-            writer = AdsbHistoryWriter()
+            writer = AdsbWriter()
             writer.enabled = True
             errors = []
 
             def enqueue_many(n):
                 try:
                     for i in range(n):
-                        writer.enqueue({'icao': f'TEST{i}', 'altitude': i * 100})
+                        writer.enqueue_message({'icao': f'TEST{i}', 'altitude': i * 100})
                 except Exception as e:
                     errors.append(e)
 
@@ -1,7 +1,5 @@
 """Tests for main application routes."""
 
-import pytest
-
 
 def test_index_page(client):
     """Test that index page loads."""
@@ -37,3 +35,19 @@ def test_adsb_dashboard(client):
     """Test ADS-B dashboard loads."""
     response = client.get('/adsb/dashboard')
     assert response.status_code == 200
+
+
+def test_register_blueprints_skips_disabled_modules():
+    """Test modules disabled in config are not registered."""
+    from flask import Flask
+
+    from routes import register_blueprints
+
+    app = Flask(__name__)
+    app.config['ENABLE_SATELLITE'] = False
+    app.config['ENABLE_SSTV'] = False
+    register_blueprints(app)
+
+    assert 'satellite' not in app.blueprints
+    assert 'sstv' not in app.blueprints
+    assert 'pager' in app.blueprints
@@ -0,0 +1,260 @@
+"""
+Unit tests for the BlueZ DBus scanner.
+
+Tests Device1 property decoding and the property cache without a bus.
+"""
+
+import pytest
+
+from utils.bluetooth.constants import ADDRESS_TYPE_PUBLIC, ADDRESS_TYPE_RANDOM
+from utils.bluetooth.dbus_scanner import DBusScanner, _decode_class_of_device
+
+DEVICE_PATH = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+
+
+@pytest.fixture
+def scanner():
+    """Scanner that collects observations instead of talking to BlueZ."""
+    observations = []
+    scanner = DBusScanner(adapter_path='/org/bluez/hci0', on_observation=observations.append)
+    scanner.observations = observations
+    return scanner
+
+
+def process(scanner, props):
+    """Process one property set and deliver it immediately."""
+    scanner._process_device_properties(DEVICE_PATH, props)
+    scanner._flush_pending()
+
+
+def full_props(**overrides):
+    """Device1 properties as delivered after variant unpacking."""
+    props = {
+        'Address': 'aa:bb:cc:dd:ee:ff',
+        'AddressType': 'random',
+        'Name': 'Tag',
+        'Alias': 'Tag',
+        'RSSI': -50,
+        'TxPower': 4,
+        'ManufacturerData': {76: b'\x02\x15ab'},
+        'UUIDs': ['0000180f-0000-1000-8000-00805f9b34fb'],
+        'ServiceData': {'0000feaa-0000-1000-8000-00805f9b34fb': b'\x10\x00'},
+        'Class': 0x240404,
+        'Appearance': 961,
+        'Connected': False,
+        'Paired': True,
+    }
+    props.update(overrides)
+    return props
+
+
+class TestProcessDeviceProperties:
+    """Tests for converting Device1 properties to BTObservation."""
+
+    def test_full_decode(self, scanner):
+        """All known properties should map onto the observation."""
+        process(scanner, full_props())
+
+        obs = scanner.observations[0]
+        assert obs.address == 'AA:BB:CC:DD:EE:FF'
+        assert obs.address_type == ADDRESS_TYPE_RANDOM
+        assert obs.name == 'Tag'
+        assert obs.rssi == -50
+        assert obs.tx_power == 4
+        assert obs.manufacturer_id == 76
+        assert obs.manufacturer_data == b'\x02\x15ab'
+        assert obs.service_uuids == ['0000180f-0000-1000-8000-00805f9b34fb']
+        assert obs.service_data == {'0000feaa-0000-1000-8000-00805f9b34fb': b'\x10\x00'}
+        assert obs.class_of_device == 0x240404
+        assert obs.major_class == 'Audio/Video'
+        assert obs.minor_class == 'Wearable Headset'
+        assert obs.appearance == 961
+        assert obs.is_paired is True
+        assert obs.is_connected is False
+        assert obs.is_connectable is True
+        assert obs.adapter_id == '/org/bluez/hci0'
+
+    def test_minimal_props_use_defaults(self, scanner):
+        """Missing properties should fall back to BTObservation defaults."""
+        process(scanner, {'Address': '11:22:33:44:55:66'})
+
+        obs = scanner.observations[0]
+        assert obs.address_type == ADDRESS_TYPE_PUBLIC
+        assert obs.name is None
+        assert obs.rssi is None
+        assert obs.service_uuids == []
+        assert obs.service_data == {}
+
+    def test_missing_address_is_ignored(self, scanner):
+        """Properties without an address should not produce an observation."""
+        process(scanner, {'RSSI': -40})
+        assert scanner.observations == []
+
+    def test_alias_used_when_name_missing(self, scanner):
+        """Alias should stand in for Name unless it is just the address."""
+        process(scanner, {'Address': 'AA:BB', 'Alias': 'Speaker'})
+        process(scanner, {'Address': 'AA:BB', 'Alias': 'AA:BB'})
+
+        assert scanner.observations[0].name == 'Speaker'
+        assert scanner.observations[1].name is None
+
+    def test_hex_string_payloads(self, scanner):
+        """Payloads delivered as hex strings should be decoded to bytes."""
+        process(scanner, full_props(
+            ManufacturerData={6: '0102'},
+            ServiceData={'fe9f': 'ff'},
+        ))
+
+        obs = scanner.observations[0]
+        assert obs.manufacturer_data == b'\x01\x02'
+        assert obs.service_data == {'fe9f': b'\xff'}
+
+
+    def test_malformed_service_data_entry_skipped(self, scanner):
+        """A bad service data payload should not drop the other entries."""
+        process(scanner, full_props(ServiceData={'fe9f': 'zz', 'feaa': b'\x01'}))
+
+        assert scanner.observations[0].service_data == {'feaa': b'\x01'}
+
+
+class TestRssiThreshold:
+    """Tests for dropping out-of-range devices before decoding."""
+
+    def test_below_threshold_dropped(self, scanner):
+        """Devices weaker than the threshold should not produce observations."""
+        scanner._rssi_threshold = -80
+        process(scanner, full_props(RSSI=-90))
+        process(scanner, full_props(RSSI=-70))
+
+        assert [obs.rssi for obs in scanner.observations] == [-70]
+
+    def test_delta_after_skip_decodes_in_full(self, scanner):
+        """Changes made while out of range should not be lost."""
+        pytest.importorskip('dbus_fast')
+        scanner._started = True
+        scanner._rssi_threshold = -80
+        scanner._on_interfaces_added(DEVICE_PATH, {'org.bluez.Device1': full_props()})
+        scanner._on_properties_changed(
+            'org.bluez.Device1', {'RSSI': -95, 'ManufacturerData': {76: b'\x01'}}, [], path=DEVICE_PATH
+        )
+        scanner._on_properties_changed('org.bluez.Device1', {'RSSI': -60}, [], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        obs = scanner.observations[-1]
+        assert obs.rssi == -60
+        assert obs.manufacturer_data == b'\x01'
+
+
+class TestCoalescing:
+    """Tests for coalescing observations before delivery."""
+
+    def test_burst_collapses_to_latest(self, scanner):
+        """Several updates for one address should deliver only the latest."""
+        for rssi in (-40, -45, -60):
+            scanner._process_device_properties(DEVICE_PATH, full_props(RSSI=rssi))
+        scanner._flush_pending()
+
+        assert [obs.rssi for obs in scanner.observations] == [-60]
+
+    def test_addresses_delivered_separately(self, scanner):
+        """Each pending address should produce its own observation."""
+        scanner._process_device_properties(DEVICE_PATH, full_props())
+        scanner._process_device_properties('/org/bluez/hci0/dev_11', full_props(Address='11:22:33:44:55:66'))
+        scanner._flush_pending()
+
+        assert {obs.address for obs in scanner.observations} == {
+            'AA:BB:CC:DD:EE:FF', '11:22:33:44:55:66',
+        }
+
+
+class TestClassOfDevice:
+    """Tests for Class of Device decoding."""
+
+    @pytest.mark.parametrize('cod,expected', [
+        (0x5A020C, ('Phone', 'Smartphone')),
+        (0x240404, ('Audio/Video', 'Wearable Headset')),
+        (0x000504, ('Peripheral', 'Keyboard')),
+        (0x001E00, (None, None)),
+    ])
+    def test_decode(self, cod, expected):
+        """Major and minor names should come from the class bits only."""
+        assert _decode_class_of_device(cod) == expected
+
+
+class TestPropertyCache:
+    """Tests for merging PropertiesChanged deltas into cached properties."""
+
+    def test_delta_merged_into_cache(self, scanner):
+        """An RSSI-only delta should produce a full observation from the cache."""
+        pytest.importorskip('dbus_fast')
+        scanner._started = True
+        scanner._on_interfaces_added(DEVICE_PATH, {'org.bluez.Device1': full_props()})
+        scanner._flush_pending()
+        scanner._on_properties_changed('org.bluez.Device1', {'RSSI': -70}, [], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        obs = scanner.observations[-1]
+        assert obs.rssi == -70
+        assert obs.name == 'Tag'
+        assert obs.manufacturer_data == b'\x02\x15ab'
+
+    def test_delta_reuses_decoded_payloads(self, scanner):
+        """A delta should only re-decode changed keys and reuse the rest."""
+        pytest.importorskip('dbus_fast')
+        scanner._started = True
+        scanner._on_interfaces_added(DEVICE_PATH, {'org.bluez.Device1': full_props()})
+        scanner._flush_pending()
+        scanner._on_properties_changed('org.bluez.Device1', {'RSSI': -70}, [], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        first, second = scanner.observations
+        assert second.service_uuids is first.service_uuids
+        assert second.service_data is first.service_data
+        assert second.rssi == -70
+
+    def test_invalidated_properties_dropped(self, scanner):
+        """Invalidated properties should be removed from the cache."""
+        pytest.importorskip('dbus_fast')
+        scanner._started = True
+        scanner._on_interfaces_added(DEVICE_PATH, {'org.bluez.Device1': full_props()})
+        scanner._flush_pending()
+        scanner._on_properties_changed('org.bluez.Device1', {}, ['RSSI'], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        assert scanner.observations[-1].rssi is None
+
+    def test_delta_for_unannounced_device_skipped(self, scanner):
+        """A delta for a device with no cached address should not be decoded."""
+        pytest.importorskip('dbus_fast')
+        scanner._started = True
+        scanner._on_properties_changed('org.bluez.Device1', {'RSSI': -70}, [], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        assert scanner.observations == []
+        assert DEVICE_PATH not in scanner._decoded
+
+    def test_interfaces_removed_evicts(self, scanner):
+        """Removing Device1 should drop the cached properties."""
+        scanner._on_interfaces_added(DEVICE_PATH, {'org.bluez.Device1': full_props()})
+        scanner._on_interfaces_removed(DEVICE_PATH, ['org.bluez.Device1'])
+
+        assert DEVICE_PATH not in scanner._prop_cache
+
+    def test_other_adapter_paths_ignored(self, scanner):
+        """PropertiesChanged for another adapter's devices should be ignored."""
+        scanner._started = True
+        other = '/org/bluez/hci1/dev_AA_BB_CC_DD_EE_FF'
+        scanner._on_properties_changed('org.bluez.Device1', full_props(), [], path=other)
+        scanner._flush_pending()
+
+        assert scanner.observations == []
+        assert other not in scanner._prop_cache
+
+    def test_other_interfaces_ignored(self, scanner):
+        """PropertiesChanged for other interfaces should be ignored."""
+        scanner._started = True
+        scanner._on_properties_changed('org.bluez.Battery1', {'Percentage': 50}, [], path=DEVICE_PATH)
+        scanner._flush_pending()
+
+        assert scanner.observations == []
+        assert DEVICE_PATH not in scanner._prop_cache
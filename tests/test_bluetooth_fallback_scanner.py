@@ -0,0 +1,183 @@
+"""
+Unit tests for the fallback Bluetooth scanners.
+
+Tests the hcitool/bluetoothctl output parsers without spawning tools.
+"""
+
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from utils.bluetooth.constants import ADDRESS_TYPE_PUBLIC, ADDRESS_TYPE_RANDOM
+from utils.bluetooth.fallback_scanner import (
+    BleakScanner,
+    _normalize_address,
+    _parse_bluetoothctl_line,
+    _parse_hcitool_line,
+    _read_lines,
+    _WakePipe,
+)
+
+
+def adv(**overrides):
+    """Stand-in for bleak's AdvertisementData."""
+    data = {
+        'local_name': 'Tag',
+        'rssi': -55,
+        'tx_power': None,
+        'manufacturer_data': {76: b'\x02\x15', 6: b'\x01'},
+        'service_data': {'0000feaa-0000-1000-8000-00805f9b34fb': bytearray(b'\x10')},
+        'service_uuids': ['0000feaa-0000-1000-8000-00805f9b34fb'],
+        'connectable': True,
+    }
+    data.update(overrides)
+    return SimpleNamespace(**data)
+
+
+class TestConvertBleakDevice:
+    """Tests for converting bleak advertisements to BTObservation."""
+
+    def test_conversion(self):
+        """Advertisement fields should map onto the observation."""
+        device = SimpleNamespace(address='c4:11:22:33:44:55', name=None)
+        obs = BleakScanner()._convert_bleak_device(device, adv())
+
+        assert obs.address == 'C4:11:22:33:44:55'
+        assert obs.address_type == ADDRESS_TYPE_RANDOM
+        assert obs.name == 'Tag'
+        assert obs.rssi == -55
+        assert obs.manufacturer_id == 76
+        assert obs.manufacturer_data == b'\x02\x15'
+        assert obs.service_data == {'0000feaa-0000-1000-8000-00805f9b34fb': b'\x10'}
+        assert obs.service_uuids == ['0000feaa-0000-1000-8000-00805f9b34fb']
+        assert obs.is_connectable is True
+
+    def test_hex_string_payloads(self):
+        """Hex string payloads should be decoded to bytes."""
+        device = SimpleNamespace(address='00:11:22:33:44:55', name='Dev')
+        obs = BleakScanner()._convert_bleak_device(device, adv(
+            local_name=None,
+            manufacturer_data={6: '0102'},
+            service_data={'fe9f': 'zz', 'feaa': 'ff'},
+            service_uuids=None,
+        ))
+
+        assert obs.address_type == ADDRESS_TYPE_PUBLIC
+        assert obs.name == 'Dev'
+        assert obs.manufacturer_data == b'\x01\x02'
+        assert obs.service_data == {'feaa': b'\xff'}
+        assert obs.service_uuids == []
+
+
+class TestNormalizeAddress:
+    """Tests for address normalization."""
+
+    def test_uppercases(self):
+        """Lowercase addresses should be uppercased."""
+        assert _normalize_address('aa:bb:cc:dd:ee:ff') == 'AA:BB:CC:DD:EE:FF'
+
+    def test_repeats_share_one_object(self):
+        """Repeated addresses should normalize to the same string object."""
+        first = _normalize_address(''.join(['aa:bb:cc', ':dd:ee:ff']))
+        second = _normalize_address(''.join(['AA:BB:CC', ':DD:EE:FF']))
+        assert first is second
+
+
+class TestParseHcitoolLine:
+    """Tests for parsing hcitool lescan output."""
+
+    @pytest.mark.parametrize('line,expected', [
+        ('AA:BB:CC:DD:EE:FF Tag', ('AA:BB:CC:DD:EE:FF', 'Tag')),
+        ('AA:BB:CC:DD:EE:FF (unknown)', ('AA:BB:CC:DD:EE:FF', '(unknown)')),
+        ('AA:BB:CC:DD:EE:FF', ('AA:BB:CC:DD:EE:FF', None)),
+    ])
+    def test_device_lines(self, line, expected):
+        """Device lines should yield the address and name."""
+        assert _parse_hcitool_line(line) == expected
+
+    @pytest.mark.parametrize('line', ['LE Scan ...', 'AA:BB:CC:DD:EE:', ''])
+    def test_other_lines_ignored(self, line):
+        """Header and truncated lines should be ignored."""
+        assert _parse_hcitool_line(line) is None
+
+
+class TestParseBluetoothctlLine:
+    """Tests for parsing bluetoothctl discovery output."""
+
+    @pytest.mark.parametrize('line,expected', [
+        ('[NEW] Device AA:BB:CC:DD:EE:FF Phone', ('new', 'AA:BB:CC:DD:EE:FF', 'Phone')),
+        ('[NEW] Device AA:BB:CC:DD:EE:FF', ('new', 'AA:BB:CC:DD:EE:FF', '')),
+        ('[CHG] Device AA:BB:CC:DD:EE:FF RSSI: -65', ('rssi', 'AA:BB:CC:DD:EE:FF', -65)),
+        ('[CHG] Device AA:BB:CC:DD:EE:FF RSSI: 0xffffffc1 (-63)', ('rssi', 'AA:BB:CC:DD:EE:FF', -63)),
+        ('[CHG] Device AA:BB:CC:DD:EE:FF Name: My Speaker', ('name', 'AA:BB:CC:DD:EE:FF', 'My Speaker')),
+    ])
+    def test_discovery_lines(self, line, expected):
+        """Device events should yield the event, address and value."""
+        assert _parse_bluetoothctl_line(line) == expected
+
+    @pytest.mark.parametrize('line', [
+        '[CHG] Device AA:BB:CC:DD:EE:FF Connected: yes',
+        '[CHG] Controller 00:11:22:33:44:55 Discovering: yes',
+        'Discovery started',
+        '',
+    ])
+    def test_other_lines_ignored(self, line):
+        """Lines that are not device discovery events should be ignored."""
+        assert _parse_bluetoothctl_line(line) is None
+
+    @pytest.mark.parametrize('line,expected', [
+        ('[bluetooth]# [NEW] Device AA:BB:CC:DD:EE:FF Tag', ('new', 'AA:BB:CC:DD:EE:FF', 'Tag')),
+        ('[bluetooth]# [CHG] Device AA:BB:CC:DD:EE:FF RSSI: 0xffffffc1 (-63)', ('rssi', 'AA:BB:CC:DD:EE:FF', -63)),
+        ('[bluetooth]# [CHG] Device AA:BB:CC:DD:EE:FF Name: Tag', ('name', 'AA:BB:CC:DD:EE:FF', 'Tag')),
+        ('[bluetooth]# [CHG] Device AA:BB:CC:DD:EE:FF Paired: yes', None),
+    ])
+    def test_prompt_prefixed_lines(self, line, expected):
+        """Lines behind an interactive prompt should still parse."""
+        assert _parse_bluetoothctl_line(line) == expected
+
+
+class TestReadLines:
+    """Tests for batched line reads from subprocess pipes."""
+
+    def test_lines_split_across_reads(self):
+        """Lines should be reassembled across chunk boundaries."""
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'first\nsec')
+        os.write(write_fd, 'ond\nthïrd'.encode())
+        os.close(write_fd)
+
+        with os.fdopen(read_fd, 'rb') as stream:
+            lines = list(_read_lines(stream, threading.Event()))
+
+        assert lines == ['first', 'second', 'thïrd']
+
+    def test_stop_event_ends_iteration(self):
+        """A set stop event should end iteration without waiting for EOF."""
+        read_fd, write_fd = os.pipe()
+        stop = threading.Event()
+        stop.set()
+
+        with os.fdopen(read_fd, 'rb') as stream:
+            assert list(_read_lines(stream, stop)) == []
+        os.close(write_fd)
+
+    def test_wake_pipe_interrupts_blocked_read(self):
+        """wake() should end iteration while the pipe is idle."""
+        read_fd, write_fd = os.pipe()
+        stop = threading.Event()
+        wake = _WakePipe()
+        lines = []
+
+        with os.fdopen(read_fd, 'rb') as stream:
+            reader = threading.Thread(target=lambda: lines.extend(_read_lines(stream, stop, wake)))
+            reader.start()
+            os.write(write_fd, b'line\n')
+            stop.set()
+            wake.wake()
+            reader.join(timeout=2.0)
+
+        assert not reader.is_alive()
+        os.close(write_fd)
+        wake.close()
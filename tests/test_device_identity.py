@@ -0,0 +1,298 @@
+"""
+Unit tests for the TSCM device identity engine.
+
+Covers observation ingest, session metrics and cluster linking.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.tscm import device_identity
+from utils.tscm.device_identity import (
+    MIN_CLUSTER_CONFIDENCE,
+    BLEObservation,
+    DeviceIdentityEngine,
+    DeviceSession,
+    _FingerprintIndex,
+    get_identity_engine,
+    ingest_wifi_dict,
+    jaccard_bitmap_similarity,
+    jaccard_similarity,
+    manufacturer_data_similarity,
+    manufacturer_data_similarity_matrix,
+    reset_identity_engine,
+    rssi_trajectory_similarity,
+    rssi_trajectory_similarity_matrix,
+)
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+# Two locally administered (random) addresses for the same tag
+RANDOM_MAC_1 = 'C2:11:22:33:44:55'
+RANDOM_MAC_2 = 'DA:66:77:88:99:AA'
+
+TAG_PAYLOAD = {
+    'manufacturer_id': 76,
+    'manufacturer_data': b'\x12\x19\x10\xaa\xbb\xcc\xdd\xee',
+    'service_uuids': ['0000fd6f-0000-1000-8000-00805f9b34fb'],
+    'tx_power': 4,
+    'local_name': 'Tag',
+}
+
+SPEAKER_PAYLOAD = {
+    'manufacturer_id': 117,
+    'manufacturer_data': b'\x42\x04\x01\x80\x60',
+    'service_uuids': ['0000110b-0000-1000-8000-00805f9b34fb'],
+    'tx_power': -8,
+    'local_name': 'Living Room Speaker',
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_engine():
+    """Give each test an empty global identity engine."""
+    reset_identity_engine()
+    yield
+    reset_identity_engine()
+
+
+def ingest_ble(engine, addr, rssi, payload, count=6, interval=1.0, start=0.0):
+    """Feed a run of identical advertisements from one address."""
+    for i in range(count):
+        engine.ingest_ble_observation(BLEObservation(
+            timestamp=BASE_TIME + timedelta(seconds=start + i * interval),
+            addr=addr,
+            rssi=rssi + (i % 3) - 1,
+            **payload,
+        ))
+
+
+def full_scan_match(engine, session):
+    """Reference matcher: score every cluster, no candidate pass, no early exit."""
+    best_match = None
+    best_score = MIN_CLUSTER_CONFIDENCE
+    for cluster in engine.clusters.values():
+        if cluster.protocol != session.protocol:
+            continue
+        similarity = engine._calculate_cluster_similarity(cluster, session)
+        if similarity > best_score:
+            best_score = similarity
+            best_match = cluster
+    return best_match
+
+
+class TestClusterLinking:
+    """Tests for linking sessions into device clusters."""
+
+    def test_same_device_under_two_random_macs_links(self):
+        """One tag seen under two random addresses should form one cluster."""
+        engine = DeviceIdentityEngine()
+        ingest_ble(engine, RANDOM_MAC_1, -55, TAG_PAYLOAD)
+        ingest_ble(engine, RANDOM_MAC_2, -56, TAG_PAYLOAD, start=10.0)
+        engine.finalize_all_sessions()
+
+        assert len(engine.clusters) == 1
+        cluster = next(iter(engine.clusters.values()))
+        assert cluster.linked_macs == {RANDOM_MAC_1, RANDOM_MAC_2}
+        assert len(cluster.sessions) == 2
+
+    def test_unrelated_device_does_not_link(self):
+        """A device with a different payload and signal should get its own cluster."""
+        engine = DeviceIdentityEngine()
+        ingest_ble(engine, RANDOM_MAC_1, -55, TAG_PAYLOAD)
+        ingest_ble(engine, 'AC:DE:48:00:11:22', -85, SPEAKER_PAYLOAD, interval=7.0)
+        engine.finalize_all_sessions()
+
+        assert len(engine.clusters) == 2
+        assert {frozenset(c.linked_macs) for c in engine.clusters.values()} == {
+            frozenset({RANDOM_MAC_1}), frozenset({'AC:DE:48:00:11:22'}),
+        }
+
+    def test_early_exit_matches_full_scan(self, monkeypatch):
+        """Candidate-first matching with early exit should pick the full-scan cluster."""
+        engine = DeviceIdentityEngine()
+        ingest_ble(engine, RANDOM_MAC_1, -55, TAG_PAYLOAD)
+        ingest_ble(engine, 'AC:DE:48:00:11:22', -85, SPEAKER_PAYLOAD, interval=7.0)
+        engine.finalize_all_sessions()
+
+        probes = [
+            (RANDOM_MAC_2, -56, TAG_PAYLOAD),
+            ('4E:00:00:00:00:01', -84, SPEAKER_PAYLOAD),
+            ('4E:00:00:00:00:02', -56, dict(TAG_PAYLOAD, tx_power=0)),
+        ]
+        for addr, rssi, payload in probes:
+            ingest_ble(engine, addr, rssi, payload, start=100.0)
+            session = engine.ble_sessions[addr]
+
+            fast, _ = engine._find_matching_cluster(session)
+            with monkeypatch.context() as m:
+                m.setattr(device_identity, 'EARLY_EXIT_THRESHOLD', 2.0)
+                reference = full_scan_match(engine, session)
+
+            assert fast is reference
+            assert fast is not None
+
+    def test_summary_without_clusters_keeps_statistics(self):
+        """include_clusters=False should drop the cluster dicts but not the statistics."""
+        engine = DeviceIdentityEngine()
+        ingest_ble(engine, RANDOM_MAC_1, -55, TAG_PAYLOAD)
+        ingest_ble(engine, RANDOM_MAC_2, -56, TAG_PAYLOAD, start=10.0)
+        ingest_ble(engine, 'AC:DE:48:00:11:22', -85, SPEAKER_PAYLOAD, interval=7.0)
+        engine.finalize_all_sessions()
+
+        full = engine.get_summary()
+        brief = engine.get_summary(include_clusters=False)
+
+        assert 'clusters_by_risk' in full
+        assert 'clusters_by_risk' not in brief
+        assert brief['statistics'] == full['statistics']
+        stats = brief['statistics']
+        assert stats['total_clusters'] == 2
+        assert stats['ble_sessions'] == 3
+        assert stats['unique_fingerprints'] == 2
+        for key in ('high_risk_count', 'medium_risk_count'):
+            assert key in stats
+
+
+class TestWifiIngest:
+    """Tests for ingesting WiFi observation dicts."""
+
+    def test_string_power_is_parsed(self):
+        """Power reported as a string (airodump CSV) should still count as RSSI."""
+        for i, power in enumerate(['-45', '-47', ' -46 ']):
+            session = ingest_wifi_dict({
+                'timestamp': (BASE_TIME + timedelta(seconds=i)).isoformat(),
+                'src_mac': 'AA:BB:CC:DD:EE:FF',
+                'bssid': 'AA:BB:CC:DD:EE:FF',
+                'ssid': 'Office',
+                'rssi': power,
+                'frame_type': 'beacon',
+            })
+
+        assert len(session.observations) == 3
+        assert list(session.rssi_samples) == [-45.0, -47.0, -46.0]
+        assert session.get_mean_rssi() == pytest.approx(-46.0)
+
+    def test_unparseable_power_is_skipped(self):
+        """A power value that is not a number should not drop the observation."""
+        session = ingest_wifi_dict({
+            'timestamp': BASE_TIME.isoformat(),
+            'src_mac': 'AA:BB:CC:DD:EE:FF',
+            'rssi': '',
+            'frame_type': 'beacon',
+        })
+
+        assert len(session.observations) == 1
+        assert len(session.rssi_samples) == 0
+        assert get_identity_engine().wifi_sessions['AA:BB:CC:DD:EE:FF'] is session
+
+
+class TestManufacturerDataMatrix:
+    """Tests for the vectorised manufacturer data similarity."""
+
+    def test_matches_pairwise(self):
+        """Every cell should equal manufacturer_data_similarity() for that pair."""
+        blobs = [
+            b'\x02\x15\xaa\xbb\xcc\xdd\xee\xff\x01\x02',
+            b'\x02\x15\xaa\xbb\xcc\xdd\xee\xff',
+            b'\x02\x15\xaa',
+            b'\x10\x05',
+            None,
+            b'',
+            b'\x02\x15\xaa\xbb\x00\x00\x00\x00\x00\x00\x00\x00\x09',
+        ]
+
+        matrix = manufacturer_data_similarity_matrix(blobs)
+
+        assert matrix.shape == (len(blobs), len(blobs))
+        for i, a in enumerate(blobs):
+            for j, b in enumerate(blobs):
+                assert matrix[i, j] == pytest.approx(manufacturer_data_similarity(a, b))
+
+    def test_missing_blobs_score_zero(self):
+        """Rows and columns for None or empty blobs should be all zero."""
+        matrix = manufacturer_data_similarity_matrix([None, b'', b'\x01'])
+
+        assert not matrix[:2].any()
+        assert not matrix[:, :2].any()
+        assert matrix[2, 2] == pytest.approx(1.0)
+
+    def test_empty_input(self):
+        """No blobs should give an empty matrix."""
+        assert manufacturer_data_similarity_matrix([]).shape == (0, 0)
+
+
+def make_session(session_id, rssi_samples):
+    """Session carrying only RSSI samples."""
+    return DeviceSession(
+        session_id=session_id,
+        protocol='ble',
+        first_seen=BASE_TIME,
+        last_seen=BASE_TIME,
+        rssi_samples=rssi_samples,
+    )
+
+
+class TestRssiTrajectoryMatrix:
+    """Tests for the vectorised RSSI trajectory similarity."""
+
+    def test_matches_pairwise(self):
+        """Every cell should equal rssi_trajectory_similarity() on the samples."""
+        sessions = [
+            make_session('a', [-60, -62, -61, -59]),
+            make_session('b', [-61.5, -60, -63]),
+            make_session('c', [-70, -55, -80, -65, -72, -58]),
+            make_session('d', [-95, -96, -94]),
+            make_session('e', [-60, -61]),
+            make_session('f', []),
+        ]
+
+        matrix = rssi_trajectory_similarity_matrix(sessions)
+
+        assert matrix.shape == (len(sessions), len(sessions))
+        for i, a in enumerate(sessions):
+            for j, b in enumerate(sessions):
+                expected = rssi_trajectory_similarity(a.rssi_samples, b.rssi_samples)
+                assert matrix[i, j] == pytest.approx(expected)
+
+    def test_short_sessions_score_zero(self):
+        """Sessions with fewer than three samples should never match."""
+        sessions = [make_session('a', [-60, -61]), make_session('b', [-60, -61, -60])]
+
+        matrix = rssi_trajectory_similarity_matrix(sessions)
+
+        assert not matrix[0].any()
+        assert not matrix[:, 0].any()
+        assert matrix[1, 1] == pytest.approx(1.0)
+
+
+class TestFingerprintBitmaps:
+    """Tests for fingerprint sets encoded as bitmaps."""
+
+    @pytest.mark.parametrize('set1,set2', [
+        ({'a', 'b', 'c'}, {'b', 'c', 'd'}),
+        ({'a'}, {'a'}),
+        ({'a', 'b'}, {'c'}),
+        ({'a'}, set()),
+        (set(), set()),
+    ])
+    def test_matches_set_jaccard(self, set1, set2):
+        """Bitmap Jaccard should equal the set Jaccard for the same fingerprints."""
+        index = _FingerprintIndex()
+
+        score = jaccard_bitmap_similarity(index.bits(set1), index.bits(set2))
+
+        assert score == pytest.approx(jaccard_similarity(set1, set2))
+
+    def test_index_is_per_engine_and_reset_by_clear(self):
+        """Fingerprint bits should not accumulate across engines or clear()."""
+        engine = DeviceIdentityEngine()
+        ingest_ble(engine, RANDOM_MAC_1, -55, TAG_PAYLOAD)
+        ingest_ble(engine, 'AC:DE:48:00:11:22', -85, SPEAKER_PAYLOAD)
+
+        assert len(engine._fp_index) == 2
+        assert len(DeviceIdentityEngine()._fp_index) == 0
+
+        engine.clear()
+        assert len(engine._fp_index) == 0
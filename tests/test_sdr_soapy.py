@@ -0,0 +1,218 @@
+"""
+Unit tests for the SoapySDR command builders.
+
+HackRF and LimeSDR share SoapyCommandBuilder; these pin the argv each
+device produced with its own builder, so a wrong flag shows up here
+rather than as a silently misconfigured radio.
+"""
+
+import pytest
+
+from utils.sdr.base import SDRDevice, SDRType
+from utils.sdr.hackrf import HackRFCommandBuilder
+from utils.sdr.limesdr import LimeSDRCommandBuilder
+
+SERIAL = 'a06063c8234e925f'
+
+
+def make_device(builder, serial=SERIAL):
+    """SDRDevice for a builder's hardware."""
+    caps = builder.get_capabilities()
+    return SDRDevice(
+        sdr_type=caps.sdr_type,
+        index=0,
+        name=caps.sdr_type.value,
+        serial=serial,
+        driver=builder.DRIVER,
+        capabilities=caps,
+    )
+
+
+@pytest.fixture
+def hackrf():
+    builder = HackRFCommandBuilder()
+    return builder, make_device(builder)
+
+
+@pytest.fixture
+def lime():
+    builder = LimeSDRCommandBuilder()
+    return builder, make_device(builder)
+
+
+class TestDeviceString:
+    """Tests for the SoapySDR device string."""
+
+    @pytest.mark.parametrize('builder_cls,driver', [
+        (HackRFCommandBuilder, 'hackrf'),
+        (LimeSDRCommandBuilder, 'lime'),
+    ])
+    def test_serial_included_when_known(self, builder_cls, driver):
+        """A real serial is passed to SoapySDR; 'N/A' is left out."""
+        builder = builder_cls()
+        with_serial = builder.build_fm_demod_command(make_device(builder), 153.35)
+        without = builder.build_fm_demod_command(make_device(builder, serial='N/A'), 153.35)
+
+        assert with_serial[2] == f'driver={driver},serial={SERIAL}'
+        assert without[2] == f'driver={driver}'
+
+    def test_sdr_types(self):
+        """Each builder reports its own hardware type."""
+        assert HackRFCommandBuilder.get_sdr_type() == SDRType.HACKRF
+        assert LimeSDRCommandBuilder.get_sdr_type() == SDRType.LIME_SDR
+
+
+class TestHackRFCommands:
+    """HackRF argv, including bias-T and the LNA/VGA gain split."""
+
+    def test_fm_demod_default(self, hackrf):
+        builder, device = hackrf
+        assert builder.build_fm_demod_command(device, 153.35) == [
+            'rx_fm', '-d', f'driver=hackrf,serial={SERIAL}', '-f', '153.35M',
+            '-M', 'fm', '-s', '22050', '-',
+        ]
+
+    def test_fm_demod_all_options(self, hackrf):
+        builder, device = hackrf
+        cmd = builder.build_fm_demod_command(
+            device, 153.35, sample_rate=24000, gain=30, ppm=5,
+            modulation='am', squelch=10, bias_t=True,
+        )
+        assert cmd == [
+            'rx_fm', '-d', f'driver=hackrf,serial={SERIAL}', '-f', '153.35M',
+            '-M', 'am', '-s', '24000', '-g', 'LNA=30,VGA=0', '-l', '10', '-T', '-',
+        ]
+
+    @pytest.mark.parametrize('gain,element', [
+        (12.9, 'LNA=12,VGA=0'),
+        (40, 'LNA=40,VGA=0'),
+        (52.7, 'LNA=40,VGA=12'),
+        (102, 'LNA=40,VGA=62'),
+        (200, 'LNA=40,VGA=62'),
+    ])
+    def test_fm_demod_gain_split(self, hackrf, gain, element):
+        """Gain fills the LNA up to 40 dB, then the VGA up to 62 dB."""
+        builder, device = hackrf
+        cmd = builder.build_fm_demod_command(device, 929.6125, gain=gain)
+        assert cmd[cmd.index('-g') + 1] == element
+
+    def test_adsb(self, hackrf):
+        builder, device = hackrf
+        base = [
+            'readsb', '--net', '--device-type', 'soapysdr',
+            '--device', f'driver=hackrf,serial={SERIAL}', '--quiet',
+        ]
+        assert builder.build_adsb_command(device) == base
+        assert builder.build_adsb_command(device, gain=45, bias_t=True) == base + [
+            '--gain', '45', '--enable-bias-t',
+        ]
+
+    def test_ism(self, hackrf):
+        builder, device = hackrf
+        assert builder.build_ism_command(device) == [
+            'rtl_433', '-d', f'driver=hackrf,serial={SERIAL}', '-f', '433.92M', '-F', 'json',
+        ]
+        cmd = builder.build_ism_command(device, frequency_mhz=868.3, gain=20, ppm=3, bias_t=True)
+        assert cmd == [
+            'rtl_433', '-d', f'driver=hackrf,serial={SERIAL},bias_t=1', '-f', '868.3M',
+            '-F', 'json', '-g', '20',
+        ]
+
+    def test_ais(self, hackrf):
+        builder, device = hackrf
+        base = ['AIS-catcher', '-d', f'soapysdr -d driver=hackrf,serial={SERIAL}']
+        assert builder.build_ais_command(device) == base + ['-S', '10110', '-o', '5', '-q']
+        assert builder.build_ais_command(device, gain=48, bias_t=True, tcp_port=10111) == base + [
+            '-S', '10111', '-o', '5', '-q', '-gr', 'tuner', '48', '-gr', 'biastee', '1',
+        ]
+
+    def test_iq_capture(self, hackrf):
+        builder, device = hackrf
+        assert builder.build_iq_capture_command(device, 100.0) == [
+            'rx_sdr', '-d', f'driver=hackrf,serial={SERIAL}', '-f', '100000000',
+            '-s', '2048000', '-F', 'CU8', '-',
+        ]
+        cmd = builder.build_iq_capture_command(
+            device, 433.92, sample_rate=2000000, gain=60, ppm=2, bias_t=True,
+            output_format='cs16',
+        )
+        assert cmd == [
+            'rx_sdr', '-d', f'driver=hackrf,serial={SERIAL}', '-f', '433920000',
+            '-s', '2000000', '-F', 'CU8', '-g', 'LNA=40,VGA=20', '-T', '-',
+        ]
+
+
+class TestLimeSDRCommands:
+    """LimeSDR argv: LNAH gain element, bias-T ignored, PPM only for rtl_433."""
+
+    def test_fm_demod_default(self, lime):
+        builder, device = lime
+        assert builder.build_fm_demod_command(device, 153.35) == [
+            'rx_fm', '-d', f'driver=lime,serial={SERIAL}', '-f', '153.35M',
+            '-M', 'fm', '-s', '22050', '-',
+        ]
+
+    def test_fm_demod_all_options(self, lime):
+        builder, device = lime
+        cmd = builder.build_fm_demod_command(
+            device, 153.35, sample_rate=24000, gain=30, ppm=5,
+            modulation='am', squelch=10, bias_t=True,
+        )
+        assert cmd == [
+            'rx_fm', '-d', f'driver=lime,serial={SERIAL}', '-f', '153.35M',
+            '-M', 'am', '-s', '24000', '-g', 'LNAH=30', '-l', '10', '-',
+        ]
+
+    @pytest.mark.parametrize('gain,element', [
+        (12.9, 'LNAH=12'),
+        (52.7, 'LNAH=52'),
+        (200, 'LNAH=200'),
+    ])
+    def test_fm_demod_gain(self, lime, gain, element):
+        """The whole gain goes to the LNAH element, truncated to an int."""
+        builder, device = lime
+        cmd = builder.build_fm_demod_command(device, 929.6125, gain=gain)
+        assert cmd[cmd.index('-g') + 1] == element
+
+    def test_adsb(self, lime):
+        builder, device = lime
+        base = [
+            'readsb', '--net', '--device-type', 'soapysdr',
+            '--device', f'driver=lime,serial={SERIAL}', '--quiet',
+        ]
+        assert builder.build_adsb_command(device) == base
+        assert builder.build_adsb_command(device, gain=45, bias_t=True) == base + ['--gain', '45']
+
+    def test_ism(self, lime):
+        builder, device = lime
+        assert builder.build_ism_command(device) == [
+            'rtl_433', '-d', f'driver=lime,serial={SERIAL}', '-f', '433.92M', '-F', 'json',
+        ]
+        cmd = builder.build_ism_command(device, frequency_mhz=868.3, gain=20, ppm=3, bias_t=True)
+        assert cmd == [
+            'rtl_433', '-d', f'driver=lime,serial={SERIAL}', '-f', '868.3M',
+            '-F', 'json', '-g', '20', '-p', '3',
+        ]
+
+    def test_ais(self, lime):
+        builder, device = lime
+        base = ['AIS-catcher', '-d', f'soapysdr -d driver=lime,serial={SERIAL}']
+        assert builder.build_ais_command(device) == base + ['-S', '10110', '-o', '5', '-q']
+        assert builder.build_ais_command(device, gain=48, bias_t=True, tcp_port=10111) == base + [
+            '-S', '10111', '-o', '5', '-q', '-gr', 'tuner', '48',
+        ]
+
+    def test_iq_capture(self, lime):
+        builder, device = lime
+        assert builder.build_iq_capture_command(device, 100.0) == [
+            'rx_sdr', '-d', f'driver=lime,serial={SERIAL}', '-f', '100000000',
+            '-s', '2048000', '-F', 'CU8', '-',
+        ]
+        cmd = builder.build_iq_capture_command(
+            device, 433.92, sample_rate=2000000, gain=60, ppm=2, bias_t=True,
+            output_format='cs16',
+        )
+        assert cmd == [
+            'rx_sdr', '-d', f'driver=lime,serial={SERIAL}', '-f', '433920000',
+            '-s', '2000000', '-F', 'CU8', '-g', 'LNAH=60', '-',
+        ]
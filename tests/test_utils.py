@@ -1,7 +1,10 @@
 """Tests for utility modules."""
 
+import queue
+
 import pytest
 from utils.process import is_valid_mac, is_valid_channel
+from utils.sse import clear_queue, drain_queue
 from utils.dependencies import check_tool
 from data.oui import get_manufacturer
 
@@ -71,3 +74,47 @@ class TestOuiLookup:
         """Test looking up unknown manufacturer."""
         result = get_manufacturer('FF:FF:FF:FF:FF:FF')
         assert result == 'Unknown'
+
+
+class TestDrainQueue:
+    """Tests for bulk queue draining."""
+
+    def test_drains_all_in_order(self):
+        q = queue.Queue()
+        for i in range(5):
+            q.put(i)
+        assert drain_queue(q) == [0, 1, 2, 3, 4]
+        assert q.empty()
+
+    def test_respects_max_items(self):
+        q = queue.Queue()
+        for i in range(5):
+            q.put(i)
+        assert drain_queue(q, 2) == [0, 1]
+        assert q.qsize() == 3
+
+    def test_empty_queue(self):
+        assert drain_queue(queue.Queue()) == []
+
+    def test_frees_space_in_bounded_queue(self):
+        q = queue.Queue(maxsize=2)
+        q.put(1)
+        q.put(2)
+        drain_queue(q)
+        q.put_nowait(3)
+        assert q.qsize() == 1
+
+
+class TestClearQueue:
+    """Tests for queue clearing."""
+
+    def test_clears_and_counts(self):
+        q = queue.Queue(maxsize=3)
+        for i in range(3):
+            q.put(i)
+        assert clear_queue(q) == 3
+        assert q.empty()
+        q.put_nowait(4)
+
+    def test_empty_queue(self):
+        assert clear_queue(queue.Queue()) == 0
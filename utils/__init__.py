@@ -39,5 +39,5 @@ from .validation import (
     sanitize_ssid,
     sanitize_device_name,
 )
-from .sse import sse_stream, format_sse, clear_queue
+from .sse import sse_stream, format_sse, clear_queue, drain_queue
 from .cleanup import DataStore, CleanupManager, cleanup_manager, cleanup_dict
@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+import io
+import json
 import logging
 import queue
+import struct
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Iterable
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Sequence
 
 # psycopg2 is optional - only needed for PostgreSQL history persistence
 try:
     import psycopg2
-    from psycopg2.extras import execute_values, Json
+    from psycopg2.extras import execute_batch, Json
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     psycopg2 = None  # type: ignore
-    execute_values = None  # type: ignore
+    execute_batch = None  # type: ignore
     Json = None  # type: ignore
     PSYCOPG2_AVAILABLE = False
 
+# orjson is optional - speeds up JSONB encoding of snapshot batches
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 from config import (
     ADSB_DB_HOST,
     ADSB_DB_NAME,
@@ -31,6 +43,7 @@ from config import (
     ADSB_HISTORY_FLUSH_INTERVAL,
     ADSB_HISTORY_QUEUE_SIZE,
 )
+from utils.sse import drain_queue
 
 logger = logging.getLogger('intercept.adsb_history')
 
@@ -56,10 +69,40 @@ _MESSAGE_FIELDS = (
     'source_host',
 )
 
-_MESSAGE_INSERT_SQL = f"""
-    INSERT INTO adsb_messages ({', '.join(_MESSAGE_FIELDS)})
-    VALUES %s
-"""
+_MESSAGE_TYPES = (
+    'timestamptz',
+    'timestamptz',
+    'timestamptz',
+    'text',
+    'smallint',
+    'text',
+    'integer',
+    'integer',
+    'integer',
+    'integer',
+    'double',
+    'double',
+    'text',
+    'text',
+    'text',
+    'text',
+    'text',
+    'text',
+)
+
+def _prepared_insert_sql(name: str, table: str, fields: Sequence[str]) -> tuple[str, str]:
+    """Build the PREPARE statement for an INSERT and the matching EXECUTE template."""
+    placeholders = ', '.join(f'${i}' for i in range(1, len(fields) + 1))
+    prepare_sql = f"PREPARE {name} AS INSERT INTO {table} ({', '.join(fields)}) VALUES ({placeholders})"
+    execute_sql = f"EXECUTE {name} ({', '.join(['%s'] * len(fields))})"
+    return prepare_sql, execute_sql
+
+
+_MESSAGE_PREPARE_SQL, _MESSAGE_EXECUTE_SQL = _prepared_insert_sql(
+    'adsb_insert_message', 'adsb_messages', _MESSAGE_FIELDS
+)
+
+_MESSAGE_COPY_SQL = f"COPY adsb_messages ({', '.join(_MESSAGE_FIELDS)}) FROM STDIN WITH (FORMAT binary)"
 
 _SNAPSHOT_FIELDS = (
     'captured_at',
@@ -79,120 +122,248 @@ _SNAPSHOT_FIELDS = (
     'snapshot',
 )
 
-_SNAPSHOT_INSERT_SQL = f"""
-    INSERT INTO adsb_snapshots ({', '.join(_SNAPSHOT_FIELDS)})
-    VALUES %s
+_SNAPSHOT_TYPES = (
+    'timestamptz',
+    'text',
+    'text',
+    'text',
+    'text',
+    'text',
+    'integer',
+    'integer',
+    'integer',
+    'integer',
+    'double',
+    'double',
+    'text',
+    'text',
+    'jsonb',
+)
+
+_SNAPSHOT_PREPARE_SQL, _SNAPSHOT_EXECUTE_SQL = _prepared_insert_sql(
+    'adsb_insert_snapshot', 'adsb_snapshots', _SNAPSHOT_FIELDS
+)
+
+_SNAPSHOT_COPY_SQL = f"COPY adsb_snapshots ({', '.join(_SNAPSHOT_FIELDS)}) FROM STDIN WITH (FORMAT binary)"
+
+_SNAPSHOT_INDEX = _SNAPSHOT_FIELDS.index('snapshot')
+
+_MESSAGE_GETTER = itemgetter(*_MESSAGE_FIELDS)
+_SNAPSHOT_GETTER = itemgetter(*_SNAPSHOT_FIELDS)
+
+_KIND_MESSAGE = 'message'
+_KIND_SNAPSHOT = 'snapshot'
+
+# PostgreSQL binary COPY framing: signature, flags, header extension length
+_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_COPY_TRAILER = struct.pack('>h', -1)
+_COPY_NULL = struct.pack('>i', -1)
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_PG_EPOCH_UNIX = _PG_EPOCH.timestamp()
+
+
+def _encode_timestamptz(value: datetime | float) -> bytes:
+    if isinstance(value, float):
+        # Epoch seconds stamped by enqueue_*() with time.time()
+        return struct.pack('>q', round((value - _PG_EPOCH_UNIX) * 1_000_000))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _PG_EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack('>q', micros)
+
+
+def _json_bytes(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value).encode('utf-8')
+
+
+def _json_str(value: Any) -> str:
+    return _json_bytes(value).decode('utf-8')
+
+
+_COPY_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    'timestamptz': _encode_timestamptz,
+    'smallint': lambda value: struct.pack('>h', int(value)),
+    'integer': lambda value: struct.pack('>i', int(value)),
+    'double': lambda value: struct.pack('>d', float(value)),
+    'text': lambda value: str(value).encode('utf-8'),
+    'jsonb': lambda value: b'\x01' + _json_bytes(value),
+}
+
+
+def _pack_binary(rows: Iterable[Sequence[Any]], types: Sequence[str]) -> io.BytesIO:
+    """Encode rows as a PostgreSQL binary COPY stream."""
+    encoders = [_COPY_ENCODERS[t] for t in types]
+    field_count = struct.pack('>h', len(encoders))
+    buf = io.BytesIO()
+    write = buf.write
+    write(_COPY_HEADER)
+    for row in rows:
+        write(field_count)
+        for value, encode in zip(row, encoders):
+            if value is None:
+                write(_COPY_NULL)
+                continue
+            data = encode(value)
+            write(struct.pack('>i', len(data)))
+            write(data)
+    write(_COPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+
+def _project_row(record: dict, getter: Callable[[dict], tuple], fields: Sequence[str]) -> tuple:
+    """Project a record onto a column tuple, tolerating missing keys."""
+    try:
+        return getter(record)
+    except KeyError:
+        return tuple(record.get(field) for field in fields)
+
+
+def _copy_or_insert(
+    conn: psycopg2.extensions.connection,
+    copy_sql: str,
+    types: Sequence[str],
+    prepare_sql: str,
+    execute_sql: str,
+    rows: list[tuple],
+    adapt: Callable[[tuple], tuple],
+    prepared: set[str],
+) -> None:
+    """Write rows with binary COPY, falling back to INSERT if COPY is rejected.
+
+    The connection runs in autocommit mode, so each statement is its own
+    transaction and a rejected COPY leaves nothing behind to roll back.
+    The fallback INSERT is a server-side prepared statement, prepared once
+    per connection; ``prepared`` tracks which ones this connection has.
+    """
+    try:
+        with conn.cursor() as cur:
+            cur.copy_expert(copy_sql, _pack_binary(rows, types))
+        return
+    except Exception as exc:
+        if conn.closed:
+            raise
+        logger.debug("ADS-B binary COPY failed, falling back to INSERT: %s", exc)
+
+    with conn.cursor() as cur:
+        if prepare_sql not in prepared:
+            try:
+                cur.execute(prepare_sql)
+            except psycopg2.errors.DuplicatePreparedStatement:
+                pass
+            prepared.add(prepare_sql)
+        execute_batch(cur, execute_sql, [adapt(row) for row in rows], page_size=500)
+
+
+def _adapt_timestamp(row: tuple) -> tuple:
+    # received_at/captured_at lead both field lists
+    if isinstance(row[0], float):
+        return (datetime.fromtimestamp(row[0], timezone.utc),) + row[1:]
+    return row
+
+
+def _adapt_snapshot_row(row: tuple) -> tuple:
+    row = _adapt_timestamp(row)
+    snapshot = row[_SNAPSHOT_INDEX]
+    if snapshot is None:
+        return row
+    return row[:_SNAPSHOT_INDEX] + (Json(snapshot, dumps=_json_str),) + row[_SNAPSHOT_INDEX + 1:]
+
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS adsb_messages (
+    id BIGSERIAL PRIMARY KEY,
+    received_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    msg_time TIMESTAMPTZ,
+    logged_time TIMESTAMPTZ,
+    icao TEXT NOT NULL,
+    msg_type SMALLINT,
+    callsign TEXT,
+    altitude INTEGER,
+    speed INTEGER,
+    heading INTEGER,
+    vertical_rate INTEGER,
+    lat DOUBLE PRECISION,
+    lon DOUBLE PRECISION,
+    squawk TEXT,
+    session_id TEXT,
+    aircraft_id TEXT,
+    flight_id TEXT,
+    raw_line TEXT,
+    source_host TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_messages_icao_time
+ON adsb_messages (icao, received_at);
+
+-- adsb_messages is append-only in time order, so BRIN indexes cover
+-- the time columns at a fraction of the B-tree write cost
+CREATE INDEX IF NOT EXISTS idx_adsb_messages_received_at_brin
+ON adsb_messages USING BRIN (received_at) WITH (pages_per_range = 32);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_messages_msg_time_brin
+ON adsb_messages USING BRIN (msg_time) WITH (pages_per_range = 32);
+
+-- Drop the B-tree indexes these replace on existing databases
+DROP INDEX IF EXISTS idx_adsb_messages_received_at;
+
+DROP INDEX IF EXISTS idx_adsb_messages_msg_time;
+
+CREATE TABLE IF NOT EXISTS adsb_snapshots (
+    id BIGSERIAL PRIMARY KEY,
+    captured_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    icao TEXT NOT NULL,
+    callsign TEXT,
+    registration TEXT,
+    type_code TEXT,
+    type_desc TEXT,
+    altitude INTEGER,
+    speed INTEGER,
+    heading INTEGER,
+    vertical_rate INTEGER,
+    lat DOUBLE PRECISION,
+    lon DOUBLE PRECISION,
+    squawk TEXT,
+    source_host TEXT,
+    snapshot JSONB
+);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_snapshots_icao_time
+ON adsb_snapshots (icao, captured_at);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_snapshots_captured_at
+ON adsb_snapshots (captured_at);
+
+CREATE TABLE IF NOT EXISTS adsb_sessions (
+    id BIGSERIAL PRIMARY KEY,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    ended_at TIMESTAMPTZ,
+    device_index INTEGER,
+    sdr_type TEXT,
+    remote_host TEXT,
+    remote_port INTEGER,
+    start_source TEXT,
+    stop_source TEXT,
+    started_by TEXT,
+    stopped_by TEXT,
+    notes TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_sessions_started_at
+ON adsb_sessions (started_at);
+
+CREATE INDEX IF NOT EXISTS idx_adsb_sessions_active
+ON adsb_sessions (ended_at);
 """
 
+
 def _ensure_adsb_schema(conn: psycopg2.extensions.connection) -> None:
+    # Sent as one multi-statement simple query: a single round-trip for all DDL
     with conn.cursor() as cur:
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS adsb_messages (
-                id BIGSERIAL PRIMARY KEY,
-                received_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-                msg_time TIMESTAMPTZ,
-                logged_time TIMESTAMPTZ,
-                icao TEXT NOT NULL,
-                msg_type SMALLINT,
-                callsign TEXT,
-                altitude INTEGER,
-                speed INTEGER,
-                heading INTEGER,
-                vertical_rate INTEGER,
-                lat DOUBLE PRECISION,
-                lon DOUBLE PRECISION,
-                squawk TEXT,
-                session_id TEXT,
-                aircraft_id TEXT,
-                flight_id TEXT,
-                raw_line TEXT,
-                source_host TEXT
-            )
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_messages_icao_time
-            ON adsb_messages (icao, received_at)
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_messages_received_at
-            ON adsb_messages (received_at)
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_messages_msg_time
-            ON adsb_messages (msg_time)
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS adsb_snapshots (
-                id BIGSERIAL PRIMARY KEY,
-                captured_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-                icao TEXT NOT NULL,
-                callsign TEXT,
-                registration TEXT,
-                type_code TEXT,
-                type_desc TEXT,
-                altitude INTEGER,
-                speed INTEGER,
-                heading INTEGER,
-                vertical_rate INTEGER,
-                lat DOUBLE PRECISION,
-                lon DOUBLE PRECISION,
-                squawk TEXT,
-                source_host TEXT,
-                snapshot JSONB
-            )
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_snapshots_icao_time
-            ON adsb_snapshots (icao, captured_at)
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_snapshots_captured_at
-            ON adsb_snapshots (captured_at)
-            """
-        )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS adsb_sessions (
-                id BIGSERIAL PRIMARY KEY,
-                started_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-                ended_at TIMESTAMPTZ,
-                device_index INTEGER,
-                sdr_type TEXT,
-                remote_host TEXT,
-                remote_port INTEGER,
-                start_source TEXT,
-                stop_source TEXT,
-                started_by TEXT,
-                stopped_by TEXT,
-                notes TEXT
-            )
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_sessions_started_at
-            ON adsb_sessions (started_at)
-            """
-        )
-        cur.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_adsb_sessions_active
-            ON adsb_sessions (ended_at)
-            """
-        )
+        cur.execute(_SCHEMA_SQL)
     conn.commit()
 
 
@@ -203,16 +374,29 @@ def _make_dsn() -> str:
     )
 
 
-class AdsbHistoryWriter:
-    """Background writer for ADS-B history records."""
+class AdsbWriter:
+    """Background writer for ADS-B message and snapshot records.
+
+    Both record kinds share one queue, one thread and one connection. The
+    connection is in autocommit mode: each batch is a single COPY (or
+    INSERT) statement and needs no explicit BEGIN/COMMIT.
+    """
+
+    # Schema DDL runs on the first successful connection only, not on
+    # every reconnect after a database blip
+    _schema_ready = False
 
     def __init__(self) -> None:
         self.enabled = ADSB_HISTORY_ENABLED and PSYCOPG2_AVAILABLE
-        self._queue: queue.Queue[dict] = queue.Queue(maxsize=ADSB_HISTORY_QUEUE_SIZE)
+        # Records are held as (kind, row) with the row already in column
+        # order, which is far smaller than keeping the source dict alive
+        self._queue: queue.Queue[tuple[str, tuple]] = queue.Queue(maxsize=ADSB_HISTORY_QUEUE_SIZE)
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._conn: psycopg2.extensions.connection | None = None
         self._dropped = 0
+        self._target_batch = ADSB_HISTORY_BATCH_SIZE
+        self._prepared: set[str] = set()
 
     def start(self) -> None:
         if not self.enabled:
@@ -226,180 +410,122 @@ class AdsbHistoryWriter:
     def stop(self) -> None:
         self._stop_event.set()
 
-    def enqueue(self, record: dict) -> None:
+    def enqueue_message(self, record: dict) -> None:
         if not self.enabled:
             return
         if 'received_at' not in record or record['received_at'] is None:
-            record['received_at'] = datetime.now(timezone.utc)
-        try:
-            self._queue.put_nowait(record)
-        except queue.Full:
-            self._dropped += 1
-            if self._dropped % 1000 == 0:
-                logger.warning("ADS-B history queue full, dropped %d records", self._dropped)
-
-    def _run(self) -> None:
-        batch: list[dict] = []
-        last_flush = time.time()
-
-        while not self._stop_event.is_set():
-            timeout = max(0.0, ADSB_HISTORY_FLUSH_INTERVAL - (time.time() - last_flush))
-            try:
-                item = self._queue.get(timeout=timeout)
-                batch.append(item)
-            except queue.Empty:
-                pass
-
-            now = time.time()
-            if batch and (len(batch) >= ADSB_HISTORY_BATCH_SIZE or now - last_flush >= ADSB_HISTORY_FLUSH_INTERVAL):
-                if self._flush(batch):
-                    batch.clear()
-                    last_flush = now
-
-    def _ensure_connection(self) -> psycopg2.extensions.connection | None:
-        if self._conn:
-            return self._conn
-        try:
-            self._conn = psycopg2.connect(_make_dsn())
-            self._conn.autocommit = False
-            self._ensure_schema(self._conn)
-            return self._conn
-        except Exception as exc:
-            logger.warning("ADS-B history DB connection failed: %s", exc)
-            self._conn = None
-            return None
+            # Plain epoch float; converted when the batch is encoded
+            record['received_at'] = time.time()
+        self._put(_KIND_MESSAGE, _project_row(record, _MESSAGE_GETTER, _MESSAGE_FIELDS))
 
-    def _ensure_schema(self, conn: psycopg2.extensions.connection) -> None:
-        _ensure_adsb_schema(conn)
-
-    def _flush(self, batch: Iterable[dict]) -> bool:
-        conn = self._ensure_connection()
-        if not conn:
-            time.sleep(2.0)
-            return False
-
-        values = []
-        for record in batch:
-            values.append(tuple(record.get(field) for field in _MESSAGE_FIELDS))
-
-        try:
-            with conn.cursor() as cur:
-                execute_values(cur, _MESSAGE_INSERT_SQL, values)
-            conn.commit()
-            return True
-        except Exception as exc:
-            logger.warning("ADS-B history insert failed: %s", exc)
-            try:
-                conn.rollback()
-            except Exception:
-                pass
-            self._conn = None
-            time.sleep(2.0)
-            return False
-
-
-adsb_history_writer = AdsbHistoryWriter()
-
-
-class AdsbSnapshotWriter:
-    """Background writer for ADS-B snapshot records."""
-
-    def __init__(self) -> None:
-        self.enabled = ADSB_HISTORY_ENABLED and PSYCOPG2_AVAILABLE
-        self._queue: queue.Queue[dict] = queue.Queue(maxsize=ADSB_HISTORY_QUEUE_SIZE)
-        self._thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
-        self._conn: psycopg2.extensions.connection | None = None
-        self._dropped = 0
-
-    def start(self) -> None:
-        if not self.enabled:
-            return
-        if self._thread and self._thread.is_alive():
-            return
-        self._thread = threading.Thread(target=self._run, name='adsb-snapshot-writer', daemon=True)
-        self._thread.start()
-        logger.info("ADS-B snapshot writer started")
-
-    def stop(self) -> None:
-        self._stop_event.set()
-
-    def enqueue(self, record: dict) -> None:
+    def enqueue_snapshot(self, record: dict) -> None:
         if not self.enabled:
             return
         if 'captured_at' not in record or record['captured_at'] is None:
-            record['captured_at'] = datetime.now(timezone.utc)
+            record['captured_at'] = time.time()
+        self._put(_KIND_SNAPSHOT, _project_row(record, _SNAPSHOT_GETTER, _SNAPSHOT_FIELDS))
+
+    def _put(self, kind: str, row: tuple) -> None:
         try:
-            self._queue.put_nowait(record)
+            self._queue.put_nowait((kind, row))
         except queue.Full:
             self._dropped += 1
             if self._dropped % 1000 == 0:
-                logger.warning("ADS-B snapshot queue full, dropped %d records", self._dropped)
+                logger.warning("ADS-B history queue full, dropped %d records", self._dropped)
 
     def _run(self) -> None:
-        batch: list[dict] = []
+        messages: list[tuple] = []
+        snapshots: list[tuple] = []
         last_flush = time.time()
 
         while not self._stop_event.is_set():
             timeout = max(0.0, ADSB_HISTORY_FLUSH_INTERVAL - (time.time() - last_flush))
             try:
-                item = self._queue.get(timeout=timeout)
-                batch.append(item)
+                items = [self._queue.get(timeout=timeout)]
+                pending = len(messages) + len(snapshots) + 1
+                items.extend(drain_queue(self._queue, self._target_batch - pending))
+                for kind, row in items:
+                    if kind == _KIND_MESSAGE:
+                        messages.append(row)
+                    else:
+                        snapshots.append(row)
             except queue.Empty:
                 pass
 
             now = time.time()
-            if batch and (len(batch) >= ADSB_HISTORY_BATCH_SIZE or now - last_flush >= ADSB_HISTORY_FLUSH_INTERVAL):
-                if self._flush(batch):
-                    batch.clear()
+            pending = len(messages) + len(snapshots)
+            if pending and (pending >= self._target_batch or now - last_flush >= ADSB_HISTORY_FLUSH_INTERVAL):
+                if self._flush(messages, snapshots):
                     last_flush = now
+                    self._adjust_batch_target()
+
+    def _adjust_batch_target(self) -> None:
+        """Grow batches while the queue backs up, shrink them once it drains."""
+        maxsize = self._queue.maxsize or ADSB_HISTORY_QUEUE_SIZE
+        depth = self._queue.qsize()
+        if depth > 0.7 * maxsize:
+            self._target_batch = min(self._target_batch * 2, maxsize)
+        elif depth < 0.1 * maxsize:
+            self._target_batch = max(self._target_batch // 2, ADSB_HISTORY_BATCH_SIZE)
 
     def _ensure_connection(self) -> psycopg2.extensions.connection | None:
         if self._conn:
             return self._conn
         try:
             self._conn = psycopg2.connect(_make_dsn())
-            self._conn.autocommit = False
-            self._ensure_schema(self._conn)
+            self._conn.autocommit = True
+            self._prepared = set()
+            if not type(self)._schema_ready:
+                self._ensure_schema(self._conn)
+                type(self)._schema_ready = True
             return self._conn
         except Exception as exc:
-            logger.warning("ADS-B snapshot DB connection failed: %s", exc)
+            logger.warning("ADS-B history DB connection failed: %s", exc)
             self._conn = None
             return None
 
     def _ensure_schema(self, conn: psycopg2.extensions.connection) -> None:
         _ensure_adsb_schema(conn)
 
-    def _flush(self, batch: Iterable[dict]) -> bool:
+    def _flush(self, messages: list[tuple], snapshots: list[tuple]) -> bool:
         conn = self._ensure_connection()
         if not conn:
             time.sleep(2.0)
             return False
 
-        values = []
-        for record in batch:
-            row = []
-            for field in _SNAPSHOT_FIELDS:
-                value = record.get(field)
-                if field == 'snapshot' and value is not None:
-                    value = Json(value)
-                row.append(value)
-            values.append(tuple(row))
-
         try:
-            with conn.cursor() as cur:
-                execute_values(cur, _SNAPSHOT_INSERT_SQL, values)
-            conn.commit()
+            # Each table commits on its own, so clear what has been written
+            # to avoid resending it if the other table fails
+            if messages:
+                _copy_or_insert(
+                    conn,
+                    _MESSAGE_COPY_SQL,
+                    _MESSAGE_TYPES,
+                    _MESSAGE_PREPARE_SQL,
+                    _MESSAGE_EXECUTE_SQL,
+                    messages,
+                    _adapt_timestamp,
+                    self._prepared,
+                )
+                messages.clear()
+            if snapshots:
+                _copy_or_insert(
+                    conn,
+                    _SNAPSHOT_COPY_SQL,
+                    _SNAPSHOT_TYPES,
+                    _SNAPSHOT_PREPARE_SQL,
+                    _SNAPSHOT_EXECUTE_SQL,
+                    snapshots,
+                    _adapt_snapshot_row,
+                    self._prepared,
+                )
+                snapshots.clear()
             return True
         except Exception as exc:
-            logger.warning("ADS-B snapshot insert failed: %s", exc)
-            try:
-                conn.rollback()
-            except Exception:
-                pass
+            logger.warning("ADS-B history insert failed: %s", exc)
             self._conn = None
             time.sleep(2.0)
             return False
 
 
-adsb_snapshot_writer = AdsbSnapshotWriter()
+adsb_writer = AdsbWriter()
@@ -6,15 +6,20 @@ Checks for DBus, BlueZ, adapters, permissions, and fallback tools.
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import os
 import re
 import shutil
 import subprocess
-from typing import Optional
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
 
 from .constants import (
     BLUEZ_SERVICE,
     BLUEZ_PATH,
+    BLUEZ_ADAPTER_INTERFACE,
+    DBUS_OBJECT_MANAGER_INTERFACE,
     SUBPROCESS_TIMEOUT_SHORT,
 )
 from .models import SystemCapabilities
@@ -61,14 +66,28 @@ def check_capabilities() -> SystemCapabilities:
 
 
 def _check_dbus(caps: SystemCapabilities) -> None:
-    """Check if DBus is available."""
-    try:
-        # Try to import dbus module
-        import dbus
-        caps.has_dbus = True
-    except ImportError:
-        caps.has_dbus = False
-        caps.issues.append('Python dbus module not installed (pip install dbus-python)')
+    """Check if the dbus-fast module used by the DBus scanner is available."""
+    caps.has_dbus = importlib.util.find_spec('dbus_fast') is not None
+    if not caps.has_dbus:
+        caps.issues.append('Python dbus-fast module not installed (pip install dbus-fast)')
+
+
+def _run_on_system_bus(probe: Callable[[Any], Awaitable[Any]]) -> Any:
+    """Connect to the system bus, run an async probe against it and disconnect."""
+    from dbus_fast import BusType
+    from dbus_fast.aio import MessageBus
+
+    async def _run():
+        bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        try:
+            return await probe(bus)
+        finally:
+            bus.disconnect()
+
+    async def _run_bounded():
+        return await asyncio.wait_for(_run(), timeout=SUBPROCESS_TIMEOUT_SHORT)
+
+    return asyncio.run(_run_bounded())
 
 
 def _check_bluez(caps: SystemCapabilities) -> None:
@@ -77,12 +96,11 @@ def _check_bluez(caps: SystemCapabilities) -> None:
         return
 
     try:
-        import dbus
-        bus = dbus.SystemBus()
+        from dbus_fast.errors import DBusError
 
         # Check if BlueZ service exists
         try:
-            obj = bus.get_object(BLUEZ_SERVICE, BLUEZ_PATH)
+            _run_on_system_bus(lambda bus: bus.introspect(BLUEZ_SERVICE, BLUEZ_PATH))
             caps.has_bluez = True
 
             # Try to get BlueZ version from bluetoothd
@@ -98,9 +116,9 @@ def _check_bluez(caps: SystemCapabilities) -> None:
             except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
                 pass
 
-        except dbus.exceptions.DBusException as e:
+        except DBusError as e:
             caps.has_bluez = False
-            if 'org.freedesktop.DBus.Error.ServiceUnknown' in str(e):
+            if e.type == 'org.freedesktop.DBus.Error.ServiceUnknown':
                 caps.issues.append('BlueZ service not running (systemctl start bluetooth)')
             else:
                 caps.issues.append(f'BlueZ DBus error: {e}')
@@ -110,6 +128,15 @@ def _check_bluez(caps: SystemCapabilities) -> None:
         caps.issues.append(f'DBus connection error: {e}')
 
 
+async def _get_managed_objects(bus) -> dict:
+    """Fetch BlueZ's managed objects with variants unpacked to plain values."""
+    introspection = await bus.introspect(BLUEZ_SERVICE, '/')
+    manager = bus.get_proxy_object(
+        BLUEZ_SERVICE, '/', introspection
+    ).get_interface(DBUS_OBJECT_MANAGER_INTERFACE)
+    return await manager.call_get_managed_objects(unpack_variants=True)
+
+
 def _check_adapters(caps: SystemCapabilities) -> None:
     """Check available Bluetooth adapters."""
     if not caps.has_dbus or not caps.has_bluez:
@@ -118,20 +145,13 @@ def _check_adapters(caps: SystemCapabilities) -> None:
         return
 
     try:
-        import dbus
-        bus = dbus.SystemBus()
-        manager = dbus.Interface(
-            bus.get_object(BLUEZ_SERVICE, '/'),
-            'org.freedesktop.DBus.ObjectManager'
-        )
-
-        objects = manager.GetManagedObjects()
+        objects = _run_on_system_bus(_get_managed_objects)
         for path, interfaces in objects.items():
-            if 'org.bluez.Adapter1' in interfaces:
-                adapter_props = interfaces['org.bluez.Adapter1']
+            if BLUEZ_ADAPTER_INTERFACE in interfaces:
+                adapter_props = interfaces[BLUEZ_ADAPTER_INTERFACE]
                 adapter_info = {
-                    'id': str(path),  # Alias for frontend
-                    'path': str(path),
+                    'id': path,  # Alias for frontend
+                    'path': path,
                     'name': str(adapter_props.get('Name', 'Unknown')),
                     'address': str(adapter_props.get('Address', 'Unknown')),
                     'powered': bool(adapter_props.get('Powered', False)),
@@ -142,7 +162,7 @@ def _check_adapters(caps: SystemCapabilities) -> None:
 
                 # Set default adapter if not set
                 if caps.default_adapter is None:
-                    caps.default_adapter = str(path)
+                    caps.default_adapter = path
 
         if not caps.adapters:
             caps.issues.append('No Bluetooth adapters found')
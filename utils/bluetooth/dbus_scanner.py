@@ -1,15 +1,26 @@
 """
 DBus-based BlueZ scanner for Bluetooth device discovery.
 
-Uses org.bluez signals for real-time device discovery.
+Uses org.bluez signals for real-time device discovery. The bus is driven by
+dbus-fast on an asyncio loop in a dedicated thread, which avoids libdbus
+marshalling and the GLib mainloop.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
+
+try:
+    from dbus_fast import BusType, Message, MessageType, Variant, unpack_variants
+    from dbus_fast.aio import MessageBus
+    from dbus_fast.errors import DBusError
+    DBUS_FAST_AVAILABLE = True
+except ImportError:
+    DBUS_FAST_AVAILABLE = False
 
 from .constants import (
     BLUEZ_SERVICE,
@@ -21,7 +32,6 @@ from .constants import (
     DISCOVERY_FILTER_TRANSPORT,
     DISCOVERY_FILTER_RSSI,
     DISCOVERY_FILTER_DUPLICATE_DATA,
-    ADDRESS_TYPE_PUBLIC,
     ADDRESS_TYPE_RANDOM,
     MAJOR_DEVICE_CLASSES,
     MINOR_AUDIO_VIDEO,
@@ -34,6 +44,180 @@ from .models import BTObservation
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for the bus thread to connect and start discovery
+START_TIMEOUT = 10.0
+
+# Observations are coalesced per address and delivered at this interval,
+# or sooner once this many addresses are pending
+COALESCE_INTERVAL = 0.05
+COALESCE_MAX_PENDING = 256
+
+# Match rule for device property updates. The bus daemon applies the
+# sender, arg0 and path filters, so PropertiesChanged from other services
+# (NetworkManager, UPower, ...) or other BlueZ interfaces never reach us.
+PROPERTIES_CHANGED_RULE = (
+    f"type='signal',sender='{BLUEZ_SERVICE}',"
+    f"interface='{DBUS_PROPERTIES_INTERFACE}',member='PropertiesChanged',"
+    f"arg0='{BLUEZ_DEVICE_INTERFACE}',path_namespace='{BLUEZ_PATH}'"
+)
+
+def _build_class_of_device_table() -> dict[int, tuple[Optional[str], Optional[str]]]:
+    """
+    Precompute (major, minor) class names for every major/minor combination.
+
+    Keys are the 11 class bits of a Class of Device value, i.e.
+    (major << 6) | minor.
+    """
+    minor_tables = {
+        0x01: MINOR_COMPUTER,
+        0x02: MINOR_PHONE,
+        0x04: MINOR_AUDIO_VIDEO,
+        0x07: MINOR_WEARABLE,
+    }
+    table = {}
+    for major_num in range(0x20):
+        major_class = MAJOR_DEVICE_CLASSES.get(major_num)
+        minor_table = minor_tables.get(major_num, {})
+        for minor_num in range(0x40):
+            if major_num == 0x05:  # Peripheral only keys on the low two bits
+                minor_class = MINOR_PERIPHERAL.get(minor_num & 0x03)
+            else:
+                minor_class = minor_table.get(minor_num)
+            if major_class is not None or minor_class is not None:
+                table[(major_num << 6) | minor_num] = (major_class, minor_class)
+    return table
+
+
+_COD_TABLE = _build_class_of_device_table()
+
+
+def _decode_class_of_device(cod: int) -> tuple[Optional[str], Optional[str]]:
+    """Decode Bluetooth Class of Device."""
+    # Major class is bits 12-8, minor class bits 7-2
+    return _COD_TABLE.get((cod >> 2) & 0x7FF, (None, None))
+
+
+# =============================================================================
+# Device1 property decoders
+#
+# Each decoder writes BTObservation keyword arguments into `out`. Properties
+# are dispatched by key, so only the keys actually present get decoded.
+# =============================================================================
+
+def _decode_address(value: Any, out: dict) -> None:
+    # Uppercased once here; deltas reuse the decoded value
+    out['address'] = str(value).upper()
+
+
+def _decode_address_type(value: Any, out: dict) -> None:
+    if value and 'random' in str(value).lower():
+        out['address_type'] = ADDRESS_TYPE_RANDOM
+
+
+def _decode_name(value: Any, out: dict) -> None:
+    out['name'] = str(value)
+
+
+def _decode_alias(value: Any, out: dict) -> None:
+    # Only used as the name when Name is absent; resolved by the caller
+    out['alias'] = value
+
+
+# dbus-fast already delivers integers as int, so the numeric decoders only
+# call int() for anything else. The check is inlined; a helper call would
+# cost more than the int() it avoids.
+
+def _decode_rssi(value: Any, out: dict) -> None:
+    out['rssi'] = value if type(value) is int else int(value)
+
+
+def _decode_tx_power(value: Any, out: dict) -> None:
+    out['tx_power'] = value if type(value) is int else int(value)
+
+
+def _decode_manufacturer_data(value: Any, out: dict) -> None:
+    for mid, mdata in value.items():
+        out['manufacturer_id'] = int(mid)
+        # bytes() takes bytes, bytearray and int sequences directly
+        try:
+            out['manufacturer_data'] = (
+                bytes.fromhex(mdata) if isinstance(mdata, str) else bytes(mdata)
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not convert manufacturer data: {e}")
+        break
+
+
+def _decode_uuids(value: Any, out: dict) -> None:
+    out['service_uuids'] = list(map(str, value))
+
+
+def _decode_service_data(value: Any, out: dict) -> None:
+    try:
+        out['service_data'] = {
+            str(uuid): bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+            for uuid, data in value.items()
+        }
+        return
+    except (TypeError, ValueError):
+        pass
+
+    # Retry entry by entry so one malformed payload only drops itself
+    service_data = {}
+    for uuid, data in value.items():
+        try:
+            service_data[str(uuid)] = (
+                bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not convert service data for {uuid}: {e}")
+    out['service_data'] = service_data
+
+
+def _decode_class(value: Any, out: dict) -> None:
+    class_of_device = value if type(value) is int else int(value)
+    out['class_of_device'] = class_of_device
+    out['major_class'], out['minor_class'] = _decode_class_of_device(class_of_device)
+
+
+def _decode_connected(value: Any, out: dict) -> None:
+    out['is_connected'] = bool(value)
+
+
+def _decode_paired(value: Any, out: dict) -> None:
+    out['is_paired'] = bool(value)
+
+
+def _decode_appearance(value: Any, out: dict) -> None:
+    out['appearance'] = value if type(value) is int else int(value)
+
+
+_DECODERS: dict[str, Callable[[Any, dict], None]] = {
+    'Address': _decode_address,
+    'AddressType': _decode_address_type,
+    'Name': _decode_name,
+    'Alias': _decode_alias,
+    'RSSI': _decode_rssi,
+    'TxPower': _decode_tx_power,
+    'ManufacturerData': _decode_manufacturer_data,
+    'UUIDs': _decode_uuids,
+    'ServiceData': _decode_service_data,
+    'Class': _decode_class,
+    'Connected': _decode_connected,
+    'Paired': _decode_paired,
+    'Appearance': _decode_appearance,
+}
+
+
+def _decode_properties(props: dict) -> dict[str, Any]:
+    """Decode every known Device1 property into observation fields."""
+    fields: dict[str, Any] = {}
+    for key, value in props.items():
+        decoder = _DECODERS.get(key)
+        if decoder is not None:
+            decoder(value, fields)
+    return fields
+
 
 class DBusScanner:
     """
@@ -55,14 +239,31 @@ class DBusScanner:
             on_observation: Callback for new observations.
         """
         self._adapter_path = adapter_path
+        self._dev_prefix = f"{adapter_path}/dev_" if adapter_path else None
+        self._rssi_threshold: Optional[int] = None
         self._on_observation = on_observation
         self._bus = None
         self._adapter = None
-        self._mainloop = None
-        self._mainloop_thread: Optional[threading.Thread] = None
-        self._is_scanning = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._stop_requested: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._started = False
+        self._error: Optional[BaseException] = None
+        # Last known Device1 properties per object path, kept current from
+        # signals so property updates never need a GetAll round-trip
+        self._prop_cache: dict[str, dict] = {}
+        # Decoded observation fields per object path, patched in place by
+        # deltas so unchanged payloads are not decoded again
+        self._decoded: dict[str, dict] = {}
+        # Latest observation fields per address awaiting delivery
+        self._pending: dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+        self._dispatch_wakeup = threading.Event()
+        self._dispatch_stop = threading.Event()
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._is_scanning = threading.Event()
         self._lock = threading.Lock()
-        self._known_devices: set[str] = set()
 
     def start(self, transport: str = 'auto', rssi_threshold: int = -100) -> bool:
         """
@@ -75,172 +276,297 @@ class DBusScanner:
         Returns:
             True if started successfully, False otherwise.
         """
-        try:
-            import dbus
-            from dbus.mainloop.glib import DBusGMainLoop
-            from gi.repository import GLib
-
-            with self._lock:
-                if self._is_scanning:
-                    return True
-
-                # Set up DBus mainloop
-                DBusGMainLoop(set_as_default=True)
-                self._bus = dbus.SystemBus()
-
-                # Get adapter
-                if not self._adapter_path:
-                    self._adapter_path = self._find_default_adapter()
-
-                if not self._adapter_path:
-                    logger.error("No Bluetooth adapter found")
-                    return False
-
-                adapter_obj = self._bus.get_object(BLUEZ_SERVICE, self._adapter_path)
-                self._adapter = dbus.Interface(adapter_obj, BLUEZ_ADAPTER_INTERFACE)
-                adapter_props = dbus.Interface(adapter_obj, DBUS_PROPERTIES_INTERFACE)
-
-                # Set up signal handlers
-                self._bus.add_signal_receiver(
-                    self._on_interfaces_added,
-                    signal_name='InterfacesAdded',
-                    dbus_interface=DBUS_OBJECT_MANAGER_INTERFACE,
-                    bus_name=BLUEZ_SERVICE,
-                )
+        if not DBUS_FAST_AVAILABLE:
+            logger.error("Missing DBus dependencies: dbus-fast is not installed")
+            return False
 
-                self._bus.add_signal_receiver(
-                    self._on_properties_changed,
-                    signal_name='PropertiesChanged',
-                    dbus_interface=DBUS_PROPERTIES_INTERFACE,
-                    path_keyword='path',
-                )
+        with self._lock:
+            if self._is_scanning.is_set():
+                return True
 
-                # Set discovery filter
-                try:
-                    filter_dict = {
-                        'Transport': dbus.String(transport if transport != 'auto' else 'auto'),
-                        'DuplicateData': dbus.Boolean(DISCOVERY_FILTER_DUPLICATE_DATA),
-                    }
-                    if rssi_threshold > -100:
-                        filter_dict['RSSI'] = dbus.Int16(rssi_threshold)
-
-                    self._adapter.SetDiscoveryFilter(filter_dict)
-                except dbus.exceptions.DBusException as e:
-                    logger.warning(f"Failed to set discovery filter: {e}")
-
-                # Start discovery
-                try:
-                    self._adapter.StartDiscovery()
-                except dbus.exceptions.DBusException as e:
-                    if 'InProgress' not in str(e):
-                        logger.error(f"Failed to start discovery: {e}")
-                        return False
-
-                # Process existing devices
-                self._process_existing_devices()
-
-                # Start mainloop in background thread
-                self._mainloop = GLib.MainLoop()
-                self._mainloop_thread = threading.Thread(
-                    target=self._run_mainloop,
-                    daemon=True
+            # A start already in progress is joined rather than duplicated
+            if self._loop_thread is None:
+                self._ready.clear()
+                self._started = False
+                self._error = None
+                self._rssi_threshold = rssi_threshold if rssi_threshold > -100 else None
+                self._dispatch_stop.clear()
+                self._dispatch_thread = threading.Thread(
+                    target=self._run_dispatcher,
+                    name='bluez-dbus-dispatch',
+                    daemon=True,
+                )
+                self._dispatch_thread.start()
+                self._loop_thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(transport, rssi_threshold),
+                    name='bluez-dbus',
+                    daemon=True,
                 )
-                self._mainloop_thread.start()
+                self._loop_thread.start()
 
-                self._is_scanning = True
+        # Setup runs on the bus thread; wait for it without holding the lock
+        # so stop() and is_scanning stay responsive meanwhile
+        ready = self._ready.wait(timeout=START_TIMEOUT)
+
+        with self._lock:
+            if self._is_scanning.is_set():
+                return True
+
+            # _loop_thread is cleared if stop() ran while we were waiting
+            if ready and self._started and self._loop_thread is not None:
+                self._is_scanning.set()
                 logger.info(f"DBus scanner started on {self._adapter_path}")
                 return True
 
-        except ImportError as e:
-            logger.error(f"Missing DBus dependencies: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to start DBus scanner: {e}")
+            if not ready:
+                self._error = TimeoutError("Timed out starting DBus scanner")
+                logger.error(str(self._error))
+            self._shutdown_loop()
             return False
 
     def stop(self) -> None:
         """Stop DBus discovery."""
         with self._lock:
-            if not self._is_scanning:
+            if not self._is_scanning.is_set() and self._loop_thread is None:
                 return
 
             try:
-                if self._adapter:
-                    try:
-                        self._adapter.StopDiscovery()
-                    except Exception as e:
-                        logger.debug(f"StopDiscovery error (expected): {e}")
-
-                if self._mainloop and self._mainloop.is_running():
-                    self._mainloop.quit()
-
-                if self._mainloop_thread:
-                    self._mainloop_thread.join(timeout=2.0)
-
+                self._shutdown_loop()
             except Exception as e:
                 logger.error(f"Error stopping DBus scanner: {e}")
             finally:
-                self._is_scanning = False
-                self._adapter = None
-                self._bus = None
-                self._mainloop = None
-                self._mainloop_thread = None
+                self._is_scanning.clear()
                 logger.info("DBus scanner stopped")
 
     @property
     def is_scanning(self) -> bool:
         """Check if scanner is active."""
-        with self._lock:
-            return self._is_scanning
+        # Event.is_set() needs no lock, so pollers never contend with start/stop
+        return self._is_scanning.is_set()
+
+    @property
+    def last_error(self) -> Optional[BaseException]:
+        """Exception that caused the most recent start() to fail, if any."""
+        return self._error
+
+    def _shutdown_loop(self) -> None:
+        """Ask the bus thread to stop discovery and wait for it to exit."""
+        loop = self._loop
+        if loop and self._stop_requested:
+            try:
+                loop.call_soon_threadsafe(self._stop_requested.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+        if self._loop_thread:
+            self._loop_thread.join(timeout=2.0)
+
+        self._dispatch_stop.set()
+        self._dispatch_wakeup.set()
+        if self._dispatch_thread:
+            self._dispatch_thread.join(timeout=2.0)
+
+        self._loop_thread = None
+        self._dispatch_thread = None
+        self._loop = None
+        self._stop_requested = None
+
+    def _run_dispatcher(self) -> None:
+        """Deliver coalesced observations off the bus thread."""
+        while not self._dispatch_stop.is_set():
+            self._dispatch_wakeup.wait(COALESCE_INTERVAL)
+            self._dispatch_wakeup.clear()
+            self._flush_pending()
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Build and deliver one observation per pending address."""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+        timestamp = datetime.now()
+        for address, fields in pending.items():
+            try:
+                observation = BTObservation(
+                    timestamp=timestamp,
+                    address=address,
+                    is_connectable=True,  # If we see it in BlueZ, it's connectable
+                    adapter_id=self._adapter_path,
+                    **fields,
+                )
+                if self._on_observation:
+                    self._on_observation(observation)
+            except Exception as e:
+                logger.error(f"Failed to deliver observation for {address}: {e}")
 
-    def _run_mainloop(self) -> None:
-        """Run the GLib mainloop."""
+    def _run_loop(self, transport: str, rssi_threshold: int) -> None:
+        """Run the asyncio loop that owns the bus connection."""
         try:
-            self._mainloop.run()
+            asyncio.run(self._main(transport, rssi_threshold))
         except Exception as e:
-            logger.error(f"Mainloop error: {e}")
+            self._error = self._error or e
+            logger.error(f"DBus loop error: {e}")
+        finally:
+            self._ready.set()
+
+    async def _main(self, transport: str, rssi_threshold: int) -> None:
+        """Set up discovery, then service signals until stop is requested."""
+        self._stop_requested = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
 
-    def _find_default_adapter(self) -> Optional[str]:
-        """Find the default Bluetooth adapter via DBus."""
         try:
-            import dbus
-            manager = dbus.Interface(
-                self._bus.get_object(BLUEZ_SERVICE, '/'),
-                DBUS_OBJECT_MANAGER_INTERFACE
-            )
+            try:
+                await self._setup(transport, rssi_threshold)
+                self._started = True
+            except Exception as e:
+                self._error = e
+                logger.error(f"Failed to start DBus scanner: {e}")
+            self._ready.set()
 
-            objects = manager.GetManagedObjects()
-            for path, interfaces in objects.items():
-                if BLUEZ_ADAPTER_INTERFACE in interfaces:
-                    return str(path)
-            return None
-        except Exception as e:
-            logger.error(f"Failed to find adapter: {e}")
-            return None
+            if self._started:
+                await self._stop_requested.wait()
+                if self._adapter:
+                    try:
+                        await self._adapter.call_stop_discovery()
+                    except Exception as e:
+                        logger.debug(f"StopDiscovery error (expected): {e}")
+        finally:
+            if self._bus:
+                self._bus.disconnect()
+            self._bus = None
+            self._adapter = None
+            self._prop_cache.clear()
+            self._decoded.clear()
+
+    async def _setup(self, transport: str, rssi_threshold: int) -> None:
+        """
+        Connect to the system bus, subscribe to signals and start discovery.
 
-    def _process_existing_devices(self) -> None:
-        """Process devices that already exist in BlueZ."""
+        Raises:
+            Exception: If no adapter is found or discovery cannot be started.
+        """
+        self._bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+
+        introspection = await self._bus.introspect(BLUEZ_SERVICE, '/')
+        manager = self._bus.get_proxy_object(
+            BLUEZ_SERVICE, '/', introspection
+        ).get_interface(DBUS_OBJECT_MANAGER_INTERFACE)
+
+        # Set up signal handlers before taking the snapshot so nothing added
+        # in between is missed. Until setup completes they only update the
+        # property cache.
+        manager.on_interfaces_added(self._on_interfaces_added, unpack_variants=True)
+        manager.on_interfaces_removed(self._on_interfaces_removed)
+
+        await self._call(Message(
+            destination='org.freedesktop.DBus',
+            path='/org/freedesktop/DBus',
+            interface='org.freedesktop.DBus',
+            member='AddMatch',
+            signature='s',
+            body=[PROPERTIES_CHANGED_RULE],
+        ))
+        self._bus.add_message_handler(self._on_message)
+
+        # Get adapter
+        default_adapter = await self._load_managed_objects(manager)
+        if not self._adapter_path:
+            self._adapter_path = default_adapter
+
+        if not self._adapter_path:
+            raise RuntimeError("No Bluetooth adapter found")
+
+        # Device paths of this adapter, e.g. /org/bluez/hci0/dev_AA_BB_...
+        self._dev_prefix = f"{self._adapter_path}/dev_"
+
+        introspection = await self._bus.introspect(BLUEZ_SERVICE, self._adapter_path)
+        self._adapter = self._bus.get_proxy_object(
+            BLUEZ_SERVICE, self._adapter_path, introspection
+        ).get_interface(BLUEZ_ADAPTER_INTERFACE)
+
+        # Set discovery filter
         try:
-            import dbus
-            manager = dbus.Interface(
-                self._bus.get_object(BLUEZ_SERVICE, '/'),
-                DBUS_OBJECT_MANAGER_INTERFACE
-            )
+            filter_dict = {
+                'Transport': Variant('s', transport if transport != 'auto' else 'auto'),
+                'DuplicateData': Variant('b', DISCOVERY_FILTER_DUPLICATE_DATA),
+            }
+            if rssi_threshold > -100:
+                filter_dict['RSSI'] = Variant('n', rssi_threshold)
+
+            await self._adapter.call_set_discovery_filter(filter_dict)
+        except DBusError as e:
+            logger.warning(f"Failed to set discovery filter: {e}")
+
+        # Start discovery
+        try:
+            await self._adapter.call_start_discovery()
+        except DBusError as e:
+            if e.type != 'org.bluez.Error.InProgress':
+                raise
+
+        # Process existing devices
+        self._process_existing_devices()
+
+    async def _call(self, msg: Message) -> Message:
+        """Send a method call and raise DBusError on an error reply."""
+        reply = await self._bus.call(msg)
+        if reply.message_type == MessageType.ERROR:
+            raise DBusError(reply.error_name, str(reply.body))
+        return reply
+
+    async def _load_managed_objects(self, manager) -> Optional[str]:
+        """
+        Seed the property cache from a single GetManagedObjects call.
 
-            objects = manager.GetManagedObjects()
+        Returns:
+            Path of the first adapter found, or None.
+        """
+        adapter_path = None
+        try:
+            objects = await manager.call_get_managed_objects(unpack_variants=True)
             for path, interfaces in objects.items():
                 if BLUEZ_DEVICE_INTERFACE in interfaces:
-                    props = interfaces[BLUEZ_DEVICE_INTERFACE]
-                    self._process_device_properties(str(path), props)
-
+                    self._prop_cache[path] = interfaces[BLUEZ_DEVICE_INTERFACE]
+                elif adapter_path is None and BLUEZ_ADAPTER_INTERFACE in interfaces:
+                    adapter_path = path
         except Exception as e:
-            logger.error(f"Failed to process existing devices: {e}")
+            logger.error(f"Failed to get managed objects: {e}")
+        return adapter_path
+
+    def _process_existing_devices(self) -> None:
+        """Process devices that already exist in BlueZ."""
+        for path, props in list(self._prop_cache.items()):
+            self._process_device_properties(path, props)
+
+    def _on_message(self, msg: Message) -> None:
+        """Route PropertiesChanged signals from the bus."""
+        if (
+            msg.message_type != MessageType.SIGNAL
+            or msg.member != 'PropertiesChanged'
+            or msg.interface != DBUS_PROPERTIES_INTERFACE
+        ):
+            return
+
+        interface, changed, invalidated = msg.body
+        self._on_properties_changed(interface, changed, invalidated, path=msg.path)
 
     def _on_interfaces_added(self, path: str, interfaces: dict) -> None:
         """Handle InterfacesAdded signal (new device discovered)."""
         if BLUEZ_DEVICE_INTERFACE in interfaces:
             props = interfaces[BLUEZ_DEVICE_INTERFACE]
-            self._process_device_properties(str(path), props)
+            self._prop_cache[path] = props
+            if self._started:
+                self._process_device_properties(path, props)
+
+    def _on_interfaces_removed(self, path: str, interfaces: list) -> None:
+        """Handle InterfacesRemoved signal (device removed from BlueZ)."""
+        if BLUEZ_DEVICE_INTERFACE in interfaces:
+            self._prop_cache.pop(path, None)
+            self._decoded.pop(path, None)
 
     def _on_properties_changed(
         self,
@@ -253,163 +579,80 @@ class DBusScanner:
         if interface != BLUEZ_DEVICE_INTERFACE:
             return
 
-        if path and '/dev_' in path:
-            try:
-                import dbus
-                device_obj = self._bus.get_object(BLUEZ_SERVICE, path)
-                props_iface = dbus.Interface(device_obj, DBUS_PROPERTIES_INTERFACE)
-                all_props = props_iface.GetAll(BLUEZ_DEVICE_INTERFACE)
-                self._process_device_properties(path, all_props)
-            except Exception as e:
-                logger.debug(f"Failed to get device properties for {path}: {e}")
+        if path is not None and self._dev_prefix and path.startswith(self._dev_prefix):
+            # Merge the delta into the cached properties instead of
+            # re-reading the whole device
+            delta = unpack_variants(changed)
+            cached = self._prop_cache.setdefault(path, {})
+            cached.update(delta)
+            for key in invalidated:
+                cached.pop(key, None)
+            # Without an address the device has not been announced yet;
+            # its InterfacesAdded will carry the full property set
+            if 'Address' not in cached:
+                return
+            if self._started:
+                # Invalidated keys need their fields reset, so decode in full
+                self._process_device_properties(
+                    path, cached, changed=None if invalidated else delta
+                )
 
-    def _process_device_properties(self, path: str, props: dict) -> None:
-        """Convert BlueZ device properties to BTObservation."""
+    def _process_device_properties(
+        self,
+        path: str,
+        props: dict,
+        changed: Optional[dict] = None,
+    ) -> None:
+        """
+        Decode BlueZ device properties and queue them as an observation.
+
+        Args:
+            path: Device object path.
+            props: Full (cached) Device1 properties.
+            changed: Properties that changed since the last call for this
+                path. When given, only these are decoded and the rest of the
+                fields are reused from the previous decode.
+        """
         try:
-            import dbus
+            # Out-of-range devices are dropped before any payload decoding.
+            # Their decoded fields are discarded too, since deltas are not
+            # applied while skipped.
+            rssi = props.get('RSSI')
+            if (
+                rssi is not None
+                and self._rssi_threshold is not None
+                and rssi < self._rssi_threshold
+            ):
+                self._decoded.pop(path, None)
+                return
 
-            address = str(props.get('Address', ''))
+            previous = self._decoded.get(path) if changed is not None else None
+            if previous is None:
+                decoded = _decode_properties(props)
+            else:
+                decoded = previous.copy()
+                for key, value in changed.items():
+                    decoder = _DECODERS.get(key)
+                    if decoder is not None:
+                        decoder(value, decoded)
+            self._decoded[path] = decoded
+
+            fields = decoded.copy()
+            address = fields.pop('address', '')
             if not address:
                 return
 
-            # Determine address type
-            address_type = ADDRESS_TYPE_PUBLIC
-            addr_type_raw = props.get('AddressType', 'public')
-            if addr_type_raw:
-                addr_type_str = str(addr_type_raw).lower()
-                if 'random' in addr_type_str:
-                    address_type = ADDRESS_TYPE_RANDOM
-
-            # Extract name
-            name = None
-            if 'Name' in props:
-                name = str(props['Name'])
-            elif 'Alias' in props and props['Alias'] != address:
-                name = str(props['Alias'])
-
-            # Extract RSSI
-            rssi = None
-            if 'RSSI' in props:
-                rssi = int(props['RSSI'])
-
-            # Extract TX Power
-            tx_power = None
-            if 'TxPower' in props:
-                tx_power = int(props['TxPower'])
-
-            # Extract manufacturer data
-            manufacturer_id = None
-            manufacturer_data = None
-            if 'ManufacturerData' in props:
-                mfr_data = props['ManufacturerData']
-                if mfr_data:
-                    for mid, mdata in mfr_data.items():
-                        manufacturer_id = int(mid)
-                        # Handle various DBus data types safely
-                        try:
-                            if isinstance(mdata, (bytes, bytearray)):
-                                manufacturer_data = bytes(mdata)
-                            elif isinstance(mdata, dbus.Array):
-                                manufacturer_data = bytes(mdata)
-                            elif isinstance(mdata, (list, tuple)):
-                                manufacturer_data = bytes(mdata)
-                            elif isinstance(mdata, str):
-                                manufacturer_data = bytes.fromhex(mdata)
-                        except (TypeError, ValueError) as e:
-                            logger.debug(f"Could not convert manufacturer data: {e}")
-                        break
-
-            # Extract service UUIDs
-            service_uuids = []
-            if 'UUIDs' in props:
-                for uuid in props['UUIDs']:
-                    service_uuids.append(str(uuid))
-
-            # Extract service data
-            service_data = {}
-            if 'ServiceData' in props:
-                for uuid, data in props['ServiceData'].items():
-                    try:
-                        if isinstance(data, (bytes, bytearray)):
-                            service_data[str(uuid)] = bytes(data)
-                        elif isinstance(data, dbus.Array):
-                            service_data[str(uuid)] = bytes(data)
-                        elif isinstance(data, (list, tuple)):
-                            service_data[str(uuid)] = bytes(data)
-                        elif isinstance(data, str):
-                            service_data[str(uuid)] = bytes.fromhex(data)
-                    except (TypeError, ValueError) as e:
-                        logger.debug(f"Could not convert service data for {uuid}: {e}")
-
-            # Extract Class of Device (Classic BT)
-            class_of_device = None
-            major_class = None
-            minor_class = None
-            if 'Class' in props:
-                class_of_device = int(props['Class'])
-                major_class, minor_class = self._decode_class_of_device(class_of_device)
-
-            # Connection state
-            is_connected = bool(props.get('Connected', False))
-            is_paired = bool(props.get('Paired', False))
-
-            # Appearance
-            appearance = None
-            if 'Appearance' in props:
-                appearance = int(props['Appearance'])
-
-            # Create observation
-            observation = BTObservation(
-                timestamp=datetime.now(),
-                address=address.upper(),
-                address_type=address_type,
-                rssi=rssi,
-                tx_power=tx_power,
-                name=name,
-                manufacturer_id=manufacturer_id,
-                manufacturer_data=manufacturer_data,
-                service_uuids=service_uuids,
-                service_data=service_data,
-                appearance=appearance,
-                is_connectable=True,  # If we see it in BlueZ, it's connectable
-                is_paired=is_paired,
-                is_connected=is_connected,
-                class_of_device=class_of_device,
-                major_class=major_class,
-                minor_class=minor_class,
-                adapter_id=self._adapter_path,
-            )
-
-            # Callback
-            if self._on_observation:
-                self._on_observation(observation)
+            alias = fields.pop('alias', None)
+            if 'name' not in fields and alias is not None and alias != address:
+                fields['name'] = str(alias)
 
-            self._known_devices.add(address)
+            # Queue for delivery; a burst of updates for one address
+            # collapses into a single observation
+            with self._pending_lock:
+                self._pending[address] = fields
+                backlog = len(self._pending)
+            if backlog >= COALESCE_MAX_PENDING:
+                self._dispatch_wakeup.set()
 
         except Exception as e:
             logger.error(f"Failed to process device properties: {e}")
-
-    def _decode_class_of_device(self, cod: int) -> tuple[Optional[str], Optional[str]]:
-        """Decode Bluetooth Class of Device."""
-        # Major class is bits 12-8 (5 bits)
-        major_num = (cod >> 8) & 0x1F
-
-        # Minor class is bits 7-2 (6 bits)
-        minor_num = (cod >> 2) & 0x3F
-
-        major_class = MAJOR_DEVICE_CLASSES.get(major_num)
-
-        # Get minor class based on major class
-        minor_class = None
-        if major_num == 0x04:  # Audio/Video
-            minor_class = MINOR_AUDIO_VIDEO.get(minor_num)
-        elif major_num == 0x02:  # Phone
-            minor_class = MINOR_PHONE.get(minor_num)
-        elif major_num == 0x01:  # Computer
-            minor_class = MINOR_COMPUTER.get(minor_num)
-        elif major_num == 0x05:  # Peripheral
-            minor_class = MINOR_PERIPHERAL.get(minor_num & 0x03)
-        elif major_num == 0x07:  # Wearable
-            minor_class = MINOR_WEARABLE.get(minor_num)
-
-        return major_class, minor_class
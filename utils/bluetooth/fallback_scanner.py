@@ -11,12 +11,19 @@ Supports:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import importlib.util
 import logging
+import os
 import re
+import select
+import shutil
 import subprocess
+import sys
 import threading
+import time
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from .constants import (
     BLEAK_SCAN_TIMEOUT,
@@ -30,6 +37,235 @@ from .models import BTObservation
 
 logger = logging.getLogger(__name__)
 
+# bluetoothctl discovery lines, e.g.:
+#   [NEW] Device AA:BB:CC:DD:EE:FF DeviceName
+#   [CHG] Device AA:BB:CC:DD:EE:FF RSSI: -65
+#   [CHG] Device AA:BB:CC:DD:EE:FF Name: DeviceName
+# The tag and "Device " are fixed width, so the address always sits at
+# [13:30] on an unprefixed line.
+_BTCTL_PREFIXES = ('[NEW] Device ', '[CHG] Device ')
+_BTCTL_ADDR_START = 13
+_BTCTL_ADDR_END = _BTCTL_ADDR_START + 17
+
+# Slow-path patterns for lines the fixed-width parsers reject
+_RE_HCITOOL = re.compile(r'^([0-9A-Fa-f:]{17})\s*(.*)$')
+_RE_BTCTL = re.compile(
+    r'\[(NEW|CHG)\]\s+Device\s+([0-9A-Fa-f:]{17})(?:\s+(RSSI|Name):)?\s*(.*)'
+)
+
+# Advertisements arrive in bursts; observations within this window share
+# one timestamp instead of each reading the wall clock.
+_TIMESTAMP_RESOLUTION = 0.001
+_now_cache: tuple[float, datetime] = (float('-inf'), datetime.min)
+
+
+def _normalize_address(address: str) -> str:
+    """
+    Uppercase and intern a BD_ADDR.
+
+    The same few addresses repeat for every advertisement, so interning
+    lets them share one string object (and its cached hash) downstream.
+    """
+    return sys.intern(address if address.isupper() else address.upper())
+
+
+def _now_cached() -> datetime:
+    """Return datetime.now(), reusing the last value for up to 1 ms."""
+    global _now_cache
+    mono = time.monotonic()
+    last, ts = _now_cache
+    if mono - last < _TIMESTAMP_RESOLUTION:
+        return ts
+    ts = datetime.now()
+    _now_cache = (mono, ts)
+    return ts
+
+
+# How often a reader without a wake pipe rechecks its stop event
+_READ_POLL_INTERVAL = 0.5
+_READ_CHUNK_SIZE = 65536
+
+
+class _WakePipe:
+    """Self-pipe that lets stop() interrupt a reader blocked in select()."""
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def wake(self) -> None:
+        try:
+            os.write(self._write_fd, b'x')
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        for fd in (self._read_fd, self._write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def _read_lines(
+    stream,
+    stop_event: threading.Event,
+    wake: Optional[_WakePipe] = None,
+) -> Iterator[str]:
+    """
+    Yield lines from a binary subprocess pipe until EOF or stop_event.
+
+    Each wakeup drains everything the pipe has buffered with one read,
+    instead of a read per line. With a wake pipe the reader blocks until
+    output arrives or wake() is called; without one it polls stop_event.
+    """
+    fd = stream.fileno()
+    os.set_blocking(fd, False)
+    watched = [fd, wake.fileno()] if wake else [fd]
+    timeout = None if wake else _READ_POLL_INTERVAL
+    buffer = b''
+    while not stop_event.is_set():
+        ready, _, _ = select.select(watched, [], [], timeout)
+        if wake and wake.fileno() in ready:
+            return
+        if not ready:
+            continue
+        try:
+            chunk = os.read(fd, _READ_CHUNK_SIZE)
+        except BlockingIOError:
+            continue
+        if not chunk:
+            if buffer:
+                yield buffer.decode('utf-8', 'replace')
+            return
+
+        *lines, buffer = (buffer + chunk).split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8', 'replace')
+            if stop_event.is_set():
+                return
+
+
+def _parse_rssi(value: str) -> Optional[int]:
+    """Parse an RSSI value, accepting both '-65' and '0xffffffbf (-65)'."""
+    try:
+        return int(value.split(None, 1)[0])
+    except (IndexError, ValueError):
+        pass
+    start = value.find('(')
+    if start >= 0:
+        try:
+            return int(value[start + 1:value.index(')', start)])
+        except ValueError:
+            pass
+    return None
+
+
+def _parse_bluetoothctl_line_slow(line: str) -> Optional[tuple]:
+    """Regex parser for lines carrying prompts or colour codes."""
+    match = _RE_BTCTL.search(line)
+    if not match:
+        return None
+
+    tag, address, field = match.group(1, 2, 3)
+    if tag == 'NEW':
+        return 'new', address, line[match.end(2):].strip()
+    if field == 'RSSI':
+        rssi = _parse_rssi(match.group(4))
+        return ('rssi', address, rssi) if rssi is not None else None
+    if field == 'Name':
+        return 'name', address, match.group(4).strip()
+    return None
+
+
+def _parse_bluetoothctl_line(line: str) -> Optional[tuple]:
+    """
+    Parse a bluetoothctl discovery line.
+
+    Returns an (event, address, value) tuple where event is 'new', 'rssi'
+    or 'name', or None for anything else.
+    """
+    if line.startswith(_BTCTL_PREFIXES):
+        address = line[_BTCTL_ADDR_START:_BTCTL_ADDR_END]
+        if (
+            address[2:15:3] == ':::::'
+            and (len(line) == _BTCTL_ADDR_END or line[_BTCTL_ADDR_END] == ' ')
+        ):
+            tail = line[_BTCTL_ADDR_END + 1:]
+            if line[1] == 'N':
+                return 'new', address, tail.strip()
+            if tail.startswith('RSSI:'):
+                rssi = _parse_rssi(tail[5:])
+                return ('rssi', address, rssi) if rssi is not None else None
+            if tail.startswith('Name:'):
+                return 'name', address, tail[5:].strip()
+            return None
+
+    # Prompt-prefixed or colourised output takes the slow path
+    if 'Device ' in line:
+        return _parse_bluetoothctl_line_slow(line)
+    return None
+
+
+def _parse_hcitool_line(line: str) -> Optional[tuple[str, Optional[str]]]:
+    """
+    Parse an hcitool lescan line: "AA:BB:CC:DD:EE:FF DeviceName".
+
+    Returns an (address, name) tuple, or None for header lines.
+    """
+    if len(line) >= 17 and line[2:15:3] == ':::::' and (len(line) == 17 or line[17].isspace()):
+        return line[:17], line[18:].strip() or None
+
+    match = _RE_HCITOOL.match(line)
+    if match:
+        return match.group(1), match.group(2).strip() or None
+    return None
+
+
+# Backend availability, probed once per process
+_tool_paths: dict[str, Optional[str]] = {}
+_bleak_installed: Optional[bool] = None
+
+
+def _tool_path(name: str) -> Optional[str]:
+    """Return the absolute path of a command-line tool, memoized."""
+    if name not in _tool_paths:
+        _tool_paths[name] = shutil.which(name)
+    return _tool_paths[name]
+
+
+def _bleak_available() -> bool:
+    """Whether bleak is installed, checked without importing it."""
+    global _bleak_installed
+    if _bleak_installed is None:
+        try:
+            _bleak_installed = importlib.util.find_spec('bleak') is not None
+        except (ImportError, ValueError):
+            _bleak_installed = False
+    return _bleak_installed
+
+
+_bleak_loop: Optional[asyncio.AbstractEventLoop] = None
+_bleak_loop_lock = threading.Lock()
+
+
+def _get_bleak_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop bleak scans run on, starting it on first use.
+
+    Sweeps start and stop scans often; keeping one loop alive (and with
+    it bleak's per-loop BlueZ connection) avoids rebuilding both per scan.
+    """
+    global _bleak_loop
+    with _bleak_loop_lock:
+        if _bleak_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='bleak-loop', daemon=True).start()
+            _bleak_loop = loop
+        return _bleak_loop
+
 
 class BleakScanner:
     """
@@ -45,11 +281,14 @@ class BleakScanner:
         self._on_observation = on_observation
         self._scanner = None
         self._is_scanning = False
-        self._scan_thread: Optional[threading.Thread] = None
+        self._scan_future: Optional[concurrent.futures.Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._stop_event = threading.Event()
+        # Event the scan coroutine waits on, set while it runs
+        self._async_stop: Optional[asyncio.Event] = None
 
     def start(self, duration: float = BLEAK_SCAN_TIMEOUT) -> bool:
-        """Start bleak scanning in background thread."""
+        """Start bleak scanning on the shared background loop."""
         try:
             import bleak
 
@@ -57,13 +296,12 @@ class BleakScanner:
                 return True
 
             self._stop_event.clear()
-            self._scan_thread = threading.Thread(
-                target=self._scan_loop,
-                args=(duration,),
-                daemon=True
-            )
-            self._scan_thread.start()
+            self._loop = _get_bleak_loop()
             self._is_scanning = True
+            self._scan_future = asyncio.run_coroutine_threadsafe(
+                self._async_scan(duration), self._loop
+            )
+            self._scan_future.add_done_callback(self._on_scan_done)
             logger.info("Bleak scanner started")
             return True
 
@@ -77,8 +315,14 @@ class BleakScanner:
     def stop(self) -> None:
         """Stop bleak scanning."""
         self._stop_event.set()
-        if self._scan_thread:
-            self._scan_thread.join(timeout=2.0)
+        async_stop = self._async_stop
+        if async_stop and self._loop:
+            self._loop.call_soon_threadsafe(async_stop.set)
+        if self._scan_future:
+            try:
+                self._scan_future.result(timeout=2.0)
+            except Exception:
+                pass
         self._is_scanning = False
         logger.info("Bleak scanner stopped")
 
@@ -86,14 +330,11 @@ class BleakScanner:
     def is_scanning(self) -> bool:
         return self._is_scanning
 
-    def _scan_loop(self, duration: float) -> None:
-        """Run scanning in async event loop."""
-        try:
-            asyncio.run(self._async_scan(duration))
-        except Exception as e:
-            logger.error(f"Bleak scan error: {e}")
-        finally:
-            self._is_scanning = False
+    def _on_scan_done(self, future: concurrent.futures.Future) -> None:
+        """Mark the scan finished once its coroutine completes."""
+        self._is_scanning = False
+        if not future.cancelled() and future.exception():
+            logger.error(f"Bleak scan error: {future.exception()}")
 
     async def _async_scan(self, duration: float) -> None:
         """Async scanning coroutine."""
@@ -117,75 +358,80 @@ class BleakScanner:
             await scanner.start()
 
             # Wait for duration or stop event
-            start_time = asyncio.get_event_loop().time()
-            while not self._stop_event.is_set():
-                await asyncio.sleep(0.1)
-                if duration > 0 and (asyncio.get_event_loop().time() - start_time) >= duration:
-                    break
+            stop_event = asyncio.Event()
+            self._async_stop = stop_event
+            if self._stop_event.is_set():
+                stop_event.set()  # stop() ran before the event existed
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=duration if duration > 0 else None)
+            except asyncio.TimeoutError:
+                pass
 
             await scanner.stop()
 
         except Exception as e:
             logger.error(f"Async scan error: {e}")
+        finally:
+            self._async_stop = None
 
     def _convert_bleak_device(self, device, adv_data) -> BTObservation:
         """Convert bleak device to BTObservation."""
+        address = device.address
+        md = adv_data.manufacturer_data
+        sd = adv_data.service_data
+        suuids = adv_data.service_uuids
+
         # Determine address type from address format
         address_type = ADDRESS_TYPE_PUBLIC
-        if device.address and ':' in device.address:
+        if address and ':' in address:
             # Check if first byte indicates random address
-            first_byte = int(device.address.split(':')[0], 16)
+            first_byte = int(address[:address.index(':')], 16)
             if (first_byte & 0xC0) == 0xC0:  # Random static
                 address_type = ADDRESS_TYPE_RANDOM
 
-        # Extract manufacturer data
+        # Extract manufacturer data (only the first entry is used).
+        # Bleak hands back bytes/bytearray; hex strings are the only other
+        # form seen in practice.
         manufacturer_id = None
         manufacturer_data = None
-        if adv_data.manufacturer_data:
-            for mid, mdata in adv_data.manufacturer_data.items():
-                manufacturer_id = mid
-                # Handle various data types safely
-                try:
-                    if isinstance(mdata, (bytes, bytearray)):
-                        manufacturer_data = bytes(mdata)
-                    elif isinstance(mdata, (list, tuple)):
-                        manufacturer_data = bytes(mdata)
-                    elif isinstance(mdata, str):
-                        manufacturer_data = bytes.fromhex(mdata)
-                    else:
-                        manufacturer_data = bytes(mdata)
-                except (TypeError, ValueError) as e:
-                    logger.debug(f"Could not convert manufacturer data: {e}")
-                break
+        if md:
+            manufacturer_id, mdata = next(iter(md.items()))
+            try:
+                manufacturer_data = bytes.fromhex(mdata) if isinstance(mdata, str) else bytes(mdata)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Could not convert manufacturer data: {e}")
 
         # Extract service data
         service_data = {}
-        if adv_data.service_data:
-            for uuid, data in adv_data.service_data.items():
-                try:
-                    if isinstance(data, (bytes, bytearray)):
-                        service_data[str(uuid)] = bytes(data)
-                    elif isinstance(data, (list, tuple)):
-                        service_data[str(uuid)] = bytes(data)
-                    elif isinstance(data, str):
-                        service_data[str(uuid)] = bytes.fromhex(data)
-                    else:
-                        service_data[str(uuid)] = bytes(data)
-                except (TypeError, ValueError) as e:
-                    logger.debug(f"Could not convert service data for {uuid}: {e}")
+        if sd:
+            try:
+                service_data = {
+                    uuid if type(uuid) is str else str(uuid):
+                        bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+                    for uuid, data in sd.items()
+                }
+            except (TypeError, ValueError):
+                # Retry entry by entry so one malformed payload only drops itself
+                for uuid, data in sd.items():
+                    try:
+                        service_data[str(uuid)] = (
+                            bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+                        )
+                    except (TypeError, ValueError) as e:
+                        logger.debug(f"Could not convert service data for {uuid}: {e}")
 
         return BTObservation(
-            timestamp=datetime.now(),
-            address=device.address.upper() if device.address else '',
+            timestamp=_now_cached(),
+            address=_normalize_address(address) if address else '',
             address_type=address_type,
             rssi=adv_data.rssi,
             tx_power=adv_data.tx_power,
             name=adv_data.local_name or device.name,
             manufacturer_id=manufacturer_id,
             manufacturer_data=manufacturer_data,
-            service_uuids=list(adv_data.service_uuids) if adv_data.service_uuids else [],
+            service_uuids=list(suuids) if suuids else [],
             service_data=service_data,
-            is_connectable=getattr(adv_data, 'connectable', True) if adv_data else True,
+            is_connectable=getattr(adv_data, 'connectable', True),
         )
 
 
@@ -207,6 +453,7 @@ class HcitoolScanner:
         self._is_scanning = False
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._wake: Optional[_WakePipe] = None
 
     def start(self) -> bool:
         """Start hcitool lescan."""
@@ -214,15 +461,21 @@ class HcitoolScanner:
             if self._is_scanning:
                 return True
 
+            hcitool = _tool_path('hcitool')
+            if not hcitool:
+                logger.error("hcitool not found")
+                return False
+
             # Start hcitool lescan with duplicate reporting
             self._process = subprocess.Popen(
-                ['hcitool', '-i', self._adapter, 'lescan', '--duplicates'],
+                [hcitool, '-i', self._adapter, 'lescan', '--duplicates'],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=0,  # _read_lines() reads the fd directly
             )
 
             self._stop_event.clear()
+            self._wake = _WakePipe()
             self._reader_thread = threading.Thread(
                 target=self._read_output,
                 daemon=True
@@ -245,6 +498,8 @@ class HcitoolScanner:
     def stop(self) -> None:
         """Stop hcitool scanning."""
         self._stop_event.set()
+        if self._wake:
+            self._wake.wake()
         if self._process:
             try:
                 self._process.terminate()
@@ -255,6 +510,10 @@ class HcitoolScanner:
 
         if self._reader_thread:
             self._reader_thread.join(timeout=2.0)
+        # Leave the pipe open if the reader is somehow still selecting on it
+        if self._wake and not (self._reader_thread and self._reader_thread.is_alive()):
+            self._wake.close()
+            self._wake = None
 
         self._is_scanning = False
         logger.info("hcitool scanner stopped")
@@ -268,28 +527,25 @@ class HcitoolScanner:
         try:
             # Also start hcidump in parallel for RSSI values
             dump_process = None
-            try:
-                dump_process = subprocess.Popen(
-                    ['hcidump', '-i', self._adapter, '--raw'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-            except Exception:
-                pass
-
-            while not self._stop_event.is_set() and self._process:
-                line = self._process.stdout.readline()
-                if not line:
-                    break
+            hcidump = _tool_path('hcidump')
+            if hcidump:
+                try:
+                    dump_process = subprocess.Popen(
+                        [hcidump, '-i', self._adapter, '--raw'],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                    )
+                except Exception:
+                    pass
 
-                # Parse hcitool output: "AA:BB:CC:DD:EE:FF DeviceName"
-                match = re.match(r'^([0-9A-Fa-f:]{17})\s*(.*)$', line.strip())
-                if match:
-                    address = match.group(1).upper()
-                    name = match.group(2).strip() or None
+            for line in _read_lines(self._process.stdout, self._stop_event, self._wake):
+                parsed = _parse_hcitool_line(line.strip())
+                if parsed:
+                    address, name = parsed
+                    address = _normalize_address(address)
 
                     observation = BTObservation(
-                        timestamp=datetime.now(),
+                        timestamp=_now_cached(),
                         address=address,
                         address_type=ADDRESS_TYPE_PUBLIC,
                         name=name if name and name != '(unknown)' else None,
@@ -323,6 +579,7 @@ class BluetoothctlScanner:
         self._is_scanning = False
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._wake: Optional[_WakePipe] = None
         self._devices: dict[str, dict] = {}
 
     def start(self) -> bool:
@@ -331,15 +588,21 @@ class BluetoothctlScanner:
             if self._is_scanning:
                 return True
 
+            bluetoothctl = _tool_path('bluetoothctl')
+            if not bluetoothctl:
+                logger.error("bluetoothctl not found")
+                return False
+
             self._process = subprocess.Popen(
-                ['bluetoothctl'],
+                [bluetoothctl],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                bufsize=0,  # Unbuffered so commands reach bluetoothctl immediately
             )
 
             self._stop_event.clear()
+            self._wake = _WakePipe()
             self._reader_thread = threading.Thread(
                 target=self._read_output,
                 daemon=True
@@ -347,7 +610,7 @@ class BluetoothctlScanner:
             self._reader_thread.start()
 
             # Send scan on command
-            self._process.stdin.write('scan on\n')
+            self._process.stdin.write(b'scan on\n')
             self._process.stdin.flush()
 
             self._is_scanning = True
@@ -364,11 +627,13 @@ class BluetoothctlScanner:
     def stop(self) -> None:
         """Stop bluetoothctl scanning."""
         self._stop_event.set()
+        if self._wake:
+            self._wake.wake()
 
         if self._process:
             try:
-                self._process.stdin.write('scan off\n')
-                self._process.stdin.write('quit\n')
+                self._process.stdin.write(b'scan off\n')
+                self._process.stdin.write(b'quit\n')
                 self._process.stdin.flush()
                 self._process.wait(timeout=2.0)
             except Exception:
@@ -380,6 +645,10 @@ class BluetoothctlScanner:
 
         if self._reader_thread:
             self._reader_thread.join(timeout=2.0)
+        # Leave the pipe open if the reader is somehow still selecting on it
+        if self._wake and not (self._reader_thread and self._reader_thread.is_alive()):
+            self._wake.close()
+            self._wake = None
 
         self._is_scanning = False
         logger.info("bluetoothctl scanner stopped")
@@ -391,26 +660,16 @@ class BluetoothctlScanner:
     def _read_output(self) -> None:
         """Read bluetoothctl output and parse devices."""
         try:
-            while not self._stop_event.is_set() and self._process:
-                line = self._process.stdout.readline()
-                if not line:
-                    break
-
-                line = line.strip()
-
-                # Parse device discovery lines
-                # [NEW] Device AA:BB:CC:DD:EE:FF DeviceName
-                # [CHG] Device AA:BB:CC:DD:EE:FF RSSI: -65
-                # [CHG] Device AA:BB:CC:DD:EE:FF Name: DeviceName
+            for line in _read_lines(self._process.stdout, self._stop_event, self._wake):
+                parsed = _parse_bluetoothctl_line(line.strip())
+                if parsed is None:
+                    continue
 
-                new_match = re.search(
-                    r'\[NEW\]\s+Device\s+([0-9A-Fa-f:]{17})\s*(.*)',
-                    line
-                )
-                if new_match:
-                    address = new_match.group(1).upper()
-                    name = new_match.group(2).strip() or None
+                event, address, value = parsed
+                address = _normalize_address(address)
 
+                if event == 'new':
+                    name = value or None
                     self._devices[address] = {
                         'address': address,
                         'name': name,
@@ -418,64 +677,40 @@ class BluetoothctlScanner:
                     }
 
                     observation = BTObservation(
-                        timestamp=datetime.now(),
+                        timestamp=_now_cached(),
                         address=address,
                         address_type=ADDRESS_TYPE_PUBLIC,
                         name=name,
                     )
 
-                    if self._on_observation:
-                        self._on_observation(observation)
-                    continue
-
-                # RSSI change
-                rssi_match = re.search(
-                    r'\[CHG\]\s+Device\s+([0-9A-Fa-f:]{17})\s+RSSI:\s*(-?\d+)',
-                    line
-                )
-                if rssi_match:
-                    address = rssi_match.group(1).upper()
-                    rssi = int(rssi_match.group(2))
-
+                elif event == 'rssi':
                     device_data = self._devices.get(address, {'address': address})
-                    device_data['rssi'] = rssi
+                    device_data['rssi'] = value
                     self._devices[address] = device_data
 
                     observation = BTObservation(
-                        timestamp=datetime.now(),
+                        timestamp=_now_cached(),
                         address=address,
                         address_type=ADDRESS_TYPE_PUBLIC,
                         name=device_data.get('name'),
-                        rssi=rssi,
+                        rssi=value,
                     )
 
-                    if self._on_observation:
-                        self._on_observation(observation)
-                    continue
-
-                # Name change
-                name_match = re.search(
-                    r'\[CHG\]\s+Device\s+([0-9A-Fa-f:]{17})\s+Name:\s*(.+)',
-                    line
-                )
-                if name_match:
-                    address = name_match.group(1).upper()
-                    name = name_match.group(2).strip()
-
+                else:
                     device_data = self._devices.get(address, {'address': address})
-                    device_data['name'] = name
+                    device_data['name'] = value
                     self._devices[address] = device_data
 
                     observation = BTObservation(
-                        timestamp=datetime.now(),
+                        timestamp=_now_cached(),
                         address=address,
                         address_type=ADDRESS_TYPE_PUBLIC,
-                        name=name,
+                        name=value,
                         rssi=device_data.get('rssi'),
                     )
 
-                    if self._on_observation:
-                        self._on_observation(observation)
+                if self._on_observation:
+                    self._on_observation(observation)
 
         except Exception as e:
             logger.error(f"bluetoothctl read error: {e}")
@@ -501,35 +736,37 @@ class FallbackScanner:
     def start(self) -> bool:
         """Start scanning with best available backend."""
         # Try bleak first (cross-platform)
-        try:
-            import bleak
-            self._active_scanner = BleakScanner(on_observation=self._on_observation)
-            if self._active_scanner.start():
-                self._backend = 'bleak'
-                return True
-        except ImportError:
-            pass
+        if _bleak_available():
+            try:
+                self._active_scanner = BleakScanner(on_observation=self._on_observation)
+                if self._active_scanner.start():
+                    self._backend = 'bleak'
+                    return True
+            except ImportError:
+                pass
 
         # Try hcitool (requires root)
-        try:
-            self._active_scanner = HcitoolScanner(
-                adapter=self._adapter,
-                on_observation=self._on_observation
-            )
-            if self._active_scanner.start():
-                self._backend = 'hcitool'
-                return True
-        except Exception:
-            pass
+        if _tool_path('hcitool'):
+            try:
+                self._active_scanner = HcitoolScanner(
+                    adapter=self._adapter,
+                    on_observation=self._on_observation
+                )
+                if self._active_scanner.start():
+                    self._backend = 'hcitool'
+                    return True
+            except Exception:
+                pass
 
         # Try bluetoothctl
-        try:
-            self._active_scanner = BluetoothctlScanner(on_observation=self._on_observation)
-            if self._active_scanner.start():
-                self._backend = 'bluetoothctl'
-                return True
-        except Exception:
-            pass
+        if _tool_path('bluetoothctl'):
+            try:
+                self._active_scanner = BluetoothctlScanner(on_observation=self._on_observation)
+                if self._active_scanner.start():
+                    self._backend = 'bluetoothctl'
+                    return True
+            except Exception:
+                pass
 
         # Try ubertooth (raw packet capture with Ubertooth One hardware)
         try:
@@ -4,6 +4,7 @@ Bluetooth data models for the unified scanner.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -26,8 +27,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .tracker_signatures import TrackerDetectionResult, DeviceFingerprint
 
+# One observation is built per advertisement, so drop the per-instance
+# __dict__ where the interpreter supports slotted dataclasses.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class BTObservation:
     """Represents a single Bluetooth advertisement or inquiry response."""
 
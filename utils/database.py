@@ -545,6 +545,47 @@ def close_db() -> None:
 # Settings Functions
 # =============================================================================
 
+_SETTING_UPSERT = '''
+    INSERT INTO settings (key, value, value_type, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        value_type = excluded.value_type,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+
+def _decode_setting(value: str, value_type: str, default: Any = None) -> Any:
+    """Convert a stored setting string back to its typed value."""
+    if value_type == 'json':
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return default
+    elif value_type == 'int':
+        return int(value)
+    elif value_type == 'float':
+        return float(value)
+    elif value_type == 'bool':
+        return value.lower() in ('true', '1', 'yes')
+    else:
+        return value
+
+
+def _encode_setting(value: Any) -> tuple[str, str]:
+    """Return the (string value, value type) stored for a setting value."""
+    if isinstance(value, bool):
+        return ('true' if value else 'false'), 'bool'
+    elif isinstance(value, int):
+        return str(value), 'int'
+    elif isinstance(value, float):
+        return str(value), 'float'
+    elif isinstance(value, (dict, list)):
+        return json.dumps(value), 'json'
+    else:
+        return str(value), 'string'
+
+
 def get_setting(key: str, default: Any = None) -> Any:
     """
     Get a setting value by key.
@@ -566,22 +607,36 @@ def get_setting(key: str, default: Any = None) -> Any:
         if row is None:
             return default
 
-        value, value_type = row['value'], row['value_type']
-
-        # Convert based on type
-        if value_type == 'json':
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return default
-        elif value_type == 'int':
-            return int(value)
-        elif value_type == 'float':
-            return float(value)
-        elif value_type == 'bool':
-            return value.lower() in ('true', '1', 'yes')
-        else:
-            return value
+        return _decode_setting(row['value'], row['value_type'], default)
+
+
+def get_settings(keys: list[str]) -> dict[str, Any]:
+    """
+    Get several settings in one query.
+
+    Args:
+        keys: Setting keys
+
+    Returns:
+        Dict of key to value for the keys that exist (converted as in
+        get_setting; JSON values that fail to parse are left out)
+    """
+    if not keys:
+        return {}
+
+    placeholders = ','.join('?' * len(keys))
+    with get_db() as conn:
+        cursor = conn.execute(
+            f'SELECT key, value, value_type FROM settings WHERE key IN ({placeholders})',
+            list(keys)
+        )
+        settings = {}
+        missing = object()
+        for row in cursor:
+            value = _decode_setting(row['value'], row['value_type'], missing)
+            if value is not missing:
+                settings[row['key']] = value
+        return settings
 
 
 def set_setting(key: str, value: Any) -> None:
@@ -592,32 +647,23 @@ def set_setting(key: str, value: Any) -> None:
         key: Setting key
         value: Setting value (will be JSON-encoded for complex types)
     """
-    # Determine value type and string representation
-    if isinstance(value, bool):
-        value_type = 'bool'
-        str_value = 'true' if value else 'false'
-    elif isinstance(value, int):
-        value_type = 'int'
-        str_value = str(value)
-    elif isinstance(value, float):
-        value_type = 'float'
-        str_value = str(value)
-    elif isinstance(value, (dict, list)):
-        value_type = 'json'
-        str_value = json.dumps(value)
-    else:
-        value_type = 'string'
-        str_value = str(value)
+    str_value, value_type = _encode_setting(value)
 
     with get_db() as conn:
-        conn.execute('''
-            INSERT INTO settings (key, value, value_type, updated_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(key) DO UPDATE SET
-                value = excluded.value,
-                value_type = excluded.value_type,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (key, str_value, value_type))
+        conn.execute(_SETTING_UPSERT, (key, str_value, value_type))
+
+
+def set_settings(values: dict[str, Any]) -> None:
+    """
+    Set several settings in one transaction.
+
+    Args:
+        values: Dict of setting key to value (encoded as in set_setting)
+    """
+    rows = [(key, *_encode_setting(value)) for key, value in values.items()]
+
+    with get_db() as conn:
+        conn.executemany(_SETTING_UPSERT, rows)
 
 
 def delete_setting(key: str) -> bool:
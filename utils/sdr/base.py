@@ -10,6 +10,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 
@@ -82,6 +83,17 @@ class SDRDevice:
         return result
 
 
+@lru_cache(maxsize=1024)
+def format_mhz(frequency_mhz: float) -> str:
+    """
+    Format a frequency as a SoapySDR/rtl_433 '-f' argument, e.g. '153.35M'.
+
+    Float repr is the expensive part of building a command, and the same
+    handful of frequencies come back on every retune, so results are cached.
+    """
+    return f'{frequency_mhz}M'
+
+
 class CommandBuilder(ABC):
     """Abstract base class for building SDR commands."""
 
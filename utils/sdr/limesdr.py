@@ -3,18 +3,22 @@ LimeSDR command builder implementation.
 
 Uses SoapySDR-based tools for FM demodulation and signal capture.
 LimeSDR supports 100 kHz to 3.8 GHz frequency range.
+LimeSDR does not support bias-T; the bias_t parameter is ignored.
 """
 
 from __future__ import annotations
 
 from typing import Optional
 
-from .base import CommandBuilder, SDRCapabilities, SDRDevice, SDRType
+from .base import SDRCapabilities, SDRDevice, SDRType
+from .soapy import SoapyCommandBuilder
 
 
-class LimeSDRCommandBuilder(CommandBuilder):
+class LimeSDRCommandBuilder(SoapyCommandBuilder):
     """LimeSDR command builder using SoapySDR tools."""
 
+    DRIVER = 'lime'
+
     CAPABILITIES = SDRCapabilities(
         sdr_type=SDRType.LIME_SDR,
         freq_min_mhz=0.1,        # 100 kHz
@@ -27,79 +31,9 @@ class LimeSDRCommandBuilder(CommandBuilder):
         tx_capable=True
     )
 
-    def _build_device_string(self, device: SDRDevice) -> str:
-        """Build SoapySDR device string for LimeSDR."""
-        if device.serial and device.serial != 'N/A':
-            return f'driver=lime,serial={device.serial}'
-        return f'driver=lime'
-
-    def build_fm_demod_command(
-        self,
-        device: SDRDevice,
-        frequency_mhz: float,
-        sample_rate: int = 22050,
-        gain: Optional[float] = None,
-        ppm: Optional[int] = None,
-        modulation: str = "fm",
-        squelch: Optional[int] = None,
-        bias_t: bool = False
-    ) -> list[str]:
-        """
-        Build SoapySDR rx_fm command for FM demodulation.
-
-        For pager decoding with LimeSDR.
-        Note: LimeSDR does not support bias-T, parameter is ignored.
-        """
-        device_str = self._build_device_string(device)
-
-        cmd = [
-            'rx_fm',
-            '-d', device_str,
-            '-f', f'{frequency_mhz}M',
-            '-M', modulation,
-            '-s', str(sample_rate),
-        ]
-
-        if gain is not None and gain > 0:
-            # LimeSDR gain is applied to LNAH element
-            cmd.extend(['-g', f'LNAH={int(gain)}'])
-
-        if squelch is not None and squelch > 0:
-            cmd.extend(['-l', str(squelch)])
-
-        # Output to stdout
-        cmd.append('-')
-
-        return cmd
-
-    def build_adsb_command(
-        self,
-        device: SDRDevice,
-        gain: Optional[float] = None,
-        bias_t: bool = False
-    ) -> list[str]:
-        """
-        Build dump1090 command with SoapySDR support for ADS-B decoding.
-
-        Uses dump1090 compiled with SoapySDR support, or readsb as alternative.
-        Note: Requires dump1090 with SoapySDR support or readsb.
-        Note: LimeSDR does not support bias-T, parameter is ignored.
-        """
-        device_str = self._build_device_string(device)
-
-        # Try readsb first (better SoapySDR support), fallback to dump1090
-        cmd = [
-            'readsb',
-            '--net',
-            '--device-type', 'soapysdr',
-            '--device', device_str,
-            '--quiet'
-        ]
-
-        if gain is not None:
-            cmd.extend(['--gain', str(int(gain))])
-
-        return cmd
+    def _format_gain(self, gain: float) -> str:
+        """LimeSDR gain is applied to the LNAH element."""
+        return f'LNAH={int(gain)}'
 
     def build_ism_command(
         self,
@@ -113,19 +47,8 @@ class LimeSDRCommandBuilder(CommandBuilder):
         Build rtl_433 command with SoapySDR support for ISM band decoding.
 
         rtl_433 has native SoapySDR support via -d flag.
-        Note: LimeSDR does not support bias-T, parameter is ignored.
         """
-        device_str = self._build_device_string(device)
-
-        cmd = [
-            'rtl_433',
-            '-d', device_str,
-            '-f', f'{frequency_mhz}M',
-            '-F', 'json'
-        ]
-
-        if gain is not None and gain > 0:
-            cmd.extend(['-g', str(int(gain))])
+        cmd = super().build_ism_command(device, frequency_mhz, gain, ppm, bias_t)
 
         # PPM not typically needed for LimeSDR (TCXO)
         # but include if specified
@@ -133,75 +56,3 @@ class LimeSDRCommandBuilder(CommandBuilder):
             cmd.extend(['-p', str(ppm)])
 
         return cmd
-
-    def build_ais_command(
-        self,
-        device: SDRDevice,
-        gain: Optional[float] = None,
-        bias_t: bool = False,
-        tcp_port: int = 10110
-    ) -> list[str]:
-        """
-        Build AIS-catcher command for AIS vessel tracking with LimeSDR.
-
-        Uses AIS-catcher with SoapySDR support.
-        Note: LimeSDR does not support bias-T, parameter is ignored.
-        """
-        device_str = self._build_device_string(device)
-
-        cmd = [
-            'AIS-catcher',
-            '-d', f'soapysdr -d {device_str}',
-            '-S', str(tcp_port),
-            '-o', '5',
-            '-q',
-        ]
-
-        if gain is not None and gain > 0:
-            cmd.extend(['-gr', 'tuner', str(int(gain))])
-
-        return cmd
-
-    def build_iq_capture_command(
-        self,
-        device: SDRDevice,
-        frequency_mhz: float,
-        sample_rate: int = 2048000,
-        gain: Optional[float] = None,
-        ppm: Optional[int] = None,
-        bias_t: bool = False,
-        output_format: str = 'cu8',
-    ) -> list[str]:
-        """
-        Build rx_sdr command for raw I/Q capture with LimeSDR.
-
-        Outputs unsigned 8-bit I/Q pairs to stdout for waterfall display.
-        Note: LimeSDR does not support bias-T, parameter is ignored.
-        """
-        device_str = self._build_device_string(device)
-        freq_hz = int(frequency_mhz * 1e6)
-
-        cmd = [
-            'rx_sdr',
-            '-d', device_str,
-            '-f', str(freq_hz),
-            '-s', str(sample_rate),
-            '-F', 'CU8',
-        ]
-
-        if gain is not None and gain > 0:
-            cmd.extend(['-g', f'LNAH={int(gain)}'])
-
-        # Output to stdout
-        cmd.append('-')
-
-        return cmd
-
-    def get_capabilities(self) -> SDRCapabilities:
-        """Return LimeSDR capabilities."""
-        return self.CAPABILITIES
-
-    @classmethod
-    def get_sdr_type(cls) -> SDRType:
-        """Return SDR type."""
-        return SDRType.LIME_SDR
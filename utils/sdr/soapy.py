@@ -0,0 +1,222 @@
+"""
+Shared command builder for SoapySDR-based hardware.
+
+HackRF and LimeSDR drive the same SoapySDR tools (rx_fm, readsb, rtl_433,
+AIS-catcher, rx_sdr) and differ only in driver name, gain elements and
+bias-T support, so the commands are built once here.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Optional
+
+from .base import CommandBuilder, SDRCapabilities, SDRDevice, SDRType, format_mhz
+
+
+@lru_cache(maxsize=16)
+def _device_string(driver: str, serial: Optional[str]) -> str:
+    """SoapySDR device string, cached per driver and serial."""
+    if serial and serial != 'N/A':
+        return f'driver={driver},serial={serial}'
+    return f'driver={driver}'
+
+
+class SoapyCommandBuilder(CommandBuilder):
+    """
+    Command builder for SoapySDR devices.
+
+    Subclasses set DRIVER and CAPABILITIES and implement _format_gain().
+    bias_t is ignored for devices whose capabilities report no bias-T.
+    """
+
+    DRIVER: str
+    CAPABILITIES: SDRCapabilities
+
+    def _build_device_string(self, device: SDRDevice) -> str:
+        """Build SoapySDR device string."""
+        return _device_string(self.DRIVER, device.serial)
+
+    @abstractmethod
+    def _format_gain(self, gain: float) -> str:
+        """Format the SoapySDR gain element setting for rx_fm/rx_sdr."""
+        pass
+
+    def build_fm_demod_command(
+        self,
+        device: SDRDevice,
+        frequency_mhz: float,
+        sample_rate: int = 22050,
+        gain: Optional[float] = None,
+        ppm: Optional[int] = None,
+        modulation: str = "fm",
+        squelch: Optional[int] = None,
+        bias_t: bool = False
+    ) -> list[str]:
+        """
+        Build SoapySDR rx_fm command for FM demodulation.
+
+        For pager decoding with SoapySDR devices.
+        """
+        device_str = self._build_device_string(device)
+
+        cmd = [
+            'rx_fm',
+            '-d', device_str,
+            '-f', format_mhz(frequency_mhz),
+            '-M', modulation,
+            '-s', str(sample_rate),
+        ]
+
+        if gain is not None and gain > 0:
+            cmd.extend(['-g', self._format_gain(gain)])
+
+        if squelch is not None and squelch > 0:
+            cmd.extend(['-l', str(squelch)])
+
+        if bias_t and self.CAPABILITIES.supports_bias_t:
+            cmd.extend(['-T'])
+
+        # Output to stdout
+        cmd.append('-')
+
+        return cmd
+
+    def build_adsb_command(
+        self,
+        device: SDRDevice,
+        gain: Optional[float] = None,
+        bias_t: bool = False
+    ) -> list[str]:
+        """
+        Build readsb command with SoapySDR support for ADS-B decoding.
+
+        Uses readsb which has better SoapySDR support than dump1090.
+        """
+        device_str = self._build_device_string(device)
+
+        cmd = [
+            'readsb',
+            '--net',
+            '--device-type', 'soapysdr',
+            '--device', device_str,
+            '--quiet'
+        ]
+
+        if gain is not None:
+            cmd.extend(['--gain', str(int(gain))])
+
+        if bias_t and self.CAPABILITIES.supports_bias_t:
+            cmd.extend(['--enable-bias-t'])
+
+        return cmd
+
+    def build_ism_command(
+        self,
+        device: SDRDevice,
+        frequency_mhz: float = 433.92,
+        gain: Optional[float] = None,
+        ppm: Optional[int] = None,
+        bias_t: bool = False
+    ) -> list[str]:
+        """
+        Build rtl_433 command with SoapySDR support for ISM band decoding.
+
+        rtl_433 has native SoapySDR support via -d flag.
+
+        Note: rtl_433's -T flag is for timeout, NOT bias-t.
+        For SoapySDR devices, bias-t is passed as a device setting.
+        """
+        # Build device string with optional bias-t setting
+        device_str = self._build_device_string(device)
+        if bias_t and self.CAPABILITIES.supports_bias_t:
+            device_str = f'{device_str},bias_t=1'
+
+        cmd = [
+            'rtl_433',
+            '-d', device_str,
+            '-f', format_mhz(frequency_mhz),
+            '-F', 'json'
+        ]
+
+        if gain is not None and gain > 0:
+            cmd.extend(['-g', str(int(gain))])
+
+        return cmd
+
+    def build_ais_command(
+        self,
+        device: SDRDevice,
+        gain: Optional[float] = None,
+        bias_t: bool = False,
+        tcp_port: int = 10110
+    ) -> list[str]:
+        """
+        Build AIS-catcher command for AIS vessel tracking.
+
+        Uses AIS-catcher with SoapySDR support.
+        """
+        device_str = self._build_device_string(device)
+
+        cmd = [
+            'AIS-catcher',
+            '-d', f'soapysdr -d {device_str}',
+            '-S', str(tcp_port),
+            '-o', '5',
+            '-q',
+        ]
+
+        if gain is not None and gain > 0:
+            cmd.extend(['-gr', 'tuner', str(int(gain))])
+
+        if bias_t and self.CAPABILITIES.supports_bias_t:
+            cmd.extend(['-gr', 'biastee', '1'])
+
+        return cmd
+
+    def build_iq_capture_command(
+        self,
+        device: SDRDevice,
+        frequency_mhz: float,
+        sample_rate: int = 2048000,
+        gain: Optional[float] = None,
+        ppm: Optional[int] = None,
+        bias_t: bool = False,
+        output_format: str = 'cu8',
+    ) -> list[str]:
+        """
+        Build rx_sdr command for raw I/Q capture.
+
+        Outputs unsigned 8-bit I/Q pairs to stdout for waterfall display.
+        """
+        device_str = self._build_device_string(device)
+        freq_hz = int(frequency_mhz * 1e6)
+
+        cmd = [
+            'rx_sdr',
+            '-d', device_str,
+            '-f', str(freq_hz),
+            '-s', str(sample_rate),
+            '-F', 'CU8',
+        ]
+
+        if gain is not None and gain > 0:
+            cmd.extend(['-g', self._format_gain(gain)])
+
+        if bias_t and self.CAPABILITIES.supports_bias_t:
+            cmd.append('-T')
+
+        # Output to stdout
+        cmd.append('-')
+
+        return cmd
+
+    def get_capabilities(self) -> SDRCapabilities:
+        """Return device capabilities."""
+        return self.CAPABILITIES
+
+    @classmethod
+    def get_sdr_type(cls) -> SDRType:
+        """Return SDR type."""
+        return cls.CAPABILITIES.sdr_type
@@ -69,6 +69,32 @@ def format_sse(data: dict[str, Any] | str, event: str | None = None) -> str:
     return '\n'.join(lines)
 
 
+def drain_queue(q: queue.Queue, max_items: int | None = None) -> list:
+    """
+    Take pending items from a queue under a single lock acquisition.
+
+    Cheaper than a get_nowait() loop when a consumer wants everything that
+    has accumulated, since each get() takes and releases the queue mutex.
+
+    Args:
+        q: Queue to drain
+        max_items: Optional cap on the number of items taken
+
+    Returns:
+        List of items in FIFO order (may be empty)
+    """
+    with q.mutex:
+        pending = q.queue
+        if max_items is None or max_items >= len(pending):
+            items = list(pending)
+            pending.clear()
+        else:
+            items = [pending.popleft() for _ in range(max(0, max_items))]
+        if items:
+            q.not_full.notify_all()
+    return items
+
+
 def clear_queue(q: queue.Queue) -> int:
     """
     Clear all items from a queue.
@@ -79,11 +105,11 @@ def clear_queue(q: queue.Queue) -> int:
     Returns:
         Number of items cleared
     """
-    count = 0
-    while True:
-        try:
-            q.get_nowait()
-            count += 1
-        except queue.Empty:
-            break
+    # Clear the underlying deque under one lock acquisition rather than
+    # paying for a get_nowait() round-trip per item
+    with q.mutex:
+        count = len(q.queue)
+        q.queue.clear()
+        if count:
+            q.not_full.notify_all()
     return count
@@ -27,13 +27,19 @@ from __future__ import annotations
 import hashlib
 import logging
 import math
-import statistics
+import re
+import struct
+import sys
+import threading
+from array import array
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger('intercept.tscm.device_identity')
 
 
@@ -41,6 +47,10 @@ logger = logging.getLogger('intercept.tscm.device_identity')
 # Constants and Configuration
 # =============================================================================
 
+# Slotted dataclasses where supported (slots= needs Python 3.10+); keeps
+# per-instance memory down for the many observations held during a sweep
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Session gap thresholds (seconds)
 BLE_SESSION_GAP = 60       # New session if no observations for 60s
 WIFI_SESSION_GAP = 120     # WiFi clients may probe less frequently
@@ -49,6 +59,7 @@ WIFI_SESSION_GAP = 120     # WiFi clients may probe less frequently
 MIN_CLUSTER_CONFIDENCE = 0.3  # Minimum confidence to consider clustering
 HIGH_CONFIDENCE_THRESHOLD = 0.7
 VERY_HIGH_CONFIDENCE_THRESHOLD = 0.85
+EARLY_EXIT_THRESHOLD = 0.85  # Fingerprint score that skips the remaining features
 
 # RSSI proximity threshold for "same location" assessment
 RSSI_PROXIMITY_THRESHOLD = 10  # dBm difference
@@ -56,6 +67,9 @@ RSSI_PROXIMITY_THRESHOLD = 10  # dBm difference
 # Time window for temporal correlation
 TEMPORAL_CORRELATION_WINDOW = timedelta(seconds=5)
 
+# Audio-capable BLE service UUID prefixes: A2DP, Headset, Audio
+_AUDIO_UUID_RE = re.compile(r'0000110|00001108|00001203', re.IGNORECASE)
+
 # Fingerprint weights (sum to 1.0 for normalization)
 FINGERPRINT_WEIGHTS = {
     'manufacturer_data': 0.25,
@@ -109,11 +123,115 @@ class RiskLevel(Enum):
     HIGH = 'high'
 
 
+# Fingerprint encoding. The hash input is a presence bitmask byte followed by
+# the present fields in bit order, each at a fixed width (integers are masked
+# to that width) or length-prefixed. New fields take new bits, so existing
+# fingerprints keep their hashes.
+_BLE_FP_MFG_ID = 0x01        # u16
+_BLE_FP_MFG_DATA = 0x02      # u8 length + first 8 bytes
+_BLE_FP_UUIDS = 0x04         # string list
+_BLE_FP_FLAGS = 0x08         # u8
+_BLE_FP_APPEARANCE = 0x10    # u16
+_BLE_FP_TX_POWER = 0x20      # i8, two's complement
+_BLE_FP_PACKET_LEN = 0x40    # u16
+
+_WIFI_FP_RATES = 0x01        # u16 count + f64 each
+_WIFI_FP_CAPS = 0x02         # u8 HT/VHT/HE bits
+_WIFI_FP_HT_CAPS = 0x04      # u16
+_WIFI_FP_VHT_CAPS = 0x08     # u32
+_WIFI_FP_VENDOR_IES = 0x10   # string list
+_WIFI_FP_CAPABILITIES = 0x20  # u16
+
+_FP_CAP_HT = 0x01
+_FP_CAP_VHT = 0x02
+_FP_CAP_HE = 0x04
+
+_FP_U8 = struct.Struct('<B')
+_FP_U16 = struct.Struct('<H')
+_FP_U32 = struct.Struct('<I')
+
+
+def _fp_strings(buf: bytearray, values) -> None:
+    """Append a counted list of length-prefixed strings to a fingerprint."""
+    buf += _FP_U16.pack(len(values) & 0xFFFF)
+    for value in values:
+        encoded = value.encode()[:0xFFFF]
+        buf += _FP_U16.pack(len(encoded))
+        buf += encoded
+
+
+# Initialised once; copies skip the per-call parameter setup. The prototype
+# itself is never updated, so copying it is safe from any thread.
+_FP_HASHER = hashlib.blake2b(digest_size=8)
+
+
+def _fingerprint_digest(data: bytearray) -> str:
+    """
+    Hash fingerprint components to a 16 hex char digest.
+
+    Fingerprints are only compared for equality, so BLAKE2b with an 8 byte
+    digest is enough and much cheaper than truncated SHA-256 on these short
+    inputs.
+    """
+    hasher = _FP_HASHER.copy()
+    hasher.update(data)
+    return sys.intern(hasher.hexdigest())
+
+
+class _FingerprintIndex:
+    """
+    Bit index for fingerprint hashes.
+
+    Sessions and clusters keep a bitmap of their fingerprints alongside the
+    sets so overlap checks are an integer AND plus a popcount. Indices are
+    never reused, so each engine owns one and drops it on clear().
+    """
+
+    def __init__(self):
+        self._index: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def bits(self, hashes) -> int:
+        """Return the fingerprint bitmap for a collection of fingerprint hashes."""
+        index_of = self._index.get
+        bits = 0
+        for fp in hashes:
+            index = index_of(fp)
+            if index is None:
+                with self._lock:
+                    index = self._index.setdefault(fp, len(self._index))
+            bits |= 1 << index
+        return bits
+
+
+# Index for sessions and clusters built outside an engine
+_DEFAULT_FP_INDEX = _FingerprintIndex()
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # Python 3.9
+    def _popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
+# First-octet hex strings (any case) with bit 1 set, i.e. locally
+# administered / random, so the address check is a single set lookup.
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+_RANDOM_FIRST_OCTETS = frozenset(
+    hi + lo
+    for hi in _HEX_DIGITS for lo in _HEX_DIGITS
+    if int(hi + lo, 16) & 0x02
+)
+
+
 # =============================================================================
 # Observation Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class BLEObservation:
     """Single BLE advertisement observation."""
     timestamp: datetime
@@ -131,8 +249,14 @@ class BLEObservation:
     appearance: Optional[int] = None
     packet_length: Optional[int] = None
     phy: Optional[str] = None
+    _fp_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _ts_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # Epoch seconds, so session intervals and gaps are float subtractions
+        self._ts_epoch = self.timestamp.timestamp()
+        # One shared string per address across observations, sessions and clusters
+        self.addr = sys.intern(self.addr)
         if isinstance(self.addr_type, str):
             try:
                 self.addr_type = AddressType(self.addr_type)
@@ -149,39 +273,54 @@ class BLEObservation:
         Compute a fingerprint hash based on stable (non-MAC) features.
 
         This hash helps identify similar payloads across different MACs.
+        The result is cached; the fingerprinted fields are not expected to
+        change after construction.
         """
-        components = []
+        if self._fp_hash is not None:
+            return self._fp_hash
+
+        buf = bytearray(1)  # presence bitmask, filled in below
+        present = 0
 
         if self.manufacturer_id is not None:
-            components.append(f"mfg:{self.manufacturer_id:04x}")
+            present |= _BLE_FP_MFG_ID
+            buf += _FP_U16.pack(self.manufacturer_id & 0xFFFF)
 
         if self.manufacturer_data:
             # Use first 8 bytes of manufacturer data (often contains device type)
-            data_prefix = self.manufacturer_data[:8].hex()
-            components.append(f"mfg_data:{data_prefix}")
+            present |= _BLE_FP_MFG_DATA
+            data_prefix = self.manufacturer_data[:8]
+            buf += _FP_U8.pack(len(data_prefix))
+            buf += data_prefix
 
         if self.service_uuids:
             # Sort for consistency
-            uuids = sorted(set(self.service_uuids))
-            components.append(f"uuids:{','.join(uuids)}")
+            present |= _BLE_FP_UUIDS
+            _fp_strings(buf, sorted(set(self.service_uuids)))
 
         if self.adv_flags is not None:
-            components.append(f"flags:{self.adv_flags:02x}")
+            present |= _BLE_FP_FLAGS
+            buf += _FP_U8.pack(self.adv_flags & 0xFF)
 
         if self.appearance is not None:
-            components.append(f"appear:{self.appearance:04x}")
+            present |= _BLE_FP_APPEARANCE
+            buf += _FP_U16.pack(self.appearance & 0xFFFF)
 
         if self.tx_power is not None:
-            components.append(f"txp:{self.tx_power}")
+            present |= _BLE_FP_TX_POWER
+            buf += _FP_U8.pack(self.tx_power & 0xFF)
 
         if self.packet_length is not None:
-            components.append(f"plen:{self.packet_length}")
+            present |= _BLE_FP_PACKET_LEN
+            buf += _FP_U16.pack(self.packet_length & 0xFFFF)
 
-        if not components:
+        if not present:
+            self._fp_hash = ""
             return ""
 
-        fingerprint_str = "|".join(components)
-        return hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
+        buf[0] = present
+        self._fp_hash = _fingerprint_digest(buf)
+        return self._fp_hash
 
     def is_randomized_address(self) -> bool:
         """Check if the address appears to be randomized."""
@@ -189,15 +328,10 @@ class BLEObservation:
             return True
 
         # Check MAC address format for random bit
-        # Bit 1 of first octet set = locally administered (random)
-        try:
-            first_octet = int(self.addr.split(':')[0], 16)
-            return bool(first_octet & 0x02)
-        except (ValueError, IndexError):
-            return False
+        return self.addr[:2] in _RANDOM_FIRST_OCTETS
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WifiObservation:
     """Single WiFi frame observation."""
     timestamp: datetime
@@ -223,8 +357,16 @@ class WifiObservation:
     wps_present: bool = False
     sequence_number: Optional[int] = None
     probed_ssids: list[str] = field(default_factory=list)
+    _fp_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _ts_epoch: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        # Epoch seconds, so session intervals and gaps are float subtractions
+        self._ts_epoch = self.timestamp.timestamp()
+        # One shared string per address across observations, sessions and clusters
+        self.src_mac = sys.intern(self.src_mac)
+        if self.bssid is not None:
+            self.bssid = sys.intern(self.bssid)
         if isinstance(self.frame_type, str):
             try:
                 self.frame_type = WifiFrameType(self.frame_type)
@@ -236,59 +378,68 @@ class WifiObservation:
         Compute a fingerprint hash based on stable capability features.
 
         For clients, this captures the "device type" signature.
+        The result is cached like BLEObservation.compute_fingerprint_hash().
         """
-        components = []
+        if self._fp_hash is not None:
+            return self._fp_hash
+
+        buf = bytearray(1)  # presence bitmask, filled in below
+        present = 0
 
         # Rate set fingerprint
-        all_rates = sorted(set(self.supported_rates + self.extended_rates))
+        all_rates = sorted(set(self.supported_rates).union(self.extended_rates))
         if all_rates:
-            components.append(f"rates:{','.join(str(r) for r in all_rates)}")
+            present |= _WIFI_FP_RATES
+            buf += _FP_U16.pack(len(all_rates) & 0xFFFF)
+            buf += struct.pack(f'<{len(all_rates)}d', *all_rates)
 
         # Capability fingerprint
-        caps = []
+        caps = 0
         if self.ht_capable:
-            caps.append('HT')
+            caps |= _FP_CAP_HT
         if self.vht_capable:
-            caps.append('VHT')
+            caps |= _FP_CAP_VHT
         if self.he_capable:
-            caps.append('HE')
+            caps |= _FP_CAP_HE
         if caps:
-            components.append(f"caps:{'+'.join(caps)}")
+            present |= _WIFI_FP_CAPS
+            buf += _FP_U8.pack(caps)
 
         if self.ht_capabilities is not None:
-            components.append(f"htcap:{self.ht_capabilities:04x}")
+            present |= _WIFI_FP_HT_CAPS
+            buf += _FP_U16.pack(self.ht_capabilities & 0xFFFF)
 
         if self.vht_capabilities is not None:
-            components.append(f"vhtcap:{self.vht_capabilities:08x}")
+            present |= _WIFI_FP_VHT_CAPS
+            buf += _FP_U32.pack(self.vht_capabilities & 0xFFFFFFFF)
 
         # Vendor IE fingerprint (OUIs only, not content)
         if self.vendor_ies:
-            ouis = sorted(set(oui for oui, _ in self.vendor_ies))
-            components.append(f"vie:{','.join(ouis)}")
+            present |= _WIFI_FP_VENDOR_IES
+            _fp_strings(buf, sorted({oui for oui, _ in self.vendor_ies}))
 
         if self.capabilities is not None:
-            components.append(f"cap:{self.capabilities:04x}")
+            present |= _WIFI_FP_CAPABILITIES
+            buf += _FP_U16.pack(self.capabilities & 0xFFFF)
 
-        if not components:
+        if not present:
+            self._fp_hash = ""
             return ""
 
-        fingerprint_str = "|".join(components)
-        return hashlib.sha256(fingerprint_str.encode()).hexdigest()[:16]
+        buf[0] = present
+        self._fp_hash = _fingerprint_digest(buf)
+        return self._fp_hash
 
     def is_randomized_address(self) -> bool:
         """Check if source MAC appears to be randomized."""
-        try:
-            first_octet = int(self.src_mac.split(':')[0], 16)
-            return bool(first_octet & 0x02)
-        except (ValueError, IndexError):
-            return False
+        return self.src_mac[:2] in _RANDOM_FIRST_OCTETS
 
 
 # =============================================================================
 # Session and Cluster Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeviceSession:
     """
     A session represents a contiguous presence window of a device.
@@ -304,38 +455,123 @@ class DeviceSession:
     primary_mac: Optional[str] = None
     observed_macs: set[str] = field(default_factory=set)
     fingerprint_hashes: set[str] = field(default_factory=set)
+    fp_index: Optional[_FingerprintIndex] = field(default=None, repr=False, compare=False)
 
     # Aggregated metrics
-    rssi_samples: list[int] = field(default_factory=list)
-    observation_intervals: list[float] = field(default_factory=list)
+    # Typed arrays: float64 dBm samples and float64 seconds, unboxed
+    rssi_samples: array = field(default_factory=lambda: array('d'))
+    observation_intervals: array = field(default_factory=lambda: array('d'))
+
+    # Running sums so session metrics don't rescan the sample lists
+    _rssi_sum: float = field(default=0.0, init=False, repr=False)
+    _rssi_sumsq: float = field(default=0.0, init=False, repr=False)
+    _interval_sum: float = field(default=0.0, init=False, repr=False)
+    _fp_bitmap: int = field(default=0, init=False, repr=False)
+    _first_seen_epoch: float = field(default=0.0, init=False, repr=False)
+    _last_seen_epoch: float = field(default=0.0, init=False, repr=False)
+
+    # BLE payload features, collected as observations arrive
+    _manufacturer_data: Optional[bytes] = field(default=None, init=False, repr=False)
+    _service_uuids: set[str] = field(default_factory=set, init=False, repr=False)
+    _local_name: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self._first_seen_epoch = self.first_seen.timestamp()
+        self._last_seen_epoch = self.last_seen.timestamp()
+        if not isinstance(self.rssi_samples, array):
+            self.rssi_samples = array('d', self.rssi_samples)
+        if not isinstance(self.observation_intervals, array):
+            self.observation_intervals = array('d', self.observation_intervals)
+        if self.fp_index is None:
+            self.fp_index = _DEFAULT_FP_INDEX
+        self._fp_bitmap = self.fp_index.bits(self.fingerprint_hashes)
+        self._rssi_sum = sum(self.rssi_samples)
+        self._rssi_sumsq = sum(r * r for r in self.rssi_samples)
+        self._interval_sum = sum(self.observation_intervals)
+        self._collect_payload(self.observations)
+
+    def _collect_payload(self, observations) -> None:
+        """Fold BLE manufacturer data, service UUIDs and name into the session."""
+        # Only BLE observations carry advertisement payloads
+        if self.protocol != 'ble':
+            return
+        for obs in observations:
+            if self._manufacturer_data is None and obs.manufacturer_data:
+                self._manufacturer_data = obs.manufacturer_data
+            if obs.service_uuids:
+                self._service_uuids.update(obs.service_uuids)
+            if self._local_name is None and obs.local_name:
+                self._local_name = obs.local_name
 
     def add_observation(self, obs) -> None:
         """Add an observation to this session."""
-        self.observations.append(obs)
-        self.last_seen = obs.timestamp
-
-        if hasattr(obs, 'addr'):
-            self.observed_macs.add(obs.addr)
-            if self.primary_mac is None:
-                self.primary_mac = obs.addr
-        elif hasattr(obs, 'src_mac'):
-            self.observed_macs.add(obs.src_mac)
-            if self.primary_mac is None:
-                self.primary_mac = obs.src_mac
-
-        fp = obs.compute_fingerprint_hash()
-        if fp:
-            self.fingerprint_hashes.add(fp)
+        self.add_observations((obs,))
 
-        if obs.rssi is not None:
-            self.rssi_samples.append(obs.rssi)
+    def add_observations(self, observations) -> None:
+        """
+        Add a batch of observations to this session.
 
-        # Calculate interval from previous observation
-        if len(self.observations) > 1:
-            prev = self.observations[-2]
-            interval = (obs.timestamp - prev.timestamp).total_seconds()
-            if interval > 0:
-                self.observation_intervals.append(interval)
+        Equivalent to calling add_observation() for each one in order, but
+        fingerprints the batch up front and updates the aggregates in a
+        single pass. Intended for bulk ingest such as capture replay.
+        """
+        batch = list(observations)
+        if not batch:
+            return
+
+        fingerprints = {obs.compute_fingerprint_hash() for obs in batch}
+        fingerprints.discard("")
+        self.fingerprint_hashes.update(fingerprints)
+        self._fp_bitmap |= self.fp_index.bits(fingerprints)
+
+        add_mac = self.observed_macs.add
+        add_rssi = self.rssi_samples.append
+        add_interval = self.observation_intervals.append
+        rssi_sum = self._rssi_sum
+        rssi_sumsq = self._rssi_sumsq
+        interval_sum = self._interval_sum
+        prev_ts = self.observations[-1]._ts_epoch if self.observations else None
+
+        for obs in batch:
+            if hasattr(obs, 'addr'):
+                mac = obs.addr
+            elif hasattr(obs, 'src_mac'):
+                mac = obs.src_mac
+            else:
+                mac = None
+            if mac is not None:
+                add_mac(mac)
+                if self.primary_mac is None:
+                    self.primary_mac = mac
+
+            rssi = obs.rssi
+            if rssi is not None:
+                # Scanners may report power as a string (airodump CSV)
+                try:
+                    rssi = float(rssi)
+                except (TypeError, ValueError):
+                    rssi = None
+            if rssi is not None:
+                add_rssi(rssi)
+                rssi_sum += rssi
+                rssi_sumsq += rssi * rssi
+
+            # Calculate interval from previous observation
+            ts = obs._ts_epoch
+            if prev_ts is not None:
+                interval = ts - prev_ts
+                if interval > 0:
+                    add_interval(interval)
+                    interval_sum += interval
+            prev_ts = ts
+
+        self._rssi_sum = rssi_sum
+        self._rssi_sumsq = rssi_sumsq
+        self._interval_sum = interval_sum
+        self._collect_payload(batch)
+        self.observations.extend(batch)
+        self.last_seen = batch[-1].timestamp
+        self._last_seen_epoch = batch[-1]._ts_epoch
 
     def get_duration(self) -> timedelta:
         """Get session duration."""
@@ -345,7 +581,7 @@ class DeviceSession:
         """Get mean RSSI across session."""
         if not self.rssi_samples:
             return None
-        return statistics.mean(self.rssi_samples)
+        return self._rssi_sum / len(self.rssi_samples)
 
     def get_rssi_stability(self) -> float:
         """
@@ -353,20 +589,20 @@ class DeviceSession:
 
         Stable RSSI suggests a stationary device.
         """
-        if len(self.rssi_samples) < 3:
-            return 0.0
-        try:
-            stdev = statistics.stdev(self.rssi_samples)
-            # Convert to 0-1 scale (stdev of 0 = 1.0, stdev of 20+ = ~0)
-            return max(0, 1 - (stdev / 20))
-        except statistics.StatisticsError:
+        n = len(self.rssi_samples)
+        if n < 3:
             return 0.0
+        # Sample variance from the running sums
+        variance = (n * self._rssi_sumsq - self._rssi_sum * self._rssi_sum) / (n * (n - 1))
+        stdev = math.sqrt(max(0.0, variance))
+        # Convert to 0-1 scale (stdev of 0 = 1.0, stdev of 20+ = ~0)
+        return max(0, 1 - (stdev / 20))
 
     def get_mean_interval(self) -> Optional[float]:
         """Get mean advertising/probing interval."""
         if not self.observation_intervals:
             return None
-        return statistics.mean(self.observation_intervals)
+        return self._interval_sum / len(self.observation_intervals)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -386,7 +622,7 @@ class DeviceSession:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RiskIndicator:
     """A TSCM risk indicator for a device cluster."""
     indicator_type: str
@@ -405,7 +641,7 @@ class RiskIndicator:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeviceCluster:
     """
     A cluster represents a probable physical device identity.
@@ -443,19 +679,64 @@ class DeviceCluster:
     last_seen: Optional[datetime] = None
     presence_ratio: float = 0.0  # % of monitoring period device was present
 
+    fp_index: Optional[_FingerprintIndex] = field(default=None, repr=False, compare=False)
+
+    _fp_bitmap: int = field(default=0, init=False, repr=False)
+    _confidence_sum: float = field(default=0.0, init=False, repr=False)
+    # Epoch seconds mirroring first_seen/last_seen, for risk arithmetic
+    _first_epoch: Optional[float] = field(default=None, init=False, repr=False)
+    _last_epoch: Optional[float] = field(default=None, init=False, repr=False)
+
+    # Aggregates over all sessions, kept up to date by add_session()
+    _manufacturer_data: Optional[bytes] = field(default=None, init=False, repr=False)
+    _service_uuids: set[str] = field(default_factory=set, init=False, repr=False)
+    _intervals: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _rssi_samples: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _rssi_sum: float = field(default=0.0, init=False, repr=False)
+    _rssi_sumsq: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.first_seen is not None:
+            self._first_epoch = self.first_seen.timestamp()
+        if self.last_seen is not None:
+            self._last_epoch = self.last_seen.timestamp()
+        if self.fp_index is None:
+            self.fp_index = _DEFAULT_FP_INDEX
+        self._fp_bitmap = self.fp_index.bits(self.fingerprint_hashes)
+        self._confidence_sum = sum(e['confidence'] for e in self.link_evidence)
+        for session in self.sessions:
+            self._aggregate_session(session)
+
+    def _aggregate_session(self, session: DeviceSession) -> None:
+        """Fold a session's payload features into the cluster aggregates."""
+        if self._manufacturer_data is None:
+            self._manufacturer_data = session._manufacturer_data
+        self._service_uuids.update(session._service_uuids)
+        self._intervals.extend(session.observation_intervals)
+        self._rssi_samples.extend(session.rssi_samples)
+        self._rssi_sum += session._rssi_sum
+        self._rssi_sumsq += session._rssi_sumsq
+
     def add_session(self, session: DeviceSession, link_reason: str,
                     link_confidence: float) -> None:
         """Add a session to this cluster with linking evidence."""
         self.sessions.append(session)
         self.linked_macs.update(session.observed_macs)
         self.fingerprint_hashes.update(session.fingerprint_hashes)
+        if session.fp_index is self.fp_index:
+            self._fp_bitmap |= session._fp_bitmap
+        else:
+            self._fp_bitmap |= self.fp_index.bits(session.fingerprint_hashes)
+        self._aggregate_session(session)
         self.total_observations += len(session.observations)
         self.updated_at = datetime.now()
 
-        if self.first_seen is None or session.first_seen < self.first_seen:
+        if self._first_epoch is None or session._first_seen_epoch < self._first_epoch:
             self.first_seen = session.first_seen
-        if self.last_seen is None or session.last_seen > self.last_seen:
+            self._first_epoch = session._first_seen_epoch
+        if self._last_epoch is None or session._last_seen_epoch > self._last_epoch:
             self.last_seen = session.last_seen
+            self._last_epoch = session._last_seen_epoch
 
         self.link_evidence.append({
             'session_id': session.session_id,
@@ -464,11 +745,9 @@ class DeviceCluster:
             'timestamp': datetime.now().isoformat(),
         })
 
-        # Update overall confidence (weighted average)
-        if self.link_evidence:
-            self.confidence = statistics.mean(
-                e['confidence'] for e in self.link_evidence
-            )
+        # Update overall confidence (mean link confidence, kept as a running sum)
+        self._confidence_sum += link_confidence
+        self.confidence = self._confidence_sum / len(self.link_evidence)
 
     def add_risk_indicator(self, indicator: RiskIndicator) -> None:
         """Add a risk indicator and update risk assessment."""
@@ -485,12 +764,17 @@ class DeviceCluster:
         else:
             self.risk_level = RiskLevel.INFORMATIONAL
 
-    def get_all_rssi_samples(self) -> list[int]:
-        """Get all RSSI samples across all sessions."""
-        samples = []
-        for session in self.sessions:
-            samples.extend(session.rssi_samples)
-        return samples
+    def get_all_rssi_samples(self) -> array:
+        """Get all RSSI samples across all sessions (shared, do not modify)."""
+        return self._rssi_samples
+
+    def get_rssi_stdev(self) -> Optional[float]:
+        """Sample standard deviation of all RSSI samples, or None if < 2."""
+        n = len(self._rssi_samples)
+        if n < 2:
+            return None
+        variance = (n * self._rssi_sumsq - self._rssi_sum * self._rssi_sum) / (n * (n - 1))
+        return math.sqrt(max(0.0, variance))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -532,6 +816,12 @@ def jaccard_similarity(set1: set, set2: set) -> float:
     return intersection / union if union > 0 else 0.0
 
 
+def jaccard_bitmap_similarity(bits1: int, bits2: int) -> float:
+    """Jaccard similarity between two sets encoded as integer bitmaps."""
+    union = _popcount(bits1 | bits2)
+    return _popcount(bits1 & bits2) / union if union > 0 else 0.0
+
+
 def manufacturer_data_similarity(data1: Optional[bytes],
                                   data2: Optional[bytes]) -> float:
     """
@@ -543,24 +833,61 @@ def manufacturer_data_similarity(data1: Optional[bytes],
     if not data1 or not data2:
         return 0.0
 
+    len1 = len(data1)
+    len2 = len(data2)
+    max_len = max(len1, len2)
+
     # Compare lengths
-    len_sim = 1.0 - abs(len(data1) - len(data2)) / max(len(data1), len(data2))
+    len_sim = 1.0 - abs(len1 - len2) / max_len
+
+    # Byte-level matches over the common length, computed in one pass
+    matches = [b1 == b2 for b1, b2 in zip(data1, data2)]
 
     # Compare common prefix (often contains device type info)
-    prefix_len = min(8, len(data1), len(data2))
-    prefix_match = sum(
-        1 for i in range(prefix_len) if data1[i] == data2[i]
-    ) / prefix_len if prefix_len > 0 else 0.0
+    prefix = matches[:8]
+    prefix_match = sum(prefix) / len(prefix)
 
     # Compare full content via byte-level similarity
-    min_len = min(len(data1), len(data2))
-    byte_matches = sum(1 for i in range(min_len) if data1[i] == data2[i])
-    content_sim = byte_matches / max(len(data1), len(data2))
+    content_sim = sum(matches) / max_len
 
     # Weight prefix more heavily (device type usually in prefix)
     return 0.5 * prefix_match + 0.3 * content_sim + 0.2 * len_sim
 
 
+def manufacturer_data_similarity_matrix(blobs: list[Optional[bytes]]) -> np.ndarray:
+    """
+    Pairwise manufacturer_data_similarity() for a list of blobs.
+
+    Blobs are padded into one uint8 matrix and compared by broadcasting, so
+    the cost is a handful of array operations rather than N^2 Python calls.
+    Memory is O(N^2 * longest blob). Missing or empty blobs score 0.0.
+    """
+    count = len(blobs)
+    lengths = np.fromiter((len(b) if b else 0 for b in blobs), dtype=np.intp, count=count)
+    width = int(lengths.max()) if count else 0
+
+    data = np.zeros((count, width), dtype=np.uint8)
+    for i, blob in enumerate(blobs):
+        if blob:
+            data[i, :len(blob)] = np.frombuffer(blob, dtype=np.uint8)
+
+    # Byte matches, limited to positions inside both blobs
+    valid = np.arange(width) < lengths[:, None]
+    matches = (data[:, None, :] == data[None, :, :]) & valid[:, None, :] & valid[None, :, :]
+
+    min_len = np.minimum(lengths[:, None], lengths[None, :])
+    max_len = np.maximum(lengths[:, None], lengths[None, :])
+    prefix_len = np.minimum(min_len, 8)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prefix_match = matches[:, :, :8].sum(axis=2) / prefix_len
+        content_sim = matches.sum(axis=2) / max_len
+        len_sim = 1.0 - np.abs(lengths[:, None] - lengths[None, :]) / max_len
+        scores = 0.5 * prefix_match + 0.3 * content_sim + 0.2 * len_sim
+
+    return np.where(min_len > 0, scores, 0.0)
+
+
 def rssi_trajectory_similarity(samples1: list[int],
                                 samples2: list[int],
                                 time_window: float = 5.0) -> float:
@@ -573,9 +900,12 @@ def rssi_trajectory_similarity(samples1: list[int],
     if len(samples1) < 3 or len(samples2) < 3:
         return 0.0
 
+    arr1 = np.asarray(samples1, dtype=np.float64)
+    arr2 = np.asarray(samples2, dtype=np.float64)
+
     # Compare mean RSSI (proximity indicator)
-    mean1 = statistics.mean(samples1)
-    mean2 = statistics.mean(samples2)
+    mean1 = arr1.mean()
+    mean2 = arr2.mean()
     mean_diff = abs(mean1 - mean2)
 
     # If means are very different, devices are likely in different locations
@@ -585,17 +915,61 @@ def rssi_trajectory_similarity(samples1: list[int],
     mean_sim = 1.0 - (mean_diff / 20)
 
     # Compare RSSI variance (movement pattern)
-    try:
-        var1 = statistics.variance(samples1)
-        var2 = statistics.variance(samples2)
-        var_diff = abs(var1 - var2)
-        var_sim = 1.0 / (1.0 + var_diff / 50)
-    except statistics.StatisticsError:
-        var_sim = 0.5
+    var_diff = abs(arr1.var(ddof=1) - arr2.var(ddof=1))
+    var_sim = 1.0 / (1.0 + var_diff / 50)
+
+    return float(0.6 * mean_sim + 0.4 * var_sim)
+
+
+def _rssi_stats_similarity(n1: int, sum1: float, sumsq1: float,
+                           n2: int, sum2: float, sumsq2: float) -> float:
+    """
+    rssi_trajectory_similarity() from sample counts and running sums.
+
+    O(1) regardless of sample count, for callers that already keep the
+    sums (sessions and clusters do).
+    """
+    if n1 < 3 or n2 < 3:
+        return 0.0
+
+    mean_diff = abs(sum1 / n1 - sum2 / n2)
+    if mean_diff > 20:
+        return 0.0
+    mean_sim = 1.0 - (mean_diff / 20)
+
+    var1 = (n1 * sumsq1 - sum1 * sum1) / (n1 * (n1 - 1))
+    var2 = (n2 * sumsq2 - sum2 * sum2) / (n2 * (n2 - 1))
+    var_sim = 1.0 / (1.0 + abs(var1 - var2) / 50)
 
     return 0.6 * mean_sim + 0.4 * var_sim
 
 
+def rssi_trajectory_similarity_matrix(sessions: list[DeviceSession]) -> np.ndarray:
+    """
+    Pairwise rssi_trajectory_similarity() for a list of sessions.
+
+    Per-session means and variances come from the running RSSI sums in one
+    O(N) pass; the pairwise terms are then outer differences, so no
+    per-pair Python call or sample padding is needed.
+    """
+    counts = np.fromiter((len(s.rssi_samples) for s in sessions), dtype=np.float64,
+                         count=len(sessions))
+    sums = np.fromiter((s._rssi_sum for s in sessions), dtype=np.float64, count=len(sessions))
+    sumsqs = np.fromiter((s._rssi_sumsq for s in sessions), dtype=np.float64, count=len(sessions))
+
+    usable = counts >= 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+        variances = (counts * sumsqs - sums * sums) / (counts * (counts - 1))
+
+    mean_diff = np.abs(means[:, None] - means[None, :])
+    var_diff = np.abs(variances[:, None] - variances[None, :])
+    scores = 0.6 * (1.0 - mean_diff / 20) + 0.4 / (1.0 + var_diff / 50)
+
+    valid = usable[:, None] & usable[None, :] & (mean_diff <= 20)
+    return np.where(valid, scores, 0.0)
+
+
 def timing_pattern_similarity(intervals1: list[float],
                                intervals2: list[float]) -> float:
     """
@@ -606,8 +980,10 @@ def timing_pattern_similarity(intervals1: list[float],
     if len(intervals1) < 2 or len(intervals2) < 2:
         return 0.0
 
-    mean1 = statistics.mean(intervals1)
-    mean2 = statistics.mean(intervals2)
+    arr1 = np.asarray(intervals1, dtype=np.float64)
+    arr2 = np.asarray(intervals2, dtype=np.float64)
+    mean1 = arr1.mean()
+    mean2 = arr2.mean()
 
     # Calculate relative difference
     if mean1 == 0 or mean2 == 0:
@@ -616,14 +992,11 @@ def timing_pattern_similarity(intervals1: list[float],
     ratio = min(mean1, mean2) / max(mean1, mean2)
 
     # Also compare variance in timing
-    try:
-        cv1 = statistics.stdev(intervals1) / mean1 if mean1 > 0 else 0
-        cv2 = statistics.stdev(intervals2) / mean2 if mean2 > 0 else 0
-        cv_sim = 1.0 - abs(cv1 - cv2)
-    except statistics.StatisticsError:
-        cv_sim = 0.5
+    cv1 = arr1.std(ddof=1) / mean1 if mean1 > 0 else 0
+    cv2 = arr2.std(ddof=1) / mean2 if mean2 > 0 else 0
+    cv_sim = 1.0 - abs(cv1 - cv2)
 
-    return 0.7 * ratio + 0.3 * max(0, cv_sim)
+    return float(0.7 * ratio + 0.3 * max(0, cv_sim))
 
 
 def name_similarity(name1: Optional[str], name2: Optional[str]) -> float:
@@ -642,10 +1015,11 @@ def name_similarity(name1: Optional[str], name2: Optional[str]) -> float:
     if n1.startswith(n2) or n2.startswith(n1):
         return 0.8
 
-    # Simple character-level similarity
-    common = sum(1 for c in set(n1) if c in n2)
-    total = len(set(n1) | set(n2))
-    return common / total if total > 0 else 0.0
+    # Simple character-level similarity (Jaccard over character sets)
+    chars1 = set(n1)
+    chars2 = set(n2)
+    total = len(chars1 | chars2)
+    return len(chars1 & chars2) / total if total > 0 else 0.0
 
 
 # =============================================================================
@@ -666,7 +1040,9 @@ class DeviceIdentityEngine:
         self.clusters: dict[str, DeviceCluster] = {}
 
         # Fingerprint index for efficient lookup
-        self._fingerprint_to_sessions: dict[str, list[str]] = defaultdict(list)
+        self._fingerprint_to_sessions: dict[str, set[str]] = defaultdict(set)
+        self._fingerprint_to_clusters: dict[str, set[str]] = defaultdict(set)
+        self._fp_index = _FingerprintIndex()
 
         # Session counters
         self._session_counter = 0
@@ -675,6 +1051,8 @@ class DeviceIdentityEngine:
         # Monitoring period for presence calculation
         self.monitoring_start: Optional[datetime] = None
         self.monitoring_end: Optional[datetime] = None
+        self._start_epoch = 0.0
+        self._end_epoch = 0.0
 
     def _generate_session_id(self, protocol: str) -> str:
         """Generate unique session ID."""
@@ -692,15 +1070,21 @@ class DeviceIdentityEngine:
         """
         if self.monitoring_start is None:
             self.monitoring_start = obs.timestamp
+            self._start_epoch = obs._ts_epoch
         self.monitoring_end = obs.timestamp
+        self._end_epoch = obs._ts_epoch
 
-        # Find or create session for this MAC
-        session_key = f"ble_{obs.addr}"
+        # Find or create session for this MAC (already interned by the
+        # observation, and ble_sessions holds BLE only, so no prefix needed)
+        session_key = obs.addr
+        session = self.ble_sessions.get(session_key)
 
-        if session_key in self.ble_sessions:
-            session = self.ble_sessions[session_key]
+        if session is None:
+            session = self._create_ble_session(obs)
+            self.ble_sessions[session_key] = session
+        else:
             # Check if this is a continuation or new session
-            gap = (obs.timestamp - session.last_seen).total_seconds()
+            gap = obs._ts_epoch - session._last_seen_epoch
             if gap > BLE_SESSION_GAP:
                 # Close old session, start new one
                 self._finalize_session(session)
@@ -708,15 +1092,11 @@ class DeviceIdentityEngine:
                 self.ble_sessions[session_key] = session
             else:
                 session.add_observation(obs)
-        else:
-            session = self._create_ble_session(obs)
-            self.ble_sessions[session_key] = session
 
         # Update fingerprint index
         fp = obs.compute_fingerprint_hash()
         if fp:
-            if session.session_id not in self._fingerprint_to_sessions[fp]:
-                self._fingerprint_to_sessions[fp].append(session.session_id)
+            self._fingerprint_to_sessions[fp].add(session.session_id)
 
         return session
 
@@ -727,6 +1107,7 @@ class DeviceIdentityEngine:
             protocol='ble',
             first_seen=obs.timestamp,
             last_seen=obs.timestamp,
+            fp_index=self._fp_index,
         )
         session.add_observation(obs)
         return session
@@ -737,29 +1118,30 @@ class DeviceIdentityEngine:
         """
         if self.monitoring_start is None:
             self.monitoring_start = obs.timestamp
+            self._start_epoch = obs._ts_epoch
         self.monitoring_end = obs.timestamp
+        self._end_epoch = obs._ts_epoch
 
         # For WiFi, track by source MAC
-        session_key = f"wifi_{obs.src_mac}"
+        session_key = obs.src_mac
+        session = self.wifi_sessions.get(session_key)
 
-        if session_key in self.wifi_sessions:
-            session = self.wifi_sessions[session_key]
-            gap = (obs.timestamp - session.last_seen).total_seconds()
+        if session is None:
+            session = self._create_wifi_session(obs)
+            self.wifi_sessions[session_key] = session
+        else:
+            gap = obs._ts_epoch - session._last_seen_epoch
             if gap > WIFI_SESSION_GAP:
                 self._finalize_session(session)
                 session = self._create_wifi_session(obs)
                 self.wifi_sessions[session_key] = session
             else:
                 session.add_observation(obs)
-        else:
-            session = self._create_wifi_session(obs)
-            self.wifi_sessions[session_key] = session
 
         # Update fingerprint index
         fp = obs.compute_fingerprint_hash()
         if fp:
-            if session.session_id not in self._fingerprint_to_sessions[fp]:
-                self._fingerprint_to_sessions[fp].append(session.session_id)
+            self._fingerprint_to_sessions[fp].add(session.session_id)
 
         return session
 
@@ -770,6 +1152,7 @@ class DeviceIdentityEngine:
             protocol='wifi',
             first_seen=obs.timestamp,
             last_seen=obs.timestamp,
+            fp_index=self._fp_index,
         )
         session.add_observation(obs)
         return session
@@ -777,11 +1160,10 @@ class DeviceIdentityEngine:
     def _finalize_session(self, session: DeviceSession) -> None:
         """Finalize a session and attempt to cluster it."""
         # Try to find existing cluster for this session
-        cluster = self._find_matching_cluster(session)
+        cluster, similarity = self._find_matching_cluster(session)
 
         if cluster:
-            # Add to existing cluster
-            similarity = self._calculate_cluster_similarity(cluster, session)
+            # Add to existing cluster, reusing the score it was matched on
             cluster.add_session(
                 session,
                 link_reason=f"Fingerprint/behavioral match",
@@ -792,19 +1174,36 @@ class DeviceIdentityEngine:
             cluster = self._create_cluster_from_session(session)
             self.clusters[cluster.cluster_id] = cluster
 
+        for fp in session.fingerprint_hashes:
+            self._fingerprint_to_clusters[fp].add(cluster.cluster_id)
+
         # Run risk assessment on the cluster
         self._assess_cluster_risk(cluster)
 
-    def _find_matching_cluster(self, session: DeviceSession) -> Optional[DeviceCluster]:
+    def _find_matching_cluster(
+        self, session: DeviceSession
+    ) -> tuple[Optional[DeviceCluster], float]:
         """
         Find an existing cluster that matches this session.
 
+        Returns the best cluster (or None) and its similarity score.
         Uses fingerprint matching, temporal correlation, and RSSI similarity.
+        Clusters sharing a fingerprint with the session are scored first; the
+        remaining clusters are only scanned if none of those is a
+        high-confidence match.
         """
         best_match = None
         best_score = MIN_CLUSTER_CONFIDENCE
 
-        for cluster in self.clusters.values():
+        index = self._fingerprint_to_clusters
+        candidate_ids = set()
+        for fp in session.fingerprint_hashes:
+            if fp in index:
+                candidate_ids |= index[fp]
+
+        # Sorted so ties resolve to the oldest cluster, as in a full scan
+        for cluster_id in sorted(candidate_ids):
+            cluster = self.clusters[cluster_id]
             if cluster.protocol != session.protocol:
                 continue
 
@@ -813,7 +1212,19 @@ class DeviceIdentityEngine:
                 best_score = similarity
                 best_match = cluster
 
-        return best_match
+        if best_score >= HIGH_CONFIDENCE_THRESHOLD:
+            return best_match, best_score
+
+        for cluster_id, cluster in self.clusters.items():
+            if cluster.protocol != session.protocol or cluster_id in candidate_ids:
+                continue
+
+            similarity = self._calculate_cluster_similarity(cluster, session)
+            if similarity > best_score:
+                best_score = similarity
+                best_match = cluster
+
+        return best_match, best_score
 
     def _calculate_cluster_similarity(self, cluster: DeviceCluster,
                                        session: DeviceSession) -> float:
@@ -822,119 +1233,109 @@ class DeviceIdentityEngine:
 
         Returns a confidence score 0-1.
         """
-        scores = {}
+        # Weighted average, accumulated as each signal is scored
+        weights = FINGERPRINT_WEIGHTS
+        weighted_sum = 0.0
+        total_weight = 0.0
 
         # 1. Fingerprint hash matching (strongest signal)
-        fp_overlap = cluster.fingerprint_hashes & session.fingerprint_hashes
+        fp_overlap = _popcount(cluster._fp_bitmap & session._fp_bitmap)
         if fp_overlap:
-            fp_score = len(fp_overlap) / max(
-                len(cluster.fingerprint_hashes),
-                len(session.fingerprint_hashes)
-            )
-            scores['fingerprint'] = min(1.0, fp_score * 1.5)  # Boost for exact match
+            # Jaccard: |A & B| / |A | B|, with the union from inclusion-exclusion
+            fp_union = (len(cluster.fingerprint_hashes)
+                        + len(session.fingerprint_hashes) - fp_overlap)
+            fp_score = fp_overlap / fp_union
+            fp_score = min(1.0, fp_score * 1.5)  # Boost for exact match
+
+            # A strong fingerprint match is conclusive on its own
+            if fp_score >= EARLY_EXIT_THRESHOLD:
+                return fp_score
+
+            weight = weights.get('fingerprint', 0.1)
+            weighted_sum += fp_score * weight
+            total_weight += weight
 
         # 2. Manufacturer data similarity
         cluster_mfg_data = self._get_cluster_manufacturer_data(cluster)
         session_mfg_data = self._get_session_manufacturer_data(session)
         if cluster_mfg_data and session_mfg_data:
-            scores['manufacturer_data'] = manufacturer_data_similarity(
+            weight = weights.get('manufacturer_data', 0.1)
+            weighted_sum += manufacturer_data_similarity(
                 cluster_mfg_data, session_mfg_data
-            )
+            ) * weight
+            total_weight += weight
 
         # 3. Service UUID overlap
         cluster_uuids = self._get_cluster_service_uuids(cluster)
         session_uuids = self._get_session_service_uuids(session)
         if cluster_uuids or session_uuids:
-            scores['service_uuids'] = jaccard_similarity(
+            weight = weights.get('service_uuids', 0.1)
+            weighted_sum += jaccard_similarity(
                 cluster_uuids, session_uuids
-            )
+            ) * weight
+            total_weight += weight
 
-        # 4. RSSI trajectory similarity
-        cluster_rssi = cluster.get_all_rssi_samples()
-        if cluster_rssi and session.rssi_samples:
-            scores['rssi_trajectory'] = rssi_trajectory_similarity(
-                cluster_rssi, session.rssi_samples
-            )
+        # 4. RSSI trajectory similarity (from the running sums, no sample pass)
+        cluster_rssi_n = len(cluster.get_all_rssi_samples())
+        session_rssi_n = len(session.rssi_samples)
+        if cluster_rssi_n and session_rssi_n:
+            weight = weights.get('rssi_trajectory', 0.1)
+            weighted_sum += _rssi_stats_similarity(
+                cluster_rssi_n, cluster._rssi_sum, cluster._rssi_sumsq,
+                session_rssi_n, session._rssi_sum, session._rssi_sumsq
+            ) * weight
+            total_weight += weight
 
         # 5. Timing pattern similarity
         cluster_intervals = self._get_cluster_intervals(cluster)
         if cluster_intervals and session.observation_intervals:
-            scores['timing_pattern'] = timing_pattern_similarity(
+            weight = weights.get('timing_pattern', 0.1)
+            weighted_sum += timing_pattern_similarity(
                 cluster_intervals, session.observation_intervals
-            )
+            ) * weight
+            total_weight += weight
 
         # 6. Name similarity
         session_name = self._get_session_name(session)
         if cluster.best_name and session_name:
-            scores['name_similarity'] = name_similarity(
+            weight = weights.get('name_similarity', 0.1)
+            weighted_sum += name_similarity(
                 cluster.best_name, session_name
-            )
-
-        if not scores:
-            return 0.0
-
-        # Weighted average
-        total_weight = 0.0
-        weighted_sum = 0.0
-
-        for key, score in scores.items():
-            weight = FINGERPRINT_WEIGHTS.get(key, 0.1)
-            weighted_sum += score * weight
+            ) * weight
             total_weight += weight
 
         return weighted_sum / total_weight if total_weight > 0 else 0.0
 
     def _get_cluster_manufacturer_data(self, cluster: DeviceCluster) -> Optional[bytes]:
         """Get representative manufacturer data from cluster."""
-        for session in cluster.sessions:
-            for obs in session.observations:
-                if hasattr(obs, 'manufacturer_data') and obs.manufacturer_data:
-                    return obs.manufacturer_data
-        return None
+        return cluster._manufacturer_data
 
     def _get_session_manufacturer_data(self, session: DeviceSession) -> Optional[bytes]:
         """Get manufacturer data from session."""
-        for obs in session.observations:
-            if hasattr(obs, 'manufacturer_data') and obs.manufacturer_data:
-                return obs.manufacturer_data
-        return None
+        return session._manufacturer_data
 
     def _get_cluster_service_uuids(self, cluster: DeviceCluster) -> set[str]:
         """Get all service UUIDs from cluster."""
-        uuids = set()
-        for session in cluster.sessions:
-            for obs in session.observations:
-                if hasattr(obs, 'service_uuids') and obs.service_uuids:
-                    uuids.update(obs.service_uuids)
-        return uuids
+        return cluster._service_uuids
 
     def _get_session_service_uuids(self, session: DeviceSession) -> set[str]:
-        """Get service UUIDs from session."""
-        uuids = set()
-        for obs in session.observations:
-            if hasattr(obs, 'service_uuids') and obs.service_uuids:
-                uuids.update(obs.service_uuids)
-        return uuids
-
-    def _get_cluster_intervals(self, cluster: DeviceCluster) -> list[float]:
+        """Get service UUIDs from session (shared, do not modify)."""
+        return session._service_uuids
+
+    def _get_cluster_intervals(self, cluster: DeviceCluster) -> array:
         """Get all observation intervals from cluster."""
-        intervals = []
-        for session in cluster.sessions:
-            intervals.extend(session.observation_intervals)
-        return intervals
+        return cluster._intervals
 
     def _get_session_name(self, session: DeviceSession) -> Optional[str]:
         """Get device name from session."""
-        for obs in session.observations:
-            if hasattr(obs, 'local_name') and obs.local_name:
-                return obs.local_name
-        return None
+        return session._local_name
 
     def _create_cluster_from_session(self, session: DeviceSession) -> DeviceCluster:
         """Create a new cluster from a session."""
         cluster = DeviceCluster(
             cluster_id=self._generate_cluster_id(session.protocol),
             protocol=session.protocol,
+            fp_index=self._fp_index,
         )
 
         cluster.add_session(
@@ -943,12 +1344,13 @@ class DeviceIdentityEngine:
             link_confidence=1.0
         )
 
-        # Extract identifying information
-        for obs in session.observations:
-            if hasattr(obs, 'local_name') and obs.local_name:
-                cluster.best_name = obs.local_name
-            if hasattr(obs, 'manufacturer_id') and obs.manufacturer_id:
-                cluster.manufacturer_id = obs.manufacturer_id
+        # Extract identifying information (BLE advertisements only)
+        if session.protocol == 'ble':
+            for obs in session.observations:
+                if obs.local_name:
+                    cluster.best_name = obs.local_name
+                if obs.manufacturer_id:
+                    cluster.manufacturer_id = obs.manufacturer_id
 
         return cluster
 
@@ -966,9 +1368,9 @@ class DeviceIdentityEngine:
         """
         # Calculate presence ratio
         if self.monitoring_start and self.monitoring_end:
-            total_duration = (self.monitoring_end - self.monitoring_start).total_seconds()
-            if total_duration > 0 and cluster.first_seen and cluster.last_seen:
-                presence_duration = (cluster.last_seen - cluster.first_seen).total_seconds()
+            total_duration = self._end_epoch - self._start_epoch
+            if total_duration > 0 and cluster._first_epoch is not None and cluster._last_epoch is not None:
+                presence_duration = cluster._last_epoch - cluster._first_epoch
                 cluster.presence_ratio = min(1.0, presence_duration / total_duration)
 
         # Risk: High presence ratio (device always present)
@@ -981,22 +1383,19 @@ class DeviceIdentityEngine:
             ))
 
         # Risk: Very stable RSSI (stationary device)
-        rssi_samples = cluster.get_all_rssi_samples()
-        if len(rssi_samples) >= 5:
-            try:
-                stdev = statistics.stdev(rssi_samples)
-                if stdev < 3:
-                    cluster.add_risk_indicator(RiskIndicator(
-                        indicator_type='stable_rssi',
-                        description='Very stable signal suggests fixed placement',
-                        score=2,
-                        evidence={
-                            'rssi_stdev': round(stdev, 2),
-                            'sample_count': len(rssi_samples)
-                        }
-                    ))
-            except statistics.StatisticsError:
-                pass
+        rssi_count = len(cluster.get_all_rssi_samples())
+        if rssi_count >= 5:
+            stdev = cluster.get_rssi_stdev()
+            if stdev < 3:
+                cluster.add_risk_indicator(RiskIndicator(
+                    indicator_type='stable_rssi',
+                    description='Very stable signal suggests fixed placement',
+                    score=2,
+                    evidence={
+                        'rssi_stdev': round(stdev, 2),
+                        'sample_count': rssi_count
+                    }
+                ))
 
         # Risk: Multiple MAC addresses observed (MAC rotation)
         if len(cluster.linked_macs) > 1:
@@ -1022,20 +1421,18 @@ class DeviceIdentityEngine:
                 ))
 
         # Risk: Check for audio-capable services (BLE)
-        audio_service_prefixes = ['0000110', '00001108', '00001203']  # A2DP, Headset, Audio
-        cluster_uuids = set()
-        for session in cluster.sessions:
-            cluster_uuids.update(self._get_session_service_uuids(session))
-
-        for uuid in cluster_uuids:
-            if any(uuid.lower().startswith(prefix) for prefix in audio_service_prefixes):
-                cluster.add_risk_indicator(RiskIndicator(
-                    indicator_type='audio_capable',
-                    description='Audio-capable BLE services detected',
-                    score=2,
-                    evidence={'service_uuid': uuid}
-                ))
-                break
+        audio_match = _AUDIO_UUID_RE.match
+        audio_uuid = next(
+            (uuid for uuid in self._get_cluster_service_uuids(cluster) if audio_match(uuid)),
+            None
+        )
+        if audio_uuid is not None:
+            cluster.add_risk_indicator(RiskIndicator(
+                indicator_type='audio_capable',
+                description='Audio-capable BLE services detected',
+                score=2,
+                evidence={'service_uuid': audio_uuid}
+            ))
 
         # Risk: No name advertised (hidden identity)
         if not cluster.best_name:
@@ -1047,8 +1444,8 @@ class DeviceIdentityEngine:
             ))
 
         # Risk: High observation count relative to duration (aggressive advertising)
-        if cluster.first_seen and cluster.last_seen:
-            duration = (cluster.last_seen - cluster.first_seen).total_seconds()
+        if cluster._first_epoch is not None and cluster._last_epoch is not None:
+            duration = cluster._last_epoch - cluster._first_epoch
             if duration > 60 and cluster.total_observations > 0:
                 obs_rate = cluster.total_observations / duration
                 if obs_rate > 2.0:  # More than 2 observations per second
@@ -1084,24 +1481,23 @@ class DeviceIdentityEngine:
             if c.risk_level == RiskLevel.HIGH
         ]
 
-    def get_summary(self) -> dict:
-        """Get summary of all clusters and sessions."""
-        clusters_by_risk = {
-            'high': [],
-            'medium': [],
-            'low': [],
-            'informational': []
-        }
+    def get_summary(self, include_clusters: bool = True) -> dict:
+        """
+        Get summary of all clusters and sessions.
 
+        With include_clusters=False the per-cluster dicts are not built and
+        'clusters_by_risk' is omitted; the statistics are unchanged.
+        """
+        by_level = {level: [] for level in RiskLevel}
         for cluster in self.clusters.values():
-            clusters_by_risk[cluster.risk_level.value].append(cluster.to_dict())
+            by_level[cluster.risk_level].append(cluster)
 
-        return {
+        summary = {
             'monitoring_period': {
                 'start': self.monitoring_start.isoformat() if self.monitoring_start else None,
                 'end': self.monitoring_end.isoformat() if self.monitoring_end else None,
                 'duration_seconds': (
-                    (self.monitoring_end - self.monitoring_start).total_seconds()
+                    self._end_epoch - self._start_epoch
                     if self.monitoring_start and self.monitoring_end else 0
                 )
             },
@@ -1109,19 +1505,25 @@ class DeviceIdentityEngine:
                 'total_clusters': len(self.clusters),
                 'ble_sessions': len(self.ble_sessions),
                 'wifi_sessions': len(self.wifi_sessions),
-                'high_risk_count': len(clusters_by_risk['high']),
-                'medium_risk_count': len(clusters_by_risk['medium']),
-                'low_risk_count': len(clusters_by_risk['low']),
+                'high_risk_count': len(by_level[RiskLevel.HIGH]),
+                'medium_risk_count': len(by_level[RiskLevel.MEDIUM]),
+                'low_risk_count': len(by_level[RiskLevel.LOW]),
                 'unique_fingerprints': len(self._fingerprint_to_sessions),
             },
-            'clusters_by_risk': clusters_by_risk,
-            'disclaimer': (
-                "Device clustering uses passive fingerprinting and statistical correlation. "
-                "Results indicate probable device identities, NOT confirmed matches. "
-                "Confidence scores reflect similarity measures, not certainty. "
-                "False positives and false negatives are expected."
-            ),
         }
+        if include_clusters:
+            summary['clusters_by_risk'] = {
+                level.value: [c.to_dict() for c in by_level[level]]
+                for level in (RiskLevel.HIGH, RiskLevel.MEDIUM,
+                              RiskLevel.LOW, RiskLevel.INFORMATIONAL)
+            }
+        summary['disclaimer'] = (
+            "Device clustering uses passive fingerprinting and statistical correlation. "
+            "Results indicate probable device identities, NOT confirmed matches. "
+            "Confidence scores reflect similarity measures, not certainty. "
+            "False positives and false negatives are expected."
+        )
+        return summary
 
     def clear(self) -> None:
         """Clear all state."""
@@ -1129,10 +1531,14 @@ class DeviceIdentityEngine:
         self.wifi_sessions.clear()
         self.clusters.clear()
         self._fingerprint_to_sessions.clear()
+        self._fingerprint_to_clusters.clear()
+        self._fp_index = _FingerprintIndex()
         self._session_counter = 0
         self._cluster_counter = 0
         self.monitoring_start = None
         self.monitoring_end = None
+        self._start_epoch = 0.0
+        self._end_epoch = 0.0
 
 
 # =============================================================================
@@ -1157,55 +1563,82 @@ def reset_identity_engine() -> None:
     _identity_engine = DeviceIdentityEngine()
 
 
+def _str_to_bytes(value: str) -> bytes:
+    # Assume hex string
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        # Not a valid hex string, encode as UTF-8
+        return value.encode('utf-8')
+
+
+def _ints_to_bytes(value) -> Optional[bytes]:
+    # Array of integers (like dbus.Array)
+    try:
+        return bytes(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Exact-type dispatch for the common payload types
+_BYTE_CONVERTERS = {
+    bytes: lambda value: value,
+    bytearray: bytes,
+    str: _str_to_bytes,
+    list: _ints_to_bytes,
+    tuple: _ints_to_bytes,
+}
+
+
 def _convert_to_bytes(value) -> Optional[bytes]:
     """Convert various data types to bytes safely."""
     if value is None:
         return None
+    converter = _BYTE_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+
+    # Subclasses (dbus.ByteArray, dbus.Array, ...) miss the exact-type table
     if isinstance(value, bytes):
         return value
     if isinstance(value, bytearray):
         return bytes(value)
     if isinstance(value, str):
-        # Assume hex string
-        try:
-            return bytes.fromhex(value)
-        except ValueError:
-            # Not a valid hex string, encode as UTF-8
-            return value.encode('utf-8')
+        return _str_to_bytes(value)
     if isinstance(value, (list, tuple)):
-        # Array of integers (like dbus.Array)
-        try:
-            return bytes(value)
-        except (TypeError, ValueError):
-            return None
+        return _ints_to_bytes(value)
     return None
 
 
+# Keyword arguments accepted by each observation constructor
+_BLE_FIELDS = frozenset(f.name for f in fields(BLEObservation) if f.init)
+_WIFI_FIELDS = frozenset(f.name for f in fields(WifiObservation) if f.init)
+
+
+def _dict_timestamp(data: dict) -> datetime:
+    """Timestamp from an ingest dict: ISO string, datetime, or now if absent."""
+    ts = data.get('timestamp')
+    if isinstance(ts, str):
+        return datetime.fromisoformat(ts)
+    return ts if 'timestamp' in data else datetime.now()
+
+
 def ingest_ble_dict(data: dict) -> DeviceSession:
     """
     Ingest BLE observation from dictionary.
 
     Convenience function for API integration.
     """
-    obs = BLEObservation(
-        timestamp=datetime.fromisoformat(data['timestamp']) if isinstance(data.get('timestamp'), str)
-                  else data.get('timestamp', datetime.now()),
-        addr=data.get('addr', data.get('mac', '')).upper(),
-        addr_type=data.get('addr_type', 'unknown'),
-        rssi=data.get('rssi'),
-        tx_power=data.get('tx_power'),
-        adv_type=data.get('adv_type', 'unknown'),
-        adv_flags=data.get('adv_flags'),
-        manufacturer_id=data.get('manufacturer_id'),
-        manufacturer_data=_convert_to_bytes(data.get('manufacturer_data')),
-        service_uuids=data.get('service_uuids', []),
-        service_data=_convert_to_bytes(data.get('service_data')),
-        local_name=data.get('local_name', data.get('name')),
-        appearance=data.get('appearance'),
-        packet_length=data.get('packet_length'),
-        phy=data.get('phy'),
-    )
-    return get_identity_engine().ingest_ble_observation(obs)
+    payload = {key: data[key] for key in data.keys() & _BLE_FIELDS}
+    payload['timestamp'] = _dict_timestamp(data)
+    payload['addr'] = data.get('addr', data.get('mac', '')).upper()
+    if 'local_name' not in payload:
+        payload['local_name'] = data.get('name')
+    if 'manufacturer_data' in payload:
+        payload['manufacturer_data'] = _convert_to_bytes(payload['manufacturer_data'])
+    if 'service_data' in payload:
+        payload['service_data'] = _convert_to_bytes(payload['service_data'])
+    return get_identity_engine().ingest_ble_observation(BLEObservation(**payload))
 
 
 def ingest_wifi_dict(data: dict) -> DeviceSession:
@@ -1214,30 +1647,7 @@ def ingest_wifi_dict(data: dict) -> DeviceSession:
 
     Convenience function for API integration.
     """
-    obs = WifiObservation(
-        timestamp=datetime.fromisoformat(data['timestamp']) if isinstance(data.get('timestamp'), str)
-                  else data.get('timestamp', datetime.now()),
-        src_mac=data.get('src_mac', data.get('mac', '')).upper(),
-        dst_mac=data.get('dst_mac'),
-        bssid=data.get('bssid'),
-        ssid=data.get('ssid'),
-        frame_type=data.get('frame_type', 'unknown'),
-        rssi=data.get('rssi'),
-        channel=data.get('channel'),
-        bandwidth=data.get('bandwidth'),
-        encryption=data.get('encryption'),
-        beacon_interval=data.get('beacon_interval'),
-        capabilities=data.get('capabilities'),
-        supported_rates=data.get('supported_rates', []),
-        extended_rates=data.get('extended_rates', []),
-        ht_capable=data.get('ht_capable', False),
-        vht_capable=data.get('vht_capable', False),
-        he_capable=data.get('he_capable', False),
-        ht_capabilities=data.get('ht_capabilities'),
-        vht_capabilities=data.get('vht_capabilities'),
-        vendor_ies=data.get('vendor_ies', []),
-        wps_present=data.get('wps_present', False),
-        sequence_number=data.get('sequence_number'),
-        probed_ssids=data.get('probed_ssids', []),
-    )
-    return get_identity_engine().ingest_wifi_observation(obs)
+    payload = {key: data[key] for key in data.keys() & _WIFI_FIELDS}
+    payload['timestamp'] = _dict_timestamp(data)
+    payload['src_mac'] = data.get('src_mac', data.get('mac', '')).upper()
+    return get_identity_engine().ingest_wifi_observation(WifiObservation(**payload))
@@ -4,33 +4,92 @@ GitHub update checking and git-based update mechanism.
 
 from __future__ import annotations
 
+import base64
+import http.client
 import json
 import logging
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 import config
-from utils.database import get_setting, set_setting
+from utils.database import get_settings, set_setting, set_settings
+
+# orjson is optional - faster decoding of the release JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 logger = logging.getLogger('intercept.updater')
 
+# Checkout the updater runs git in
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Cache keys for settings
 CACHE_KEY_LAST_CHECK = 'update.last_check'
+CACHE_KEY_LAST_CHECK_ISO = 'update.last_check_iso'
 CACHE_KEY_LATEST_VERSION = 'update.latest_version'
 CACHE_KEY_RELEASE_URL = 'update.release_url'
 CACHE_KEY_RELEASE_NOTES = 'update.release_notes'
 CACHE_KEY_DISMISSED_VERSION = 'update.dismissed_version'
+CACHE_KEY_ETAG = 'update.etag'
+CACHE_KEY_LAST_MODIFIED = 'update.last_modified'
+CACHE_KEY_NEXT_CHECK_AFTER = 'update.next_check_after'
+
+# Everything the update check reads, fetched with one query
+_CACHE_KEYS = [
+    CACHE_KEY_LAST_CHECK,
+    CACHE_KEY_LAST_CHECK_ISO,
+    CACHE_KEY_LATEST_VERSION,
+    CACHE_KEY_RELEASE_URL,
+    CACHE_KEY_RELEASE_NOTES,
+    CACHE_KEY_DISMISSED_VERSION,
+    CACHE_KEY_ETAG,
+    CACHE_KEY_LAST_MODIFIED,
+    CACHE_KEY_NEXT_CHECK_AFTER,
+]
 
 # Default check interval (6 hours in seconds)
 DEFAULT_CHECK_INTERVAL = 6 * 60 * 60
 
+# Bounds on what a release fetch will read and keep
+MAX_RELEASE_BYTES = 256 * 1024
+MAX_RELEASE_NOTES_CHARS = 8000
+
+# Returned by _fetch_github_release() when GitHub answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+# Keep-alive connection to the GitHub API, reused across update checks so
+# each check skips the TCP and TLS handshake. Created lazily, dropped on error.
+GITHUB_API_HOST = 'api.github.com'
+_gh_conn: http.client.HTTPSConnection | None = None
+_gh_conn_lock = threading.Lock()
+
+# In-process memo of cached status results, so UI polling skips the database.
+# Entries live at most this long (or the check interval, if shorter).
+STATUS_MEMO_TTL = 60
+_status_memo: dict[str, tuple[float, dict[str, Any]]] = {}
+_status_memo_lock = threading.Lock()
+
+# Held for the whole GitHub fetch, so concurrent checks make one request
+_fetch_lock = threading.Lock()
+
+# Background refresh of a stale cache (at most one in flight)
+_refresh_lock = threading.Lock()
+_refresh_in_flight = False
+
+# Leading digits of each dot-separated version component ('' if none)
+_VERSION_PART_RE = re.compile(r'(?:^|\.)(\d*)')
+
 
 def _get_github_repo() -> str:
     """Get the configured GitHub repository."""
@@ -43,11 +102,62 @@ def _get_check_interval() -> int:
     return hours * 60 * 60
 
 
+def _next_check_due(cached: dict[str, Any], last_check_time: float) -> float:
+    """
+    Time the next GitHub check is due.
+
+    The configured interval after the last check, pushed back to the
+    floor GitHub's poll and rate-limit headers last asked for.
+    """
+    due = last_check_time + _get_check_interval()
+    try:
+        return max(due, float(cached.get(CACHE_KEY_NEXT_CHECK_AFTER) or 0))
+    except (ValueError, TypeError):
+        return due
+
+
 def _is_update_check_enabled() -> bool:
     """Check if update checking is enabled."""
     return getattr(config, 'UPDATE_CHECK_ENABLED', True)
 
 
+def _memo_get(name: str) -> dict[str, Any] | None:
+    """Return a copy of a memoized status result if it is still fresh."""
+    with _status_memo_lock:
+        entry = _status_memo.get(name)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at >= min(STATUS_MEMO_TTL, _get_check_interval()):
+        return None
+    return dict(result)
+
+
+def _memo_put(name: str, result: dict[str, Any]) -> dict[str, Any]:
+    """Memoize a status result and return it."""
+    with _status_memo_lock:
+        _status_memo[name] = (time.monotonic(), dict(result))
+    return result
+
+
+def _memo_clear() -> None:
+    """Drop memoized status results after the cached settings change."""
+    with _status_memo_lock:
+        _status_memo.clear()
+
+
+@lru_cache(maxsize=64)
+def _parse_version(v: str) -> tuple:
+    """Parse a version string into a tuple of at least 3 integers."""
+    # Strip 'v' prefix if present. Each component's leading digits give its
+    # value, so pre-release suffixes like 2.11.0-beta are ignored; a
+    # component with no leading digits counts as 0.
+    parts = [int(n) if n else 0 for n in _VERSION_PART_RE.findall(v.lstrip('v'))]
+    # Pad to at least 3 parts
+    parts.extend([0] * (3 - len(parts)))
+    return tuple(parts)
+
+
 def _compare_versions(current: str, latest: str) -> int:
     """
     Compare two semantic version strings.
@@ -57,26 +167,13 @@ def _compare_versions(current: str, latest: str) -> int:
          0 if current == latest
          1 if current > latest
     """
-    def parse_version(v: str) -> tuple:
-        # Strip 'v' prefix if present
-        v = v.lstrip('v')
-        # Split by dots and convert to integers
-        parts = []
-        for part in v.split('.'):
-            # Handle pre-release suffixes like 2.11.0-beta
-            match = re.match(r'^(\d+)', part)
-            if match:
-                parts.append(int(match.group(1)))
-            else:
-                parts.append(0)
-        # Pad to at least 3 parts
-        while len(parts) < 3:
-            parts.append(0)
-        return tuple(parts)
+    # Common case: running the cached release, no parsing needed
+    if current == latest or current.lstrip('v') == latest.lstrip('v'):
+        return 0
 
     try:
-        current_parts = parse_version(current)
-        latest_parts = parse_version(latest)
+        current_parts = _parse_version(current)
+        latest_parts = _parse_version(latest)
 
         if current_parts < latest_parts:
             return -1
@@ -88,43 +185,161 @@ def _compare_versions(current: str, latest: str) -> int:
         return 0
 
 
-def _fetch_github_release() -> dict[str, Any] | None:
+def _new_github_connection() -> http.client.HTTPSConnection:
+    """Open a GitHub API connection, tunnelling through an HTTPS proxy if configured."""
+    proxy = getproxies().get('https')
+    if proxy and not proxy_bypass(GITHUB_API_HOST):
+        parts = urlsplit(proxy if '://' in proxy else f'http://{proxy}')
+        # Same defaults as urllib's ProxyHandler: the scheme's port, and
+        # Basic auth from any user:pass@ in the proxy URL
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        tunnel_headers = None
+        if parts.username is not None:
+            user_pass = f'{unquote(parts.username)}:{unquote(parts.password or "")}'
+            creds = base64.b64encode(user_pass.encode()).decode('ascii')
+            tunnel_headers = {'Proxy-Authorization': f'Basic {creds}'}
+        conn = http.client.HTTPSConnection(parts.hostname, port, timeout=10)
+        conn.set_tunnel(GITHUB_API_HOST, headers=tunnel_headers)
+        return conn
+    return http.client.HTTPSConnection(GITHUB_API_HOST, timeout=10)
+
+
+def _close_github_connection() -> None:
+    """Drop the shared GitHub connection so the next request reconnects."""
+    global _gh_conn
+    if _gh_conn is not None:
+        _gh_conn.close()
+        _gh_conn = None
+
+
+def _github_request(path: str, headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bytes]:
+    """One GET on the shared connection, reading at most MAX_RELEASE_BYTES + 1 bytes."""
+    global _gh_conn
+    if _gh_conn is None:
+        _gh_conn = _new_github_connection()
+    try:
+        _gh_conn.request('GET', path, headers=headers)
+        response = _gh_conn.getresponse()
+        payload = response.read(MAX_RELEASE_BYTES + 1)
+    except (http.client.HTTPException, OSError):
+        _close_github_connection()
+        raise
+    # An unread remainder or a server-side close leaves the connection unusable
+    if len(payload) > MAX_RELEASE_BYTES or response.will_close:
+        _close_github_connection()
+    return response, payload
+
+
+def _github_get(path: str, headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bytes]:
+    """
+    GET a GitHub API path over the shared keep-alive connection.
+
+    A request on a reused connection that fails is retried once on a fresh
+    one, since GitHub closes idle connections long before the next periodic
+    check. Caller must hold _gh_conn_lock.
+    """
+    reused = _gh_conn is not None
+    try:
+        return _github_request(path, headers)
+    except (http.client.HTTPException, OSError):
+        if not reused:
+            raise
+    return _github_request(path, headers)
+
+
+def _record_github_backoff(headers: Any) -> None:
+    """
+    Persist the earliest next check GitHub's response headers allow.
+
+    X-Poll-Interval is honoured as given. The rate-limit window spreads the
+    remaining requests evenly until X-RateLimit-Reset, so the floor backs
+    off as the quota runs down and waits for the reset once it is spent.
+    Nothing is written when the headers set no floor.
+    """
+    now = time.time()
+    floor = 0.0
+    try:
+        poll = headers.get('X-Poll-Interval')
+        if poll:
+            floor = now + int(poll)
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset:
+            remaining = int(remaining)
+            reset = float(reset)
+            if remaining <= 0:
+                floor = max(floor, reset)
+            elif reset > now:
+                floor = max(floor, now + (reset - now) / remaining)
+    except (ValueError, TypeError):
+        return
+    if floor > now:
+        set_setting(CACHE_KEY_NEXT_CHECK_AFTER, str(floor))
+
+
+def _fetch_github_release(etag: str | None = None,
+                          last_modified: str | None = None) -> dict[str, Any] | object | None:
     """
     Fetch the latest release from GitHub API.
 
+    Args:
+        etag: Cached ETag to revalidate with (If-None-Match)
+        last_modified: Cached Last-Modified to revalidate with (If-Modified-Since)
+
     Returns:
-        Dict with release info or None on error
+        Dict with release info, _NOT_MODIFIED if the cached release is
+        still current, or None on error
     """
     repo = _get_github_repo()
-    url = f'https://api.github.com/repos/{repo}/releases/latest'
+    path = f'/repos/{repo}/releases/latest'
 
     try:
-        req = Request(url, headers={
+        headers = {
             'User-Agent': 'Intercept-SIGINT',
             'Accept': 'application/vnd.github.v3+json'
-        })
-
-        with urlopen(req, timeout=10) as response:
-            # Check rate limit headers
-            remaining = response.headers.get('X-RateLimit-Remaining')
-            if remaining and int(remaining) < 10:
-                logger.warning(f"GitHub API rate limit low: {remaining} remaining")
-
-            data = json.loads(response.read().decode('utf-8'))
-            return {
-                'tag_name': data.get('tag_name', ''),
-                'html_url': data.get('html_url', ''),
-                'body': data.get('body', ''),
-                'published_at': data.get('published_at', ''),
-                'name': data.get('name', '')
-            }
-    except HTTPError as e:
-        if e.code == 404:
+        }
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        with _gh_conn_lock:
+            response, payload = _github_get(path, headers)
+        _record_github_backoff(response.headers)
+
+        if response.status == 304:
+            return _NOT_MODIFIED
+        if response.status == 404:
             logger.info("No releases found on GitHub")
+            return None
+        if response.status != 200:
+            logger.warning(f"GitHub API error: {response.status} {response.reason}")
+            return None
+
+        # Check rate limit headers
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining and int(remaining) < 10:
+            logger.warning(f"GitHub API rate limit low: {remaining} remaining")
+
+        if len(payload) > MAX_RELEASE_BYTES:
+            logger.warning(f"GitHub release response exceeds {MAX_RELEASE_BYTES} bytes, ignoring")
+            return None
+
+        # Both parsers take the raw bytes; no intermediate str copy
+        if orjson is not None:
+            data = orjson.loads(payload)
         else:
-            logger.warning(f"GitHub API error: {e.code} {e.reason}")
-        return None
-    except URLError as e:
+            data = json.loads(payload)
+        return {
+            'tag_name': data.get('tag_name', ''),
+            'html_url': data.get('html_url', ''),
+            'body': (data.get('body') or '')[:MAX_RELEASE_NOTES_CHARS],
+            'published_at': data.get('published_at', ''),
+            'name': data.get('name', ''),
+            'etag': response.headers.get('ETag') or '',
+            'last_modified': response.headers.get('Last-Modified') or '',
+        }
+    except (http.client.HTTPException, OSError) as e:
         logger.warning(f"Failed to fetch GitHub release: {e}")
         return None
     except Exception as e:
@@ -132,68 +347,60 @@ def _fetch_github_release() -> dict[str, Any] | None:
         return None
 
 
-def check_for_updates(force: bool = False) -> dict[str, Any]:
-    """
-    Check GitHub for updates.
+def _last_check_iso(cached: dict[str, Any], last_check_time: float) -> str:
+    """ISO form of the last check, as stored with it (rebuilt for older caches)."""
+    return cached.get(CACHE_KEY_LAST_CHECK_ISO) or datetime.fromtimestamp(last_check_time).isoformat()
 
-    Uses caching to avoid excessive API calls. Only checks GitHub if:
-    - force=True, or
-    - Last check was more than check_interval ago
 
-    Args:
-        force: If True, bypass cache and check GitHub directly
+def _cached_update_result(current_version: str, cached: dict[str, Any],
+                          last_check_time: float) -> dict[str, Any]:
+    """Build the check_for_updates() result from the cached release."""
+    cached_version = cached[CACHE_KEY_LATEST_VERSION]
+    dismissed = cached.get(CACHE_KEY_DISMISSED_VERSION)
+    update_available = _compare_versions(current_version, cached_version) < 0
 
-    Returns:
-        Dict with update status information
-    """
-    if not _is_update_check_enabled():
-        return {
-            'success': True,
-            'update_available': False,
-            'disabled': True,
-            'message': 'Update checking is disabled'
-        }
+    # Don't show update if user dismissed this version
+    show_notification = update_available and dismissed != cached_version
 
-    current_version = config.VERSION
+    return {
+        'success': True,
+        'checked': True,
+        'update_available': update_available,
+        'show_notification': show_notification,
+        'current_version': current_version,
+        'latest_version': cached_version,
+        'release_url': cached.get(CACHE_KEY_RELEASE_URL) or '',
+        'release_notes': cached.get(CACHE_KEY_RELEASE_NOTES) or '',
+        'cached': True,
+        'last_check': _last_check_iso(cached, last_check_time)
+    }
 
-    # Check cache unless forced
-    if not force:
-        last_check = get_setting(CACHE_KEY_LAST_CHECK)
-        if last_check:
-            try:
-                last_check_time = float(last_check)
-                check_interval = _get_check_interval()
-                if time.time() - last_check_time < check_interval:
-                    # Return cached data
-                    cached_version = get_setting(CACHE_KEY_LATEST_VERSION)
-                    if cached_version:
-                        dismissed = get_setting(CACHE_KEY_DISMISSED_VERSION)
-                        update_available = _compare_versions(current_version, cached_version) < 0
-
-                        # Don't show update if user dismissed this version
-                        show_notification = update_available and dismissed != cached_version
-
-                        return {
-                            'success': True,
-                            'checked': True,
-                            'update_available': update_available,
-                            'show_notification': show_notification,
-                            'current_version': current_version,
-                            'latest_version': cached_version,
-                            'release_url': get_setting(CACHE_KEY_RELEASE_URL) or '',
-                            'release_notes': get_setting(CACHE_KEY_RELEASE_NOTES) or '',
-                            'cached': True,
-                            'last_check': datetime.fromtimestamp(last_check_time).isoformat()
-                        }
-            except (ValueError, TypeError):
-                pass
 
-    # Fetch from GitHub
-    release = _fetch_github_release()
+def _fetch_and_cache_release(current_version: str, cached: dict[str, Any]) -> dict[str, Any]:
+    """Fetch the latest release from GitHub, update the cache and build the result."""
+    cached_version = cached.get(CACHE_KEY_LATEST_VERSION)
+
+    # Revalidate conditionally when there is a cached release
+    if cached_version:
+        release = _fetch_github_release(
+            etag=cached.get(CACHE_KEY_ETAG),
+            last_modified=cached.get(CACHE_KEY_LAST_MODIFIED),
+        )
+    else:
+        release = _fetch_github_release()
+
+    if release is _NOT_MODIFIED:
+        now = time.time()
+        checked = {
+            CACHE_KEY_LAST_CHECK: str(now),
+            CACHE_KEY_LAST_CHECK_ISO: datetime.fromtimestamp(now).isoformat(),
+        }
+        set_settings(checked)
+        _memo_clear()
+        return _cached_update_result(current_version, {**cached, **checked}, now)
 
     if not release:
         # Return cached data if available, otherwise error
-        cached_version = get_setting(CACHE_KEY_LATEST_VERSION)
         if cached_version:
             update_available = _compare_versions(current_version, cached_version) < 0
             return {
@@ -202,8 +409,8 @@ def check_for_updates(force: bool = False) -> dict[str, Any]:
                 'update_available': update_available,
                 'current_version': current_version,
                 'latest_version': cached_version,
-                'release_url': get_setting(CACHE_KEY_RELEASE_URL) or '',
-                'release_notes': get_setting(CACHE_KEY_RELEASE_NOTES) or '',
+                'release_url': cached.get(CACHE_KEY_RELEASE_URL) or '',
+                'release_notes': cached.get(CACHE_KEY_RELEASE_NOTES) or '',
                 'cached': True,
                 'network_error': True
             }
@@ -213,15 +420,23 @@ def check_for_updates(force: bool = False) -> dict[str, Any]:
         }
 
     latest_version = release['tag_name'].lstrip('v')
+    now = time.time()
+    last_check_iso = datetime.fromtimestamp(now).isoformat()
 
     # Update cache
-    set_setting(CACHE_KEY_LAST_CHECK, str(time.time()))
-    set_setting(CACHE_KEY_LATEST_VERSION, latest_version)
-    set_setting(CACHE_KEY_RELEASE_URL, release['html_url'])
-    set_setting(CACHE_KEY_RELEASE_NOTES, release['body'][:2000] if release['body'] else '')
+    set_settings({
+        CACHE_KEY_LAST_CHECK: str(now),
+        CACHE_KEY_LAST_CHECK_ISO: last_check_iso,
+        CACHE_KEY_LATEST_VERSION: latest_version,
+        CACHE_KEY_RELEASE_URL: release['html_url'],
+        CACHE_KEY_RELEASE_NOTES: release['body'],
+        CACHE_KEY_ETAG: release['etag'],
+        CACHE_KEY_LAST_MODIFIED: release['last_modified'],
+    })
+    _memo_clear()
 
     update_available = _compare_versions(current_version, latest_version) < 0
-    dismissed = get_setting(CACHE_KEY_DISMISSED_VERSION)
+    dismissed = cached.get(CACHE_KEY_DISMISSED_VERSION)
     show_notification = update_available and dismissed != latest_version
 
     return {
@@ -232,14 +447,108 @@ def check_for_updates(force: bool = False) -> dict[str, Any]:
         'current_version': current_version,
         'latest_version': latest_version,
         'release_url': release['html_url'],
-        'release_notes': release['body'] or '',
+        'release_notes': release['body'],
         'release_name': release['name'] or f'v{latest_version}',
         'published_at': release['published_at'],
         'cached': False,
-        'last_check': datetime.now().isoformat()
+        'last_check': last_check_iso
     }
 
 
+def _refresh_release(current_version: str, cached: dict[str, Any]) -> dict[str, Any]:
+    """
+    Refresh the release cache, coalescing concurrent callers into one fetch.
+
+    Callers that queued behind a fetch find the last-check time changed
+    when they get the lock and return that result instead of fetching again.
+    """
+    seen_check = cached.get(CACHE_KEY_LAST_CHECK)
+    with _fetch_lock:
+        cached = get_settings(_CACHE_KEYS)
+        last_check = cached.get(CACHE_KEY_LAST_CHECK)
+        if cached.get(CACHE_KEY_LATEST_VERSION) and last_check and last_check != seen_check:
+            try:
+                return _cached_update_result(current_version, cached, float(last_check))
+            except (ValueError, TypeError):
+                pass
+        return _fetch_and_cache_release(current_version, cached)
+
+
+def _background_refresh() -> None:
+    """Refresh the release cache off the request path."""
+    global _refresh_in_flight
+    try:
+        _refresh_release(config.VERSION, get_settings(_CACHE_KEYS))
+    except Exception as e:
+        logger.warning(f"Background update check failed: {e}")
+    finally:
+        with _refresh_lock:
+            _refresh_in_flight = False
+
+
+def _start_background_refresh() -> None:
+    """Start a background refresh unless one is already running."""
+    global _refresh_in_flight
+    with _refresh_lock:
+        if _refresh_in_flight:
+            return
+        _refresh_in_flight = True
+    threading.Thread(target=_background_refresh, name='update-check', daemon=True).start()
+
+
+def check_for_updates(force: bool = False) -> dict[str, Any]:
+    """
+    Check GitHub for updates.
+
+    Uses caching to avoid excessive API calls. Only checks GitHub if:
+    - force=True, or
+    - Last check was more than check_interval ago
+
+    A stale cached release is returned immediately (marked 'stale') while
+    a background thread refreshes it; only force=True, or having no cached
+    release at all, waits on GitHub.
+
+    Args:
+        force: If True, bypass cache and check GitHub directly
+
+    Returns:
+        Dict with update status information
+    """
+    if not _is_update_check_enabled():
+        return {
+            'success': True,
+            'update_available': False,
+            'disabled': True,
+            'message': 'Update checking is disabled'
+        }
+
+    if not force:
+        memo = _memo_get('check')
+        if memo is not None:
+            return memo
+
+    current_version = config.VERSION
+    cached = get_settings(_CACHE_KEYS)
+
+    # Serve the cache unless forced, refreshing it in the background if stale
+    if not force and cached.get(CACHE_KEY_LATEST_VERSION):
+        try:
+            last_check_time = float(cached.get(CACHE_KEY_LAST_CHECK))
+        except (ValueError, TypeError):
+            last_check_time = None
+        if last_check_time is not None:
+            result = _cached_update_result(current_version, cached, last_check_time)
+            if time.time() < _next_check_due(cached, last_check_time):
+                return _memo_put('check', result)
+            result['stale'] = True
+            # Memoize before starting, so the refresh's memo clear wins
+            _memo_put('check', result)
+            _start_background_refresh()
+            return result
+
+    return _refresh_release(current_version, cached)
+
+
 def get_update_status() -> dict[str, Any]:
     """
     Get current update status from cache without triggering a check.
@@ -247,17 +556,22 @@ def get_update_status() -> dict[str, Any]:
     Returns:
         Dict with cached update status
     """
+    memo = _memo_get('status')
+    if memo is not None:
+        return memo
+
     current_version = config.VERSION
-    cached_version = get_setting(CACHE_KEY_LATEST_VERSION)
-    last_check = get_setting(CACHE_KEY_LAST_CHECK)
-    dismissed = get_setting(CACHE_KEY_DISMISSED_VERSION)
+    cached = get_settings(_CACHE_KEYS)
+    cached_version = cached.get(CACHE_KEY_LATEST_VERSION)
+    last_check = cached.get(CACHE_KEY_LAST_CHECK)
+    dismissed = cached.get(CACHE_KEY_DISMISSED_VERSION)
 
     if not cached_version:
-        return {
+        return _memo_put('status', {
             'success': True,
             'checked': False,
             'current_version': current_version
-        }
+        })
 
     update_available = _compare_versions(current_version, cached_version) < 0
     show_notification = update_available and dismissed != cached_version
@@ -265,22 +579,22 @@ def get_update_status() -> dict[str, Any]:
     last_check_time = None
     if last_check:
         try:
-            last_check_time = datetime.fromtimestamp(float(last_check)).isoformat()
+            last_check_time = _last_check_iso(cached, float(last_check))
         except (ValueError, TypeError):
             pass
 
-    return {
+    return _memo_put('status', {
         'success': True,
         'checked': True,
         'update_available': update_available,
         'show_notification': show_notification,
         'current_version': current_version,
         'latest_version': cached_version,
-        'release_url': get_setting(CACHE_KEY_RELEASE_URL) or '',
-        'release_notes': get_setting(CACHE_KEY_RELEASE_NOTES) or '',
+        'release_url': cached.get(CACHE_KEY_RELEASE_URL) or '',
+        'release_notes': cached.get(CACHE_KEY_RELEASE_NOTES) or '',
         'dismissed_version': dismissed,
         'last_check': last_check_time
-    }
+    })
 
 
 def dismiss_update(version: str) -> dict[str, Any]:
@@ -294,62 +608,79 @@ def dismiss_update(version: str) -> dict[str, Any]:
         Status dict
     """
     set_setting(CACHE_KEY_DISMISSED_VERSION, version)
+    _memo_clear()
     return {
         'success': True,
         'dismissed_version': version
     }
 
 
-def _is_git_repo() -> bool:
-    """Check if the current directory is a git repository."""
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--is-inside-work-tree'],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        )
-        return result.returncode == 0 and result.stdout.strip() == 'true'
-    except Exception:
-        return False
+def _porcelain_v1_entry(line: str) -> str | None:
+    """
+    Convert a `git status --porcelain=v2` entry to the v1 "XY path" form.
+
+    Returns None for header and ignored-file lines.
+    """
+    kind = line[:1]
+    if kind == '?':
+        return f'??{line[1:]}'
+    if kind == '1':
+        fields = line.split(' ', 8)
+        return f"{fields[1].replace('.', ' ')} {fields[8]}"
+    if kind == '2':
+        fields = line.split(' ', 9)
+        path, _, orig_path = fields[9].partition('\t')
+        return f"{fields[1].replace('.', ' ')} {orig_path} -> {path}"
+    if kind == 'u':
+        fields = line.split(' ', 10)
+        return f'{fields[1]} {fields[10]}'
+    return None
 
 
 def _get_git_status() -> dict[str, Any]:
-    """Get git repository status."""
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    """
+    Get git repository status.
 
+    One `git status --porcelain=v2 --branch` call answers whether this is a
+    git checkout, whether it has uncommitted changes, and the current branch.
+    """
     try:
-        # Check for uncommitted changes
         result = subprocess.run(
-            ['git', 'status', '--porcelain'],
+            ['git', '--no-optional-locks', 'status', '--porcelain=v2', '--branch'],
             capture_output=True,
             text=True,
             timeout=10,
-            cwd=repo_root
+            cwd=_REPO_ROOT
         )
+        if result.returncode != 0:
+            return {
+                'is_repo': False,
+                'has_changes': False,
+                'changed_files': [],
+                'current_branch': 'unknown'
+            }
 
-        has_changes = bool(result.stdout.strip())
-        changed_files = result.stdout.strip().split('\n') if has_changes else []
-
-        # Get current branch
-        branch_result = subprocess.run(
-            ['git', 'branch', '--show-current'],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=repo_root
-        )
-        current_branch = branch_result.stdout.strip() or 'main'
+        current_branch = ''
+        changed_files = []
+        for line in result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                current_branch = '' if head == '(detached)' else head
+                continue
+            entry = _porcelain_v1_entry(line)
+            if entry:
+                changed_files.append(entry)
 
         return {
-            'has_changes': has_changes,
-            'changed_files': [f for f in changed_files if f],
-            'current_branch': current_branch
+            'is_repo': True,
+            'has_changes': bool(changed_files),
+            'changed_files': changed_files,
+            'current_branch': current_branch or 'main'
         }
     except Exception as e:
         logger.warning(f"Error getting git status: {e}")
         return {
+            'is_repo': False,
             'has_changes': False,
             'changed_files': [],
             'current_branch': 'unknown',
@@ -357,6 +688,45 @@ def _get_git_status() -> dict[str, Any]:
         }
 
 
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _cached_release_is_current() -> bool:
+    """True if the cached latest release is fresh and not newer than VERSION."""
+    cached = get_settings([CACHE_KEY_LAST_CHECK, CACHE_KEY_LATEST_VERSION])
+    cached_version = cached.get(CACHE_KEY_LATEST_VERSION)
+    if not cached_version:
+        return False
+    try:
+        last_check_time = float(cached.get(CACHE_KEY_LAST_CHECK))
+    except (ValueError, TypeError):
+        return False
+    if time.time() - last_check_time >= _get_check_interval():
+        return False
+    return _compare_versions(config.VERSION, cached_version) >= 0
+
+
+def _git_env() -> dict[str, str]:
+    """Environment for networked git commands: fail instead of prompting."""
+    return {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+
+def _git_is_ancestor(commit: str, descendant: str) -> int:
+    """Exit code of `git merge-base --is-ancestor` (0 yes, 1 no, other on error)."""
+    return subprocess.run(
+        ['git', 'merge-base', '--is-ancestor', commit, descendant],
+        capture_output=True,
+        timeout=30,
+        cwd=_REPO_ROOT
+    ).returncode
+
+
 def perform_update(stash_changes: bool = False) -> dict[str, Any]:
     """
     Perform a git pull to update the application.
@@ -367,10 +737,10 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
     Returns:
         Dict with update result information
     """
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    git_status = _get_git_status()
 
     # Check if this is a git repo
-    if not _is_git_repo():
+    if not git_status['is_repo']:
         return {
             'success': False,
             'error': 'Not a git repository',
@@ -378,8 +748,6 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
             'message': 'This installation is not using git. Please update manually by downloading the latest release from GitHub.'
         }
 
-    git_status = _get_git_status()
-
     # Check for local changes
     if git_status['has_changes'] and not stash_changes:
         return {
@@ -389,6 +757,16 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
             'changed_files': git_status['changed_files']
         }
 
+    # Skip the network round-trip when a fresh release check already says
+    # the running version is current
+    if _cached_release_is_current():
+        return {
+            'success': True,
+            'updated': False,
+            'message': 'Already up to date',
+            'stashed': False
+        }
+
     try:
         # Stash changes if requested
         stashed = False
@@ -398,7 +776,7 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
                 capture_output=True,
                 text=True,
                 timeout=30,
-                cwd=repo_root
+                cwd=_REPO_ROOT
             )
             if stash_result.returncode == 0:
                 stashed = True
@@ -410,68 +788,70 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
                     'details': stash_result.stderr
                 }
 
-        # Get current requirements.txt hash to detect changes
-        req_path = os.path.join(repo_root, 'requirements.txt')
-        req_hash_before = None
-        if os.path.exists(req_path):
-            with open(req_path, 'rb') as f:
-                import hashlib
-                req_hash_before = hashlib.md5(f.read()).hexdigest()
+        # Snapshot requirements.txt to detect changes (git only rewrites
+        # files whose content changes, so mtime and size are enough)
+        req_path = os.path.join(_REPO_ROOT, 'requirements.txt')
+        req_stat_before = _file_signature(req_path)
+
+        # Get the main branch name
+        branch = git_status.get('current_branch', 'main')
 
-        # Fetch latest changes
+        # Fetch only the branch being updated; the fast-forward below applies
+        # FETCH_HEAD, so the objects are negotiated and transferred once
         fetch_result = subprocess.run(
-            ['git', 'fetch', 'origin'],
+            ['git', 'fetch', '--no-tags', 'origin', branch],
             capture_output=True,
             text=True,
             timeout=60,
-            cwd=repo_root
+            cwd=_REPO_ROOT,
+            env=_git_env()
         )
 
         if fetch_result.returncode != 0:
             # Restore stash if we stashed
             if stashed:
-                subprocess.run(['git', 'stash', 'pop'], cwd=repo_root, timeout=30)
+                subprocess.run(['git', 'stash', 'pop'], cwd=_REPO_ROOT, timeout=30)
             return {
                 'success': False,
                 'error': 'Failed to fetch updates',
                 'details': fetch_result.stderr
             }
 
-        # Get the main branch name
-        branch = git_status.get('current_branch', 'main')
+        # Nothing to apply if the fetched tip is already in HEAD
+        up_to_date = _git_is_ancestor('FETCH_HEAD', 'HEAD') == 0
 
-        # Pull changes
-        pull_result = subprocess.run(
-            ['git', 'pull', 'origin', branch],
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=repo_root
-        )
-
-        if pull_result.returncode != 0:
-            # Check for merge conflict
-            if 'CONFLICT' in pull_result.stdout or 'CONFLICT' in pull_result.stderr:
-                # Abort merge
-                subprocess.run(['git', 'merge', '--abort'], cwd=repo_root, timeout=30)
+        if not up_to_date:
+            # Local commits diverge from origin. Checked up front so a
+            # diverged branch never starts a merge that needs a merge --abort
+            if _git_is_ancestor('HEAD', 'FETCH_HEAD') == 1:
                 # Restore stash if we stashed
                 if stashed:
-                    subprocess.run(['git', 'stash', 'pop'], cwd=repo_root, timeout=30)
+                    subprocess.run(['git', 'stash', 'pop'], cwd=_REPO_ROOT, timeout=30)
                 return {
                     'success': False,
-                    'error': 'merge_conflict',
-                    'message': 'Merge conflict detected. The update was aborted. Please resolve conflicts manually or reset to a clean state.',
-                    'details': pull_result.stdout + pull_result.stderr
+                    'error': 'non_fast_forward',
+                    'message': 'Your local branch has commits that are not on GitHub, so it cannot be fast-forwarded. The update was not applied. Please rebase or reset your branch manually.'
                 }
 
-            # Restore stash if we stashed
-            if stashed:
-                subprocess.run(['git', 'stash', 'pop'], cwd=repo_root, timeout=30)
-            return {
-                'success': False,
-                'error': 'Failed to pull updates',
-                'details': pull_result.stderr
-            }
+            # Apply the fetched tip
+            pull_result = subprocess.run(
+                ['git', 'merge', '--ff-only', 'FETCH_HEAD'],
+                capture_output=True,
+                text=True,
+                timeout=120,
+                cwd=_REPO_ROOT,
+                env=_git_env()
+            )
+
+            if pull_result.returncode != 0:
+                # Restore stash if we stashed
+                if stashed:
+                    subprocess.run(['git', 'stash', 'pop'], cwd=_REPO_ROOT, timeout=30)
+                return {
+                    'success': False,
+                    'error': 'Failed to pull updates',
+                    'details': pull_result.stderr
+                }
 
         # Restore stashed changes
         if stashed:
@@ -480,21 +860,21 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
                 capture_output=True,
                 text=True,
                 timeout=30,
-                cwd=repo_root
+                cwd=_REPO_ROOT
             )
             if stash_pop_result.returncode != 0:
                 logger.warning(f"Failed to restore stashed changes: {stash_pop_result.stderr}")
 
         # Check if requirements changed
         requirements_changed = False
-        if req_hash_before and os.path.exists(req_path):
-            with open(req_path, 'rb') as f:
-                import hashlib
-                req_hash_after = hashlib.md5(f.read()).hexdigest()
-                requirements_changed = req_hash_before != req_hash_after
+        if req_stat_before:
+            req_stat_after = _file_signature(req_path)
+            requirements_changed = (
+                req_stat_after is not None and req_stat_before != req_stat_after
+            )
 
         # Determine if update actually happened
-        if 'Already up to date' in pull_result.stdout:
+        if up_to_date:
             return {
                 'success': True,
                 'updated': False,
@@ -503,8 +883,12 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
             }
 
         # Clear update cache to reflect new version
-        set_setting(CACHE_KEY_LAST_CHECK, '')
-        set_setting(CACHE_KEY_LATEST_VERSION, '')
+        set_settings({
+            CACHE_KEY_LAST_CHECK: '',
+            CACHE_KEY_LAST_CHECK_ISO: '',
+            CACHE_KEY_LATEST_VERSION: '',
+        })
+        _memo_clear()
 
         return {
             'success': True,
@@ -531,6 +915,32 @@ def perform_update(stash_changes: bool = False) -> dict[str, Any]:
         }
 
 
+# app process globals cleared on restart, grouped by the lock guarding them
+_RESTART_CLEAR = (
+    ('process_lock', ('current_process',)),
+    ('sensor_lock', ('sensor_process',)),
+    ('wifi_lock', ('wifi_process',)),
+    ('adsb_lock', ('adsb_process',)),
+    ('ais_lock', ('ais_process',)),
+    ('acars_lock', ('acars_process',)),
+    ('aprs_lock', ('aprs_process', 'aprs_rtl_process')),
+    ('dsc_lock', ('dsc_process', 'dsc_rtl_process')),
+)
+
+
+@lru_cache(maxsize=1)
+def _load_restart_deps() -> tuple[Any, Any, Any]:
+    """
+    Import what restart_application() needs, once.
+
+    Imported lazily because app imports the routes that import this module.
+    """
+    import app as app_module
+    from utils.cleanup import cleanup_manager
+    from utils.process import cleanup_all_processes
+    return app_module, cleanup_manager, cleanup_all_processes
+
+
 def restart_application() -> dict[str, Any]:
     """
     Restart the application using os.execv to replace the current process.
@@ -543,9 +953,7 @@ def restart_application() -> dict[str, Any]:
     Returns:
         Dict with status (though this is typically not reached due to execv)
     """
-    import app as app_module
-    from utils.cleanup import cleanup_manager
-    from utils.process import cleanup_all_processes
+    app_module, cleanup_manager, cleanup_all_processes = _load_restart_deps()
 
     logger.info("Application restart requested")
 
@@ -554,25 +962,12 @@ def restart_application() -> dict[str, Any]:
         logger.info("Stopping all decoder processes...")
         cleanup_all_processes()
 
-        # Step 2: Clear global process state
-        with app_module.process_lock:
-            app_module.current_process = None
-        with app_module.sensor_lock:
-            app_module.sensor_process = None
-        with app_module.wifi_lock:
-            app_module.wifi_process = None
-        with app_module.adsb_lock:
-            app_module.adsb_process = None
-        with app_module.ais_lock:
-            app_module.ais_process = None
-        with app_module.acars_lock:
-            app_module.acars_process = None
-        with app_module.aprs_lock:
-            app_module.aprs_process = None
-            app_module.aprs_rtl_process = None
-        with app_module.dsc_lock:
-            app_module.dsc_process = None
-            app_module.dsc_rtl_process = None
+        # Step 2: Clear global process state. Kept even though execv replaces
+        # the process: if execv fails, nothing may point at killed processes
+        for lock_name, attrs in _RESTART_CLEAR:
+            with getattr(app_module, lock_name):
+                for attr in attrs:
+                    setattr(app_module, attr, None)
 
         # Step 3: Clear SDR device registry
         with app_module.sdr_device_registry_lock: